@@ -0,0 +1,107 @@
+"""Benchmark of the parallel vjp of a 500-vertex ``JaxPolySlab``, with the gradient fields shared
+with the workers through memory-mapped files and all edges integrated at once, against pickling
+the fields for each vertex and integrating one edge at a time. Each
+variant runs in a fresh interpreter to measure the peak resident memory of the parent and of the
+largest worker process.
+
+    python -m pytest -s tests/_test_local/_test_adjoint_shared_data.py
+"""
+import os
+import resource
+import subprocess
+import sys
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+import tidy3d as td
+from tidy3d.plugins.adjoint.components.geometry import JaxPolySlab
+
+NUM_VERTICES = 500
+NUM_PROC = 4
+# number of grid points of the gradient monitor along each dimension
+NUM_GRID = 80
+FREQ0 = 2e14
+
+
+def make_fields(name: str) -> td.FieldData:
+    """Random field data on a ``NUM_GRID ** 3`` grid."""
+    coords = {dim: np.linspace(-1, 1, NUM_GRID) for dim in "xyz"}
+    coords["f"] = [FREQ0]
+    rng = np.random.default_rng(0)
+    shape = (NUM_GRID, NUM_GRID, NUM_GRID, 1)
+    field_components = {
+        f"E{dim}": td.ScalarFieldDataArray(
+            rng.random(shape) + 1j * rng.random(shape), coords=coords
+        )
+        for dim in "xyz"
+    }
+    monitor = td.FieldMonitor(size=(2, 2, 2), freqs=[FREQ0], name=name, fields=["Ex", "Ey", "Ez"])
+    return td.FieldData(monitor=monitor, **field_components)
+
+
+def make_eps() -> td.PermittivityData:
+    """Uniform permittivity data on the same grid as the fields."""
+    fld = make_fields("eps")
+    components = {f"eps_{dim}{dim}": 0 * fld.Ex + 2.0 for dim in "xyz"}
+    monitor = td.PermittivityMonitor(size=(2, 2, 2), freqs=[FREQ0], name="eps")
+    return td.PermittivityData(monitor=monitor, **components)
+
+
+def make_polyslab() -> JaxPolySlab:
+    """Polygon approximating a circle with ``NUM_VERTICES`` vertices."""
+    phis = np.linspace(0, 2 * np.pi, NUM_VERTICES, endpoint=False)
+    vertices = tuple((0.5 * np.cos(phi), 0.5 * np.sin(phi)) for phi in phis)
+    return JaxPolySlab(vertices=vertices, slab_bounds=(-0.1, 0.1))
+
+
+def run(variant: str) -> None:
+    """Compute the vertex vjps with a given variant and print time and peak memory in MB."""
+    polyslab = make_polyslab()
+    e_mult_xyz, d_mult_xyz = polyslab.compute_dotted_e_d_fields(
+        grad_data_fwd=make_fields("fwd"), grad_data_adj=make_fields("adj"), grad_data_eps=make_eps()
+    )
+    args = (e_mult_xyz, d_mult_xyz, ((-2, -2, -2), (2, 2, 2)), 1.0, 1.0, 2.0)
+
+    t_start = time.perf_counter()
+    if variant == "pickled":
+        vertex_args = [(i, *args) for i in range(NUM_VERTICES)]
+        with Pool(NUM_PROC) as pool:
+            vertices_vjp = pool.starmap(polyslab.vertex_vjp, vertex_args)
+    else:
+        vertices_vjp = polyslab.store_vjp_parallel(*args, num_proc=NUM_PROC).vertices
+    wall_time = time.perf_counter() - t_start
+
+    # ru_maxrss is in kB on linux
+    rss_self = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    rss_workers = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    print(wall_time, rss_self, rss_workers, float(np.sum(np.abs(vertices_vjp))))
+
+
+def measure(variant: str) -> tuple:
+    """Run a variant in a fresh interpreter and parse its measurements."""
+    package_dir = os.path.dirname(os.path.dirname(td.__file__))
+    env = dict(os.environ, PYTHONPATH=package_dir)
+    output = subprocess.run(
+        [sys.executable, __file__, variant], capture_output=True, text=True, check=True, env=env
+    ).stdout
+    return tuple(float(val) for val in output.split()[-4:])
+
+
+def test_store_vjp_shared_data():
+    """Compare time and peak memory of pickled and shared fields."""
+    time_pickled, rss_pickled, rss_workers_pickled, vjp_pickled = measure("pickled")
+    time_shared, rss_shared, rss_workers_shared, vjp_shared = measure("shared")
+    assert np.isclose(vjp_pickled, vjp_shared)
+    print(
+        f"{NUM_VERTICES} vertices, {NUM_PROC} processes:\n"
+        f"  pickled: {time_pickled:.2f} s, peak RSS {rss_pickled:.0f} MB (parent), "
+        f"{rss_workers_pickled:.0f} MB (largest worker)\n"
+        f"  shared:  {time_shared:.2f} s, peak RSS {rss_shared:.0f} MB (parent), "
+        f"{rss_workers_shared:.0f} MB (largest worker)"
+    )
+
+
+if __name__ == "__main__":
+    run(sys.argv[1])
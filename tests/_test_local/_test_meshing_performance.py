@@ -0,0 +1,63 @@
+"""Benchmark of the automatic nonuniform meshing of simulations with many structures, as for
+structures imported from a GDS layout.
+
+    python -m pytest -s tests/_test_local/_test_meshing_performance.py
+"""
+import time
+
+import numpy as np
+import pytest
+
+import tidy3d as td
+
+# structures are placed on a square lattice with this pitch
+PITCH = 1.0
+
+
+def make_sim(num_structures: int) -> td.Simulation:
+    """Simulation with ``num_structures`` boxes of a few different media and sizes on a square
+    lattice in the xy plane, on top of a substrate."""
+    num_side = int(np.ceil(np.sqrt(num_structures)))
+    length = num_side * PITCH
+    centers = np.stack(np.meshgrid(*(np.arange(num_side) * PITCH,) * 2), axis=-1).reshape(-1, 2)
+    centers = centers[:num_structures] - (length - PITCH) / 2
+    media = [td.Medium(permittivity=eps) for eps in (4.0, 6.0, 12.0)]
+    rng = np.random.default_rng(0)
+    sizes = rng.uniform(0.2, 0.6, size=(num_structures, 2))
+    substrate = td.Structure(
+        geometry=td.Box(center=(0, 0, -1), size=(td.inf, td.inf, 2)), medium=media[0]
+    )
+    structures = [substrate] + [
+        td.Structure(
+            geometry=td.Box(center=(x, y, 0.11), size=(sx, sy, 0.22)),
+            medium=media[ind % len(media)],
+        )
+        for ind, ((x, y), (sx, sy)) in enumerate(zip(centers, sizes))
+    ]
+    return td.Simulation(
+        size=(length, length, 2),
+        grid_spec=td.GridSpec.auto(wavelength=1.55, min_steps_per_wvl=10),
+        structures=structures,
+        boundary_spec=td.BoundarySpec.all_sides(boundary=td.Periodic()),
+        run_time=1e-12,
+    )
+
+
+@pytest.mark.parametrize("num_structures", [100, 1_000, 10_000, 100_000])
+def test_meshing(num_structures):
+    """Time to make the grid of a simulation, as done in ``Simulation.grid``."""
+    sim = make_sim(num_structures)
+    structures = [td.Structure(geometry=sim.geometry, medium=sim.medium)] + list(sim.structures)
+
+    t_start = time.perf_counter()
+    grid = sim.grid_spec.make_grid(
+        structures=structures,
+        symmetry=sim.symmetry,
+        periodic=sim._periodic,
+        sources=sim.sources,
+        num_pml_layers=sim.num_pml_layers,
+    )
+    t_grid = time.perf_counter() - t_start
+    assert grid == sim.grid
+
+    print(f"{num_structures} structures: grid of {grid.num_cells} cells " f"made in {t_grid:.2f} s")
@@ -0,0 +1,125 @@
+"""Benchmark of the assembly of the derivative and PML matrices of the mode solver, built directly
+in sparse format from cached one dimensional operators, against assigning into CSR matrices and filling the PML profiles in
+loops at every call, as done before, and of the memory of the iterative solve, which inverts
+the shifted matrix with GMRES and an incomplete LU factorization instead of a full one.
+
+    python -m pytest -s tests/_test_local/_test_mode_solver_assembly.py
+"""
+import time
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+import scipy.sparse.linalg as spl
+
+import tidy3d as td
+from tidy3d.constants import C_0
+from tidy3d.plugins.mode import solver
+from tidy3d.plugins.mode.derivatives import create_sfactor
+from tidy3d.plugins.mode.solver import compute_modes
+
+
+def make_d_old(dls, num, pmc, forward):
+    """Previous 1D derivative, with the boundary assigned into the CSR matrix."""
+    diags = [-1, 1] if forward else [1, -1]
+    mat = sp.csr_matrix(sp.diags(diags, [0, 1] if forward else [0, -1], shape=(num, num)))
+    if forward:
+        if not pmc:
+            mat[0, 0] = 0.0
+    else:
+        mat[0, 0] = 2.0 if pmc else 0.0
+    return sp.diags(1 / dls).dot(mat)
+
+
+def pml_d_mats_old(shape, dl_f, dl_b, omega, num_pml):
+    """Previous assembly of the derivative matrices including the PML at every call."""
+    Nx, Ny = shape
+    dxf = sp.kron(make_d_old(dl_f[0], Nx, False, True), sp.eye(Ny))
+    dxb = sp.kron(make_d_old(dl_b[0], Nx, False, False), sp.eye(Ny))
+    dyf = sp.kron(sp.eye(Nx), make_d_old(dl_f[1], Ny, False, True))
+    dyb = sp.kron(sp.eye(Nx), make_d_old(dl_b[1], Ny, False, False))
+    s_mats = []
+    for direction, dls, num, n_pml, axis in (
+        ("f", dl_f[0], Nx, num_pml[0], 0),
+        ("b", dl_b[0], Nx, num_pml[0], 0),
+        ("f", dl_f[1], Ny, num_pml[1], 1),
+        ("b", dl_b[1], Ny, num_pml[1], 1),
+    ):
+        s_vec = create_sfactor(direction, omega, dls, num, n_pml, True)
+        s_2d = np.zeros(shape, dtype=np.complex128)
+        if axis == 0:
+            for i in range(Ny):
+                s_2d[:, i] = 1 / s_vec
+        else:
+            for i in range(Nx):
+                s_2d[i, :] = 1 / s_vec
+        s_mats.append(sp.spdiags(s_2d.flatten(), [0], Nx * Ny, Nx * Ny))
+    k0 = omega / C_0
+    return [s_mat.dot(d_mat) / k0 for s_mat, d_mat in zip(s_mats, (dxf, dxb, dyf, dyb))]
+
+
+@pytest.mark.parametrize("num", [300, 1000])
+def test_assembly(num):
+    """Compare the time of assembling the matrices as before, and from the one dimensional
+    operators, without and with them in the cache."""
+    dls = np.full(num, 0.01)
+    omega = 2 * np.pi * 2e14
+    args = ((num, num), (tuple(dls),) * 2, (tuple(dls),) * 2, (False, False), omega, (12, 12))
+
+    t_start = time.perf_counter()
+    ref = pml_d_mats_old((num, num), (dls, dls), (dls, dls), omega, (12, 12))
+    time_ref = time.perf_counter() - t_start
+
+    solver.d_mats_1d_cached.cache_clear()
+    t_start = time.perf_counter()
+    new = solver.pml_d_mats(*args, (True, True))
+    time_new = time.perf_counter() - t_start
+
+    # next frequency of a sweep
+    t_start = time.perf_counter()
+    solver.pml_d_mats(*args[:4], omega * 1.1, *args[5:], (True, True))
+    time_cached = time.perf_counter() - t_start
+
+    for mat_ref, mat_new in zip(ref, new):
+        assert abs(mat_ref - mat_new).max() < 1e-12 * abs(mat_ref).max()
+    print(
+        f"{num}x{num} assembly: previous {time_ref:.2f} s, direct sparse {time_new:.2f} s, "
+        f"next frequency {time_cached:.2f} s"
+    )
+
+
+def test_iterative_solve(monkeypatch):
+    """Compare the time and factor sizes of the direct and iterative solves."""
+    num = 200
+    eps_cross = np.ones((num, num))
+    eps_cross[80:120, 90:110] = 12.0
+    zeros = np.zeros_like(eps_cross)
+    eps_diag = [eps_cross, zeros, zeros, zeros, eps_cross, zeros, zeros, zeros, eps_cross]
+    coords = np.linspace(0, 4, num + 1)
+    mode_spec = td.ModeSpec(num_modes=4, precision="double", num_pml=(12, 12))
+    kwargs = dict(eps_cross=eps_diag, coords=[coords, coords], freq=2e14, mode_spec=mode_spec)
+
+    factor_nnz = []
+    for name in ("splu", "spilu"):
+        factorize = getattr(spl, name)
+
+        def spy(*args, factorize=factorize, **kw):
+            factor = factorize(*args, **kw)
+            factor_nnz.append(factor.L.nnz + factor.U.nnz)
+            return factor
+
+        monkeypatch.setattr(solver.spl, name, spy)
+
+    t_start = time.perf_counter()
+    _, n_direct, _ = compute_modes(**kwargs)
+    time_direct = time.perf_counter() - t_start
+
+    t_start = time.perf_counter()
+    _, n_iterative, _ = compute_modes(iterative_solve=True, **kwargs)
+    time_iterative = time.perf_counter() - t_start
+
+    assert np.allclose(n_direct, n_iterative, rtol=1e-8)
+    print(
+        f"{num}x{num} solve: direct {time_direct:.2f} s, LU nonzeros {factor_nnz[0]:.3e}; "
+        f"iterative {time_iterative:.2f} s, ILU nonzeros {factor_nnz[1]:.3e}"
+    )
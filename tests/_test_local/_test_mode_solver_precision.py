@@ -0,0 +1,76 @@
+"""Benchmark of the speed, memory and accuracy of the mode solver in single precision, where the
+permittivity, factorization, eigenvectors and fields are all in single precision, and in mixed
+precision, where the modes found in single precision are refined in double precision, against the
+double precision solver.
+
+    python -m pytest -s tests/_test_local/_test_mode_solver_precision.py
+"""
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+
+import tidy3d as td
+from tidy3d.plugins.mode import solver
+from tidy3d.plugins.mode.solver import compute_modes
+
+NUM_GRID = 200
+
+
+def solve(precision: str, mixed_precision: bool, monkeypatch) -> dict:
+    """Solve for the modes of a waveguide with the PML, recording the time, the peak memory of the
+    numpy arrays and the memory of the LU factors."""
+    eps_cross = np.ones((NUM_GRID, NUM_GRID))
+    eps_cross[80:120, 85:115] = 12.0
+    zeros = np.zeros_like(eps_cross)
+    eps_diag = [eps_cross, zeros, zeros, zeros, eps_cross, zeros, zeros, zeros, eps_cross]
+    coords = np.linspace(0, 4, NUM_GRID + 1)
+    mode_spec = td.ModeSpec(num_modes=4, precision=precision, num_pml=(12, 12))
+
+    factor_bytes = []
+    splu = solver.spl.splu
+
+    def splu_spy(*args, **kwargs):
+        lu = splu(*args, **kwargs)
+        factor_bytes.append(lu.nnz * args[0].dtype.itemsize)
+        return lu
+
+    monkeypatch.setattr(solver.spl, "splu", splu_spy)
+
+    tracemalloc.start()
+    t_start = time.perf_counter()
+    fields, n_complex, _ = compute_modes(
+        eps_cross=eps_diag,
+        coords=[coords, coords],
+        freq=2e14,
+        mode_spec=mode_spec,
+        mixed_precision=mixed_precision,
+    )
+    time_solve = time.perf_counter() - t_start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return dict(
+        time=time_solve,
+        peak=peak,
+        factor=factor_bytes[0],
+        n_complex=n_complex,
+        fields=fields,
+    )
+
+
+@pytest.mark.parametrize("precision, mixed_precision", [("single", False), ("single", True)])
+def test_precision(precision, mixed_precision, monkeypatch):
+    """Compare the time, memory and effective index with those of the double precision solver."""
+    ref = solve("double", False, monkeypatch)
+    new = solve(precision, mixed_precision, monkeypatch)
+    error = np.max(np.abs(new["n_complex"] - ref["n_complex"]) / np.abs(ref["n_complex"]))
+    name = "mixed" if mixed_precision else precision
+    print(
+        f"{NUM_GRID}x{NUM_GRID}: double {ref['time']:.2f} s, peak array memory "
+        f"{ref['peak'] / 2**20:.0f} MB, LU {ref['factor'] / 2**20:.0f} MB; {name} "
+        f"{new['time']:.2f} s, peak array memory {new['peak'] / 2**20:.0f} MB, "
+        f"LU {new['factor'] / 2**20:.0f} MB, fields {new['fields'].dtype}, "
+        f"max relative error of n_complex {error:.1e}"
+    )
+    assert error < (1e-5 if precision == "single" and not mixed_precision else 1e-10)
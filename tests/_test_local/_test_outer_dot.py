@@ -0,0 +1,94 @@
+"""Benchmark of ``ElectromagneticFieldData.outer_dot`` between mode solver data with many modes and
+frequencies, computed as batched products of the stacked field arrays, against looping over the
+frequencies and mode pairs with xarray, as done before.
+
+    python -m pytest -s tests/_test_local/_test_outer_dot.py
+"""
+import time
+
+import numpy as np
+import pytest
+import xarray as xr
+
+import tidy3d as td
+
+# number of grid points along each tangential dimension of the mode plane
+NUM_GRID = 40
+
+
+def make_mode_data(num_modes: int, num_freqs: int, seed: int) -> td.ModeSolverData:
+    """Mode solver data with random colocated fields on a uniform grid in the xy plane."""
+    freqs = np.linspace(1.5e14, 2.5e14, num_freqs)
+    monitor = td.ModeSolverMonitor(
+        size=(2, 2, 0),
+        freqs=freqs,
+        mode_spec=td.ModeSpec(num_modes=num_modes),
+        name="modes",
+        colocate=True,
+    )
+    sim = td.Simulation(
+        size=(2, 2, 2),
+        grid_spec=td.GridSpec.uniform(dl=2 / NUM_GRID),
+        run_time=1e-12,
+        monitors=[monitor],
+    )
+    grid = sim.discretize_monitor(monitor)
+    coords = dict(
+        x=grid.boundaries.x, y=grid.boundaries.y, z=[0.0], f=freqs, mode_index=np.arange(num_modes)
+    )
+    shape = tuple(len(val) for val in coords.values())
+    rng = np.random.default_rng(seed)
+    fields = {
+        comp: td.ScalarModeFieldDataArray(rng.random(shape) + 1j * rng.random(shape), coords=coords)
+        for comp in ("Ex", "Ey", "Ez", "Hx", "Hy", "Hz")
+    }
+    n_complex = td.ModeIndexDataArray(
+        np.ones((num_freqs, num_modes)), coords=dict(f=freqs, mode_index=np.arange(num_modes))
+    )
+    return td.ModeSolverData(
+        monitor=monitor, grid_expanded=grid, n_complex=n_complex, symmetry=(0, 0, 0), **fields
+    )
+
+
+def outer_dot_xarray(data_0: td.ModeSolverData, data_1: td.ModeSolverData) -> xr.DataArray:
+    """Previous implementation of ``outer_dot``, looping over frequencies and mode pairs."""
+    fields_self = {key: val.conj() for key, val in data_0._colocated_tangential_fields.items()}
+    fields_other = data_1._interpolated_tangential_fields(data_0._plane_grid_boundaries)
+    freqs = fields_self["Ex"].f.values
+    modes_0 = fields_self["Ex"].mode_index.values
+    modes_1 = fields_other["Ex"].mode_index.values
+    d_area = data_0._diff_area
+    dot = np.empty((freqs.size, modes_0.size, modes_1.size), dtype=complex)
+    for i, freq in enumerate(freqs):
+        for mi0 in modes_0:
+            sel_0 = dict(f=freq, mode_index=mi0)
+            e_x, e_y, h_x, h_y = (fields_self[c].sel(sel_0) for c in ("Ex", "Ey", "Hx", "Hy"))
+            for mi1 in modes_1:
+                sel_1 = dict(f=freq, mode_index=mi1)
+                o_ex, o_ey, o_hx, o_hy = (
+                    fields_other[c].sel(sel_1) for c in ("Ex", "Ey", "Hx", "Hy")
+                )
+                integrand = (e_x * o_hy - e_y * o_hx) - (h_x * o_ey - h_y * o_ex)
+                dot[i, mi0, mi1] = 0.25 * (integrand * d_area).sum(dim=d_area.dims)
+    return xr.DataArray(dot, coords=dict(f=freqs, mode_index_0=modes_0, mode_index_1=modes_1))
+
+
+@pytest.mark.parametrize("num_modes, num_freqs", [(5, 20), (20, 100)])
+def test_outer_dot(num_modes, num_freqs):
+    """Compare the time of the looped and vectorized overlaps."""
+    data_0 = make_mode_data(num_modes, num_freqs, seed=0)
+    data_1 = make_mode_data(num_modes, num_freqs, seed=1)
+
+    t_start = time.perf_counter()
+    ref = outer_dot_xarray(data_0, data_1)
+    time_ref = time.perf_counter() - t_start
+
+    t_start = time.perf_counter()
+    new = data_0.outer_dot(data_1)
+    time_new = time.perf_counter() - t_start
+
+    assert np.allclose(new, ref, rtol=0, atol=1e-12 * float(np.max(np.abs(ref))))
+    print(
+        f"{num_modes} modes, {num_freqs} frequencies: xarray loop {time_ref:.2f} s, "
+        f"vectorized {time_new:.2f} s, speedup {time_ref / time_new:.0f}x"
+    )
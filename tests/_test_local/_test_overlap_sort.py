@@ -0,0 +1,128 @@
+"""Benchmark of ``ModeSolverData.overlap_sort`` on a sweep over many frequencies, with the overlaps
+between neighboring frequencies computed at once on the field arrays, against selecting the data
+at each frequency and each unsorted mode and computing their dot products, as done before.
+
+    python -m pytest -s tests/_test_local/_test_overlap_sort.py
+"""
+import time
+
+import numpy as np
+import pytest
+
+import tidy3d as td
+from tidy3d.components.data.data_array import FreqModeDataArray
+
+# number of grid points along each tangential dimension of the mode plane
+NUM_GRID = 40
+NUM_MODES = 10
+
+
+def make_mode_data(num_freqs: int) -> td.ModeSolverData:
+    """Mode solver data in the xy plane with random mode profiles that vary slightly with
+    frequency, and are randomly permuted at each frequency."""
+    freqs = np.linspace(1.5e14, 2.5e14, num_freqs)
+    monitor = td.ModeSolverMonitor(
+        size=(2, 2, 0),
+        freqs=freqs,
+        mode_spec=td.ModeSpec(num_modes=NUM_MODES),
+        name="modes",
+        colocate=True,
+    )
+    sim = td.Simulation(
+        size=(2, 2, 2),
+        grid_spec=td.GridSpec.uniform(dl=2 / NUM_GRID),
+        run_time=1e-12,
+        monitors=[monitor],
+    )
+    grid = sim.discretize_monitor(monitor)
+    coords = dict(
+        x=grid.boundaries.x, y=grid.boundaries.y, z=[0.0], f=freqs, mode_index=np.arange(NUM_MODES)
+    )
+    rng = np.random.default_rng(0)
+    num_x, num_y = len(coords["x"]), len(coords["y"])
+    profiles = rng.standard_normal((2, num_x, num_y, 1, 1, NUM_MODES))
+    drift = 1 + 0.01 * np.linspace(0, 1, num_freqs)[None, None, None, :, None]
+    e_x, e_y = profiles[0] * drift, profiles[1] * drift**2
+    e_x, e_y = e_x + 0j, e_y + 0j
+    fields = dict(Ex=e_x, Ey=e_y, Ez=0 * e_x, Hx=-e_y, Hy=e_x, Hz=0 * e_x)
+
+    permutations = np.array([rng.permutation(NUM_MODES) for _ in freqs])
+    permutations[num_freqs // 2] = np.arange(NUM_MODES)
+    fields = {
+        comp: td.ScalarModeFieldDataArray(
+            np.take_along_axis(values, permutations[None, None, None], axis=-1), coords=coords
+        )
+        for comp, values in fields.items()
+    }
+    mode_coords = dict(f=freqs, mode_index=np.arange(NUM_MODES))
+    ones = np.ones((num_freqs, NUM_MODES))
+    data = td.ModeSolverData(
+        monitor=monitor,
+        grid_expanded=grid,
+        n_complex=td.ModeIndexDataArray(ones, coords=mode_coords),
+        grid_primal_correction=FreqModeDataArray(ones, coords=mode_coords),
+        grid_dual_correction=FreqModeDataArray(ones, coords=mode_coords),
+        symmetry=(0, 0, 0),
+        **fields,
+    )
+    # keep the fields at the boundaries of the plane grid, where they are colocated
+    bounds_x, bounds_y = data._plane_grid_boundaries
+    fields = {comp: field.sel(x=bounds_x, y=bounds_y) for comp, field in fields.items()}
+    data = data.updated_copy(**fields)
+
+    # normalize the modes
+    scaling = np.sqrt(np.abs(data.dot(data)))
+    return data.updated_copy(**{comp: field / scaling for comp, field in fields.items()})
+
+
+def overlap_sort_models(data: td.ModeSolverData, overlap_thresh: float = 0.9):
+    """Previous implementation of ``overlap_sort`` from the central frequency, selecting the data
+    at each frequency and each unsorted mode and computing their dot products."""
+    num_freqs, num_modes = data.n_complex.shape
+    f0_ind = num_freqs // 2
+    sorting = -np.ones((num_freqs, num_modes), dtype=int)
+    phase = np.zeros((num_freqs, num_modes))
+    sorting[f0_ind, :] = np.arange(num_modes)
+    for step, last_ind in zip([-1, 1], [-1, num_freqs]):
+        data_template = data._isel(f=[f0_ind])
+        for freq_id in range(f0_ind + step, last_ind, step):
+            data_to_sort = data._isel(f=[freq_id])
+            pairs = np.arange(num_modes)
+            complex_amps = data_template.dot(data_to_sort).data.ravel()
+            modes_to_sort = np.where(np.abs(complex_amps) < overlap_thresh)[0]
+            if len(modes_to_sort) > 1:
+                amps_reduced = np.zeros((len(modes_to_sort),) * 2, dtype=complex)
+                template_reduced = data_template._isel(mode_index=modes_to_sort)
+                for i, mode_index in enumerate(modes_to_sort):
+                    one_mode = data_to_sort._isel(mode_index=[mode_index])
+                    amps_reduced[:, i] = template_reduced.dot(one_mode).data.ravel()
+                pairs_reduced, amps_reduced = data._find_closest_pairs(amps_reduced)
+                complex_amps[modes_to_sort] = amps_reduced
+                pairs[modes_to_sort] = modes_to_sort[pairs_reduced]
+            sorting[freq_id, :] = pairs[sorting[freq_id - step, :]]
+            phase[freq_id, :] = phase[freq_id - step, :] + np.angle(
+                complex_amps[sorting[freq_id - step, :]]
+            )
+            data_template = data_to_sort
+    return data._reorder_modes(sorting=sorting, phase=phase, track_freq="central")
+
+
+@pytest.mark.parametrize("num_freqs", [20, 200])
+def test_overlap_sort(num_freqs):
+    """Compare the time of sorting with per-frequency models and with the batched overlaps."""
+    data = make_mode_data(num_freqs)
+
+    t_start = time.perf_counter()
+    ref = overlap_sort_models(data)
+    time_ref = time.perf_counter() - t_start
+
+    t_start = time.perf_counter()
+    new = data.overlap_sort(track_freq="central")
+    time_new = time.perf_counter() - t_start
+
+    for comp, field in ref.field_components.items():
+        assert np.allclose(field, new.field_components[comp])
+    print(
+        f"{NUM_MODES} modes, {num_freqs} frequencies: per-frequency models {time_ref:.2f} s, "
+        f"batched overlaps {time_new:.2f} s, speedup {time_ref / time_new:.0f}x"
+    )
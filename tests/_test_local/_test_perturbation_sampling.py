@@ -0,0 +1,88 @@
+"""Benchmark of ``ParameterPerturbation.apply_data`` with custom heat and charge perturbations,
+sampled in chunks with interpolation tables, against sampling them with xarray interpolation and
+summing the full-size results, as done before.
+
+    python -m pytest -s tests/_test_local/_test_perturbation_sampling.py
+"""
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+import xarray as xr
+
+import tidy3d as td
+
+# number of points of the temperature and charge maps, increase to 10**8 with enough memory
+NUM_POINTS = [10**6, 10**7]
+
+
+def make_perturbation() -> td.ParameterPerturbation:
+    """Custom heat and charge perturbations, with complex values."""
+    rng = np.random.default_rng(0)
+    heat_values = td.HeatDataArray(
+        rng.random(50) + 1j * rng.random(50), coords=dict(T=np.linspace(200, 500, 50))
+    )
+    charge_values = td.ChargeDataArray(
+        rng.random((40, 30)) * 1e-3,
+        coords=dict(n=np.logspace(15, 20, 40), p=np.logspace(15, 20, 30)),
+    )
+    return td.ParameterPerturbation(
+        heat=td.CustomHeatPerturbation(perturbation_values=heat_values),
+        charge=td.CustomChargePerturbation(perturbation_values=charge_values),
+    )
+
+
+def make_fields(num_points: int) -> tuple:
+    """Temperature, electron and hole density maps on a cubic grid."""
+    num_side = int(round(num_points ** (1 / 3)))
+    coords = {dim: np.linspace(-1, 1, num_side) for dim in "xyz"}
+    rng = np.random.default_rng(1)
+    shape = (num_side,) * 3
+    temperature = td.SpatialDataArray(rng.uniform(250, 450, shape), coords=coords)
+    electron_density = td.SpatialDataArray(10 ** rng.uniform(16, 19, shape), coords=coords)
+    hole_density = td.SpatialDataArray(10 ** rng.uniform(16, 19, shape), coords=coords)
+    return temperature, electron_density, hole_density
+
+
+def apply_data_xarray(perturbation, temperature, electron_density, hole_density):
+    """Previous implementation of ``apply_data``, interpolating with xarray."""
+    heat, charge = perturbation.heat, perturbation.charge
+    result = xr.zeros_like(temperature)
+    t_range = heat.temperature_range
+    temperature_clip = np.clip(temperature, t_range[0], t_range[1])
+    heat_data = heat.perturbation_values.interp(T=temperature_clip, method=heat.interp_method)
+    result = result + td.SpatialDataArray(heat_data.drop_vars("T"))
+    e_clip = np.clip(electron_density, charge.electron_range[0], charge.electron_range[1])
+    h_clip = np.clip(hole_density, charge.hole_range[0], charge.hole_range[1])
+    charge_data = charge.perturbation_values.interp(n=e_clip, p=h_clip, method=charge.interp_method)
+    return result + td.SpatialDataArray(charge_data.drop_vars(["n", "p"]))
+
+
+def measure(func, *args, **kwargs) -> tuple:
+    """Run a function and return its result, wall time and peak of allocated memory in MB."""
+    tracemalloc.start()
+    t_start = time.perf_counter()
+    result = func(*args, **kwargs)
+    wall_time = time.perf_counter() - t_start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, wall_time, peak / 2**20
+
+
+@pytest.mark.parametrize("num_points", NUM_POINTS)
+def test_apply_data(num_points):
+    """Compare time and peak memory of the xarray and chunked sampling."""
+    perturbation = make_perturbation()
+    fields = make_fields(num_points)
+
+    ref, time_ref, mem_ref = measure(apply_data_xarray, perturbation, *fields)
+    new, time_new, mem_new = measure(perturbation.apply_data, *fields)
+    new_threads, time_threads, _ = measure(perturbation.apply_data, *fields, num_workers=4)
+
+    assert np.allclose(new, ref, rtol=1e-12, atol=0)
+    assert np.array_equal(new, new_threads)
+    print(
+        f"{fields[0].size:.1e} points: xarray {time_ref:.2f} s, {mem_ref:.0f} MB; "
+        f"chunked {time_new:.2f} s, {mem_new:.0f} MB; 4 threads {time_threads:.2f} s"
+    )
@@ -0,0 +1,142 @@
+"""Benchmark of ``ComponentModeler._construct_smatrix`` for a device with many multi-mode ports and
+frequencies, with the mode amplitudes of each task read once into a dense array and the element
+mappings applied as index maps, against reading the amplitudes, computing the normalization and
+writing through ``.loc`` for each matrix element, as done before.
+
+    python -m pytest -s tests/_test_local/_test_smatrix_construct.py
+"""
+import time
+
+import numpy as np
+import pytest
+
+import tidy3d as td
+from tidy3d.plugins.smatrix.smatrix import ComponentModeler, Port, SMatrixDataArray
+
+NUM_MODES = 3
+
+
+def make_modeler(num_ports: int, num_freqs: int) -> ComponentModeler:
+    """Component modeler with ports spread along the two x sides of a box, with element mappings
+    including chains where a mapped element is the source of a later mapping."""
+    sim = td.Simulation(
+        size=(10, num_ports + 2, 2),
+        grid_spec=td.GridSpec.uniform(dl=0.1),
+        run_time=1e-12,
+        boundary_spec=td.BoundarySpec.all_sides(boundary=td.PML()),
+    )
+    ports = [
+        Port(
+            center=(-4 if ind % 2 == 0 else 4, ind // 2 * 2 - num_ports / 2 + 1, 0),
+            size=(0, 1, 1),
+            mode_spec=td.ModeSpec(num_modes=NUM_MODES),
+            direction="+" if ind % 2 == 0 else "-",
+            name=f"port_{ind}",
+        )
+        for ind in range(num_ports)
+    ]
+    element_mappings = []
+    for ind in range(0, num_ports - 2, 2):
+        for mode_index in range(NUM_MODES):
+            element_0 = ((f"port_{ind + 1}", mode_index), (f"port_{ind}", 0))
+            element_1 = ((f"port_{ind + 3}", mode_index), (f"port_{ind + 2}", 0))
+            element_2 = ((f"port_{ind + 2}", mode_index), (f"port_{ind + 3}", 0))
+            element_mappings.append((element_0, element_1, 1j))
+            element_mappings.append((element_1, element_2, -1))
+    return ComponentModeler(
+        simulation=sim,
+        ports=ports,
+        freqs=np.linspace(1.5e14, 2.5e14, num_freqs),
+        element_mappings=element_mappings,
+    )
+
+
+def make_batch_data(modeler: ComponentModeler) -> dict:
+    """Simulation data with random mode amplitudes for each task."""
+    rng = np.random.default_rng(0)
+    batch_data = {}
+    for task_name, sim in modeler.sim_dict.items():
+        data = []
+        for monitor in sim.monitors:
+            coords = dict(
+                direction=["+", "-"],
+                f=list(monitor.freqs),
+                mode_index=np.arange(monitor.mode_spec.num_modes),
+            )
+            shape = tuple(len(val) for val in coords.values())
+            amps = td.ModeAmpsDataArray(rng.random(shape) + 1j * rng.random(shape), coords=coords)
+            coords_n = dict(f=coords["f"], mode_index=coords["mode_index"])
+            n_complex = td.ModeIndexDataArray(np.ones(shape[1:]), coords=coords_n)
+            data.append(td.ModeData(monitor=monitor, amps=amps, n_complex=n_complex))
+        batch_data[task_name] = td.SimulationData(simulation=sim, data=data)
+    return batch_data
+
+
+def construct_smatrix_loop(modeler: ComponentModeler, batch_data: dict) -> SMatrixDataArray:
+    """Previous implementation of ``_construct_smatrix``, looping over the matrix elements."""
+    max_mode_index_out, max_mode_index_in = modeler.max_mode_index
+    port_names_out, port_names_in = modeler.port_names
+    coords = dict(
+        port_out=port_names_out,
+        port_in=port_names_in,
+        mode_index_out=range(max_mode_index_out + 1),
+        mode_index_in=range(max_mode_index_in + 1),
+        f=np.array(modeler.freqs),
+    )
+    shape = tuple(len(val) for val in coords.values())
+    s_matrix = SMatrixDataArray(np.zeros(shape, dtype=complex), coords=coords)
+    for port_name_in, mode_index_in in modeler.matrix_indices_run_sim:
+        port_in = modeler.get_port_by_name(port_name=port_name_in)
+        sim_data = batch_data[modeler._task_name(port=port_in, mode_index=mode_index_in)]
+        for port_name_out, mode_index_out in modeler.matrix_indices_monitor:
+            port_out = modeler.get_port_by_name(port_name=port_name_out)
+            mode_amps_data = sim_data[port_out.name].copy().amps
+            dir_out = "-" if port_out.direction == "+" else "+"
+            amp = mode_amps_data.sel(f=coords["f"], direction=dir_out, mode_index=mode_index_out)
+            source_norm = (
+                sim_data[port_in.name]
+                .amps.sel(f=coords["f"], direction=port_in.direction, mode_index=mode_index_in)
+                .values
+            )
+            s_matrix.loc[
+                dict(
+                    port_in=port_name_in,
+                    mode_index_in=mode_index_in,
+                    port_out=port_name_out,
+                    mode_index_out=mode_index_out,
+                )
+            ] = np.array(amp.data) / np.array(source_norm)
+    for (row_in, col_in), (row_out, col_out), mult_by in modeler.element_mappings:
+        coords_from = dict(
+            port_out=row_in[0], mode_index_out=row_in[1], port_in=col_in[0], mode_index_in=col_in[1]
+        )
+        coords_to = dict(
+            port_out=row_out[0],
+            mode_index_out=row_out[1],
+            port_in=col_out[0],
+            mode_index_in=col_out[1],
+        )
+        s_matrix.loc[coords_to] = mult_by * s_matrix.loc[coords_from].values
+    return s_matrix
+
+
+@pytest.mark.parametrize("num_ports, num_freqs", [(4, 20), (16, 200)])
+def test_construct_smatrix(num_ports, num_freqs):
+    """Compare the time of the element-wise and vectorized construction of the S matrix."""
+    modeler = make_modeler(num_ports, num_freqs)
+    batch_data = make_batch_data(modeler)
+
+    t_start = time.perf_counter()
+    ref = construct_smatrix_loop(modeler, batch_data)
+    time_ref = time.perf_counter() - t_start
+
+    t_start = time.perf_counter()
+    new = modeler._construct_smatrix(batch_data)
+    time_new = time.perf_counter() - t_start
+
+    assert new.dims == ref.dims
+    assert np.array_equal(new.values, ref.values)
+    print(
+        f"{num_ports} ports, {NUM_MODES} modes, {num_freqs} frequencies: element loop "
+        f"{time_ref:.2f} s, vectorized {time_new:.2f} s, speedup {time_ref / time_new:.0f}x"
+    )
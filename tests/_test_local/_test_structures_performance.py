@@ -0,0 +1,93 @@
+"""Benchmark of the structure bounds index used by ``Simulation.epsilon_on_grid`` and
+``Simulation._filter_structures_plane`` against a plain linear scan over all structures.
+
+    python -m pytest -s tests/_test_local/_test_structures_performance.py
+"""
+import time
+
+import numpy as np
+import pytest
+
+import tidy3d as td
+from tidy3d.components.grid.grid import Coords
+
+# structures are placed on a square lattice with this pitch
+PITCH = 1.0
+
+
+def make_sim(num_structures: int) -> td.Simulation:
+    """Simulation with ``num_structures`` small boxes on a square lattice in the xy plane."""
+    num_side = int(np.ceil(np.sqrt(num_structures)))
+    length = num_side * PITCH
+    centers = np.stack(np.meshgrid(*(np.arange(num_side) * PITCH,) * 2), axis=-1).reshape(-1, 2)
+    centers = centers[:num_structures] - (length - PITCH) / 2
+    medium = td.Medium(permittivity=4.0)
+    structures = [
+        td.Structure(geometry=td.Box(center=(x, y, 0), size=(0.5, 0.5, 0.5)), medium=medium)
+        for x, y in centers
+    ]
+    return td.Simulation(
+        size=(length, length, 2),
+        grid_spec=td.GridSpec.uniform(dl=0.1),
+        structures=structures,
+        run_time=1e-12,
+    )
+
+
+def epsilon_linear_scan(sim: td.Simulation, coords: Coords) -> np.ndarray:
+    """Permittivity on ``coords`` visiting every structure, as done without a bounds index."""
+    arrays = (np.array(coords.x), np.array(coords.y), np.array(coords.z))
+    eps_array = np.ones(tuple(len(arr) for arr in arrays), dtype=complex)
+    for structure in sim.volumetric_structures:
+        inds = structure.geometry._inds_inside_bounds(*arrays)
+        coords_reduced = tuple(arr[ind] for arr, ind in zip(arrays, inds))
+        if any(arr.size == 0 for arr in coords_reduced):
+            continue
+        red_coords = Coords(**dict(zip("xyz", coords_reduced)))
+        eps_structure = np.mean(structure.eps_diagonal(None, red_coords), axis=0)
+        is_inside = structure.geometry.inside_meshgrid(*coords_reduced)
+        eps_array[inds][is_inside] = (eps_structure * is_inside)[is_inside]
+    return eps_array
+
+
+@pytest.mark.parametrize("num_structures", [100, 1_000, 10_000])
+def test_epsilon_on_grid_block(num_structures):
+    """Permittivity on a small block of the simulation grid."""
+    sim = make_sim(num_structures)
+    grid = td.Grid(boundaries=Coords(**{dim: np.linspace(-2, 2, 41) for dim in "xyz"}))
+    _ = sim.volumetric_structures
+
+    t_start = time.perf_counter()
+    eps_linear = epsilon_linear_scan(sim, grid.centers)
+    t_linear = time.perf_counter() - t_start
+
+    t_start = time.perf_counter()
+    eps_indexed = sim.epsilon_on_grid(grid=grid).values
+    t_indexed = time.perf_counter() - t_start
+
+    assert np.allclose(eps_linear, eps_indexed)
+    print(
+        f"epsilon_on_grid, {num_structures} structures: linear {t_linear:.3f}s, "
+        f"indexed {t_indexed:.3f}s, speedup {t_linear / t_indexed:.1f}x"
+    )
+
+
+@pytest.mark.parametrize("num_structures", [100, 1_000, 10_000])
+def test_filter_structures_plane(num_structures):
+    """Structures merged on a small plane region."""
+    sim = make_sim(num_structures)
+    plane = td.Box(center=(0, 0, 0), size=(4, 4, 0))
+
+    t_start = time.perf_counter()
+    num_linear = sum(len(plane.intersections_with(s.geometry)) for s in sim.structures)
+    t_linear = time.perf_counter() - t_start
+
+    t_start = time.perf_counter()
+    shapes = td.Simulation._filter_structures_plane(sim.structures, plane)
+    t_indexed = time.perf_counter() - t_start
+
+    assert len(shapes) <= num_linear
+    print(
+        f"_filter_structures_plane, {num_structures} structures: linear {t_linear:.3f}s, "
+        f"indexed {t_indexed:.3f}s, speedup {t_linear / t_indexed:.1f}x"
+    )
@@ -0,0 +1,61 @@
+"""Benchmark of ``updated_copy`` on a simulation with many structures, sharing the unchanged
+structures and running only the validators depending on the updated fields, against the full copy
+and validation of the whole simulation.
+
+    python -m pytest -s tests/_test_local/_test_updated_copy_performance.py
+"""
+import time
+
+import numpy as np
+import pytest
+
+import tidy3d as td
+
+# structures are placed on a square lattice with this pitch
+PITCH = 1.0
+
+
+def make_sim(num_structures: int) -> td.Simulation:
+    """Simulation with ``num_structures`` small boxes on a square lattice in the xy plane."""
+    num_side = int(np.ceil(np.sqrt(num_structures)))
+    length = num_side * PITCH
+    centers = np.stack(np.meshgrid(*(np.arange(num_side) * PITCH,) * 2), axis=-1).reshape(-1, 2)
+    centers = centers[:num_structures] - (length - PITCH) / 2
+    medium = td.Medium(permittivity=4.0)
+    structures = [
+        td.Structure(geometry=td.Box(center=(x, y, 0), size=(0.5, 0.5, 0.5)), medium=medium)
+        for x, y in centers
+    ]
+    return td.Simulation(
+        size=(length, length, 2),
+        grid_spec=td.GridSpec.uniform(dl=0.1),
+        structures=structures,
+        boundary_spec=td.BoundarySpec.all_sides(boundary=td.Periodic()),
+        run_time=1e-12,
+    )
+
+
+@pytest.mark.parametrize("num_structures", [100, 1_000, 10_000])
+def test_updated_copy(num_structures):
+    """Update the run time of a simulation a few times in a row."""
+    sim = make_sim(num_structures)
+    num_copies = 5
+
+    t_start = time.perf_counter()
+    sim_deep = sim
+    for i in range(num_copies):
+        sim_deep = sim_deep.copy(update=dict(run_time=(i + 2) * 1e-12), deep=True)
+    t_deep = (time.perf_counter() - t_start) / num_copies
+
+    t_start = time.perf_counter()
+    sim_new = sim
+    for i in range(num_copies):
+        sim_new = sim_new.updated_copy(run_time=(i + 2) * 1e-12)
+    t_new = (time.perf_counter() - t_start) / num_copies
+
+    assert sim_new == sim_deep
+    assert all(new is old for new, old in zip(sim_new.structures, sim.structures))
+    print(
+        f"{num_structures} structures: full copy {t_deep * 1e3:.2f} ms, "
+        f"updated copy {t_new * 1e3:.2f} ms per copy, speedup {t_deep / t_new:.1f}x"
+    )
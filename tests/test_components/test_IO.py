@@ -30,7 +30,7 @@ def set_datasets_to_none(sim):
             src["current_dataset"] = None
         if src["source_time"]["type"] == "CustomSourceTime":
             src["source_time"]["source_time_dataset"] = None
-    for structure in sim_dict["structures"]:
+    for structure, sim_structure in zip(sim_dict["structures"], sim.structures):
         if structure["geometry"]["type"] == "TriangleMesh":
             structure["geometry"]["mesh_dataset"] = None
         if structure["geometry"]["type"] == "GeometryGroup":
@@ -38,12 +38,9 @@ def set_datasets_to_none(sim):
                 if geometry["type"] == "TriangleMesh":
                     geometry["mesh_dataset"] = None
         if "Custom" in structure["medium"]["type"]:
-            if structure["medium"]["type"] == "CustomMedium":
-                structure["medium"]["eps_dataset"] = None
-            elif structure["medium"]["type"] == "CustomPoleResidue":
-                structure["medium"]["poles"] = []
-            else:
-                structure["medium"]["coeffs"] = []
+            # custom media are loaded from json as vacuum placeholders without their data
+            medium = sim_structure.medium
+            structure["medium"] = type(medium).parse_raw(medium.json()).dict()
     return td.Simulation.parse_obj(sim_dict)
 
 
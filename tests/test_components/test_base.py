@@ -1,6 +1,7 @@
 """Tests the base model."""
 import pytest
 import numpy as np
+import pydantic.v1 as pydantic
 
 import tidy3d as td
 from tidy3d.components.base import Tidy3dBaseModel
@@ -35,6 +36,32 @@ def test_comparisons():
     M == M2
 
 
+def test_structural_hash():
+    """Hash and equality follow the field values, including the values of data arrays."""
+    coords = dict(x=[-1.0, 1.0], y=[0.0], z=[0.0])
+    eps = td.SpatialDataArray(2 + np.arange(2).reshape(2, 1, 1), coords=coords)
+    medium = td.CustomMedium(permittivity=eps)
+    medium_same = td.CustomMedium(permittivity=eps.copy(deep=True))
+    medium_diff = td.CustomMedium(permittivity=eps + 1)
+    assert medium == medium_same and hash(medium) == hash(medium_same)
+    assert medium != medium_diff and hash(medium) != hash(medium_diff)
+    assert len({medium, medium_same, medium_diff}) == 2
+    assert M != "not a model"
+
+    # numbers compare by value, as in json
+    assert td.Box(size=(1, 1, 1)) == td.Box(size=(1.0, 1.0, 1.0))
+    assert td.Medium(permittivity=2) == td.Medium(permittivity=2.0)
+    poly = td.PolySlab(vertices=[(0, 0), (1, 0), (1, 1)], slab_bounds=(0, 1))
+    assert poly == td.PolySlab(
+        vertices=np.array(poly.vertices, dtype=np.float32), slab_bounds=(0, 1)
+    )
+
+    # the digest of sub-models is cached
+    structure = td.Structure(geometry=td.Box(size=(1, 1, 1)), medium=medium)
+    assert hash(structure) == hash(structure.updated_copy(medium=medium_same))
+    assert structure.medium._cached_properties["_hash_digest"] == medium._hash_digest
+
+
 def _test_version(tmp_path):
     """ensure there's a version in simulation"""
 
@@ -115,3 +142,43 @@ def test_updated_copy():
     assert s2.medium == m2
     s3 = s.updated_copy(**{"medium": m2, "geometry": b2})
     assert s3 == s2
+
+
+def test_updated_copy_revalidation():
+    """Updated copies share unchanged sub-components and run the validators depending on the
+    updated fields."""
+    structures = [
+        td.Structure(geometry=td.Box(center=(i * 0.1, 0, 0), size=(0.05, 0.5, 0.5)), medium=M)
+        for i in range(5)
+    ]
+    source = td.PointDipole(
+        center=(0, 0, 0), source_time=td.GaussianPulse(freq0=2e14, fwidth=1e13), polarization="Ex"
+    )
+    sim = td.Simulation(
+        size=(2, 2, 2),
+        grid_spec=td.GridSpec.uniform(dl=0.1),
+        structures=structures,
+        sources=[source],
+        run_time=1e-12,
+    )
+
+    sim2 = sim.updated_copy(run_time=2e-12)
+    assert all(s2 is s for s2, s in zip(sim2.structures, sim.structures))
+    assert sim2.grid_spec is sim.grid_spec
+    assert sim2 == sim.copy(update=dict(run_time=2e-12), deep=True)
+
+    # chained copies reuse the dependencies recorded by the previous copy
+    sim3 = sim2.updated_copy(sources=[source.updated_copy(center=(0.5, 0, 0))])
+    assert sim3.sources[0].center == (0.5, 0, 0)
+    assert sim3.structures is sim2.structures
+    assert sim3 == td.Simulation.parse_raw(sim3.json())
+
+    # validators reading the updated fields are run again
+    with pytest.raises(pydantic.ValidationError):
+        sim3.updated_copy(size=(0.5, 0.5, 0.5))
+    with pytest.raises(pydantic.ValidationError):
+        sim3.updated_copy(sources=[source.updated_copy(center=(5, 0, 0))])
+    with pytest.raises(pydantic.ValidationError):
+        sim3.updated_copy(run_time=-1)
+    with pytest.raises(pydantic.ValidationError):
+        sim3.updated_copy(not_a_field=1)
@@ -311,7 +311,14 @@ def test_proj_clientside():
     far_fields_angular.power
     for key, val in far_fields_angular.field_components.items():
         val.sel(f=f0)
-    far_fields_angular.renormalize_fields(proj_distance=5e6)
+    values_before = {
+        key: val.values.copy() for key, val in far_fields_angular.field_components.items()
+    }
+    renormalized = far_fields_angular.renormalize_fields(proj_distance=5e6)
+    # the original data is left unchanged
+    for key, val in far_fields_angular.field_components.items():
+        assert np.array_equal(val.values, values_before[key])
+        assert not np.shares_memory(val.values, renormalized.field_components[key].values)
 
     far_fields_cartesian.x
     far_fields_cartesian.y
@@ -346,3 +353,242 @@ def test_proj_clientside():
         val.sel(f=f0)
     with pytest.raises(DataError):
         exact_fields_cartesian.renormalize_fields(proj_distance=5e6)
+
+
+@pytest.mark.parametrize("chunk_size", [8, td.components.field_projection.FAR_FIELD_CHUNK_SIZE])
+def test_far_fields_for_surface_batched(monkeypatch, chunk_size):
+    """Batched far field integration must match a direct per-angle trapezoidal integration."""
+    monkeypatch.setattr(td.components.field_projection, "FAR_FIELD_CHUNK_SIZE", chunk_size)
+
+    f0 = 1
+    monitor = td.FieldMonitor(size=(0, 2, 3), freqs=[f0], name="near_field")
+    sim = td.Simulation(
+        size=(5, 5, 5),
+        grid_spec=td.GridSpec.auto(wavelength=td.C_0 / f0),
+        monitors=[monitor],
+        run_time=1e-12,
+    )
+    coords = dict(x=[0.0], y=np.linspace(-1, 1, 7), z=np.linspace(-1.5, 1.5, 9), f=[f0])
+    fields = {
+        name: td.ScalarFieldDataArray(
+            np.random.random((1, 7, 9, 1)) + 1j * np.random.random((1, 7, 9, 1)), coords=coords
+        )
+        for name in ("Ex", "Ey", "Ez", "Hx", "Hy", "Hz")
+    }
+    data = td.FieldData(monitor=monitor, grid_expanded=sim.discretize_monitor(monitor), **fields)
+    sim_data = td.SimulationData(simulation=sim, data=(data,))
+    proj = td.FieldProjector(
+        sim_data=sim_data,
+        surfaces=[td.FieldProjectionSurface(monitor=monitor, normal_dir="+")],
+        pts_per_wavelength=None,
+    )
+    surface = proj.surfaces[0]
+    currents = proj.currents[monitor.name]
+
+    theta = np.linspace(0.1, np.pi, 4)
+    phi = np.linspace(0, 2 * np.pi, 5)
+    _, e_theta, e_phi, _, h_theta, h_phi = proj._far_fields_for_surface(
+        f0, theta, phi, surface, currents
+    )
+
+    # direct evaluation of the radiation vectors for each angle
+    k = td.FieldProjectionAngleData.wavenumber(medium=proj.medium, frequency=f0)
+    x, y, z = (currents[dim].values for dim in "xyz")
+    currents_f = currents.sel(f=f0)
+    eta = td.ETA_0 / np.sqrt(proj.medium.eps_model(f0))
+    for i, th in enumerate(theta):
+        for j, ph in enumerate(phi):
+            phase = np.exp(
+                -1j
+                * k
+                * (
+                    x[0] * np.sin(th) * np.cos(ph)
+                    + y[:, None] * np.sin(th) * np.sin(ph)
+                    + z[None, :] * np.cos(th)
+                )
+            )
+            J_y, J_z, M_y, M_z = (
+                np.trapz(np.trapz(np.squeeze(currents_f[name].values) * phase, y, axis=0), z)
+                for name in ("Ey", "Ez", "Hy", "Hz")
+            )
+            n_theta = J_y * np.cos(th) * np.sin(ph) - J_z * np.sin(th)
+            n_phi = J_y * np.cos(ph)
+            l_theta = M_y * np.cos(th) * np.sin(ph) - M_z * np.sin(th)
+            l_phi = M_y * np.cos(ph)
+            assert np.isclose(e_theta[i, j], -(l_phi + eta * n_theta))
+            assert np.isclose(e_phi[i, j], l_theta - eta * n_phi)
+            assert np.isclose(h_theta[i, j], -e_phi[i, j] / eta)
+            assert np.isclose(h_phi[i, j], e_theta[i, j] / eta)
+
+
+def fields_for_surface_exact_per_point(proj, x, y, z, surface):
+    """Exact projection of the currents of ``surface`` to a single observation point, as done
+    point by point before the observation points were batched."""
+    currents = proj.currents[surface.monitor.name]
+    freqs = np.array(proj.frequencies)
+    i_omega = 1j * 2.0 * np.pi * freqs[None, None, None, :]
+    wavenumber = td.FieldProjectionAngleData.wavenumber(frequency=freqs, medium=proj.medium)
+    wavenumber = wavenumber[None, None, None, :]
+    epsilon = td.constants.EPSILON_0 * proj.medium.eps_model(frequency=freqs)[None, None, None, :]
+    mu_0 = td.constants.MU_0
+
+    pts = [currents[name].values for name in ["x", "y", "z"]]
+    x_new, y_new, z_new = (pt_obs - pt_src for pt_src, pt_obs in zip(pts, [x, y, z]))
+
+    idx_w, (idx_u, idx_v) = surface.monitor.pop_axis((0, 1, 2), axis=surface.axis)
+    _, (cmp_1, cmp_2) = surface.monitor.pop_axis(("x", "y", "z"), axis=surface.axis)
+    J = [np.atleast_1d(0)] * 3
+    M = [np.atleast_1d(0)] * 3
+    J[idx_u] = currents[f"E{cmp_1}"].values
+    J[idx_v] = currents[f"E{cmp_2}"].values
+    J[idx_w] = np.zeros_like(J[idx_u])
+    M[idx_u] = currents[f"H{cmp_1}"].values
+    M[idx_v] = currents[f"H{cmp_2}"].values
+    M[idx_w] = np.zeros_like(M[idx_u])
+
+    r, theta_obs, phi_obs = surface.monitor.car_2_sph(
+        x_new[:, None, None, None], y_new[None, :, None, None], z_new[None, None, :, None]
+    )
+    sin_theta, cos_theta = np.sin(theta_obs), np.cos(theta_obs)
+    sin_phi, cos_phi = np.sin(phi_obs), np.cos(phi_obs)
+
+    ikr = 1j * wavenumber * r
+    G = np.exp(ikr) / (4.0 * np.pi * r)
+    dG_dr = G * (ikr - 1.0) / r
+    d2G_dr2 = dG_dr * (ikr - 1.0) / r + G / (r**2)
+
+    def potential_terms(current, const):
+        r_x_c = [
+            sin_theta * sin_phi * current[2] - cos_theta * current[1],
+            cos_theta * current[0] - sin_theta * cos_phi * current[2],
+            sin_theta * cos_phi * current[1] - sin_theta * sin_phi * current[0],
+        ]
+        r_dot_c = (
+            sin_theta * cos_phi * current[0]
+            + sin_theta * sin_phi * current[1]
+            + cos_theta * current[2]
+        )
+        r_dot_c_dtheta = (
+            cos_theta * cos_phi * current[0]
+            + cos_theta * sin_phi * current[1]
+            - sin_theta * current[2]
+        )
+        r_dot_c_dphi = -sin_phi * current[0] + cos_phi * current[1]
+        grad_div_pot = surface.monitor.sph_2_car_field(
+            d2G_dr2 * r_dot_c,
+            dG_dr * r_dot_c_dtheta / r,
+            dG_dr * r_dot_c_dphi / r,
+            theta_obs,
+            phi_obs,
+        )
+        pot = [const * item * G for item in current]
+        curl_pot = [const * item * dG_dr for item in r_x_c]
+        return pot, curl_pot, [const * item for item in grad_div_pot]
+
+    A, curl_A, grad_div_A = potential_terms(J, mu_0)
+    F, curl_F, grad_div_F = potential_terms(M, epsilon)
+    e_integrands = [
+        i_omega * (a + grad_div_a / (wavenumber**2)) - curl_f / epsilon
+        for a, grad_div_a, curl_f in zip(A, grad_div_A, curl_F)
+    ]
+    h_integrands = [
+        i_omega * (f + grad_div_f / (wavenumber**2)) + curl_a / mu_0
+        for f, grad_div_f, curl_a in zip(F, grad_div_F, curl_A)
+    ]
+    e_fields = [proj.integrate_2d(e, 1.0, pts[idx_u], pts[idx_v]) for e in e_integrands]
+    h_fields = [proj.integrate_2d(h, 1.0, pts[idx_u], pts[idx_v]) for h in h_integrands]
+
+    _, theta_obs, phi_obs = surface.monitor.car_2_sph(x, y, z)
+    e_sph = surface.monitor.car_2_sph_field(*e_fields, theta_obs, phi_obs)
+    h_sph = surface.monitor.car_2_sph_field(*h_fields, theta_obs, phi_obs)
+    return [*e_sph, *h_sph]
+
+
+def test_exact_projection_batches(monkeypatch):
+    """Exact projections must not depend on the batching of observation points or on the
+    number of processes the batches are distributed over."""
+    f0 = 1
+    monitor = td.FieldMonitor(size=(2, 2, 0), freqs=[f0], name="near_field")
+    sim = td.Simulation(
+        size=(5, 5, 5),
+        grid_spec=td.GridSpec.auto(wavelength=td.C_0 / f0),
+        monitors=[monitor],
+        run_time=1e-12,
+    )
+    coords = dict(x=np.linspace(-1, 1, 6), y=np.linspace(-1, 1, 5), z=[0.0], f=[f0])
+    fields = {
+        name: td.ScalarFieldDataArray(
+            np.random.random((6, 5, 1, 1)) + 1j * np.random.random((6, 5, 1, 1)), coords=coords
+        )
+        for name in ("Ex", "Ey", "Ez", "Hx", "Hy", "Hz")
+    }
+    data = td.FieldData(monitor=monitor, grid_expanded=sim.discretize_monitor(monitor), **fields)
+    sim_data = td.SimulationData(simulation=sim, data=(data,))
+    proj = td.FieldProjector.from_near_field_monitors(
+        sim_data=sim_data, near_monitors=[monitor], normal_dirs=["+"], pts_per_wavelength=None
+    )
+
+    _, _, _, exact_cart_monitor = make_proj_monitors((0, 0, 0), (2, 2, 0), [f0])
+    exact_angle_monitor = td.FieldProjectionAngleMonitor(
+        size=(td.inf, td.inf, td.inf),
+        freqs=[f0],
+        name="exact_angle",
+        theta=np.linspace(0, np.pi, 4),
+        phi=np.linspace(0, 2 * np.pi, 3),
+        proj_distance=3,
+        far_field_approx=False,
+    )
+    exact_kspace_monitor = td.FieldProjectionKSpaceMonitor(
+        size=(td.inf, td.inf, td.inf),
+        freqs=[f0],
+        name="exact_kspace",
+        ux=np.linspace(-0.5, 0.5, 3),
+        uy=np.linspace(-0.5, 0.5, 4),
+        proj_axis=1,
+        proj_distance=3,
+        far_field_approx=False,
+    )
+
+    for proj_monitor in (exact_cart_monitor, exact_angle_monitor, exact_kspace_monitor):
+        fields_single_batch = proj.project_fields(proj_monitor)
+        with monkeypatch.context() as m:
+            m.setattr(td.components.field_projection, "EXACT_PROJECTION_CHUNK_SIZE", 1)
+            fields_batched = proj.project_fields(proj_monitor, num_proc=2)
+        for name, field in fields_single_batch.field_components.items():
+            assert np.allclose(field.values, fields_batched.field_components[name].values)
+
+    # compare with the projection done one observation point at a time
+    points = {}
+    for i, _x in enumerate(exact_cart_monitor.x):
+        for j, _y in enumerate(exact_cart_monitor.y):
+            index = exact_cart_monitor.unpop_axis(0, (i, j), axis=exact_cart_monitor.proj_axis)
+            points[(exact_cart_monitor, index)] = exact_cart_monitor.unpop_axis(
+                exact_cart_monitor.proj_distance, (_x, _y), axis=exact_cart_monitor.proj_axis
+            )
+    for i, theta in enumerate(exact_angle_monitor.theta):
+        for j, phi in enumerate(exact_angle_monitor.phi):
+            points[(exact_angle_monitor, (0, i, j))] = exact_angle_monitor.sph_2_car(
+                exact_angle_monitor.proj_distance, theta, phi
+            )
+    for i, ux in enumerate(exact_kspace_monitor.ux):
+        for j, uy in enumerate(exact_kspace_monitor.uy):
+            theta, phi = exact_kspace_monitor.kspace_2_sph(ux, uy, exact_kspace_monitor.proj_axis)
+            points[(exact_kspace_monitor, (i, j, 0))] = exact_kspace_monitor.sph_2_car(
+                exact_kspace_monitor.proj_distance, theta, phi
+            )
+
+    projected = {}
+    for (proj_monitor, index), (x, y, z) in points.items():
+        if proj_monitor.name not in projected:
+            projected[proj_monitor.name] = proj.project_fields(proj_monitor).field_components
+        fields_ref = np.sum(
+            [
+                fields_for_surface_exact_per_point(proj, x, y, z, surface)
+                for surface in proj.surfaces
+            ],
+            axis=0,
+        )
+        field_names = ("Er", "Etheta", "Ephi", "Hr", "Htheta", "Hphi")
+        for name, field_ref in zip(field_names, fields_ref):
+            field = projected[proj_monitor.name][name].values[index]
+            assert np.allclose(field, field_ref)
@@ -91,6 +91,16 @@ def test_base_inside_meshgrid():
         _ = td.Geometry.inside_meshgrid(GEO, [[0, 0]], [[0, 0]], [[0, 0]])
 
 
+@pytest.mark.parametrize("component", [UNION, INTERSECTION, DIFFERENCE, SPHERE])
+def test_base_inside_pointwise(component):
+    """Batched ``Geometry.inside`` must agree with a point-by-point shapely check."""
+    coords = np.meshgrid(*(np.linspace(-1.2, 1.2, 9),) * 3, indexing="ij")
+    inside = td.Geometry.inside(component, *coords)
+    for x, y, z, val in zip(*map(np.ravel, coords), inside.ravel()):
+        shapes = component.intersections_plane(z=z)
+        assert val == any(shape.contains(shapely.Point(x, y)) for shape in shapes)
+
+
 def test_bounding_box():
     assert GEO.bounding_box == GEO
     assert GEO_INF.bounding_box == GEO_INF
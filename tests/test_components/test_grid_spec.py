@@ -159,3 +159,52 @@ def test_autogrid_2dmaterials():
     # Commented until inplane AutoGrid for 2D materials is enabled
     # with pytest.raises(ValidationError):
     #    _ = sim.grid
+
+
+def test_grid_cache():
+    """Simulations only differing in sources or monitors share the grid from the grid cache."""
+    from tidy3d.components.grid.cache import GRID_CACHE, DEFAULT_GRID_CACHE_SIZE
+
+    GRID_CACHE.cache_clear()
+    src = td.PointDipole(
+        source_time=td.GaussianPulse(freq0=2e14, fwidth=1e13),
+        polarization="Ex",
+    )
+    sim = td.Simulation(
+        size=(4, 4, 4),
+        structures=[
+            td.Structure(geometry=td.Box(size=(1, 1, 1)), medium=td.Medium(permittivity=4))
+        ],
+        sources=[src],
+        grid_spec=td.GridSpec.auto(),
+        run_time=1e-12,
+    )
+    assert GRID_CACHE.cache_info().misses == 1
+
+    # same wavelength from the sources, different source position and monitors
+    sim2 = sim.updated_copy(
+        sources=[src.updated_copy(center=(0.5, 0, 0))],
+        monitors=[td.FluxMonitor(size=(1, 1, 0), freqs=[2e14], name="flux")],
+    )
+    assert sim2.grid is sim.grid
+    assert GRID_CACHE.cache_info().hits == 1
+
+    # the shared grid can not be modified in place
+    with pytest.raises(ValueError):
+        sim2.grid.boundaries.x[0] = 99
+    assert sim.grid.boundaries.x[0] != 99
+
+    # a different wavelength from the sources changes the grid
+    sim3 = sim.updated_copy(
+        sources=[src.updated_copy(source_time=src.source_time.updated_copy(freq0=3e14))]
+    )
+    assert sim3.grid != sim.grid
+    assert GRID_CACHE.cache_info().misses == 2
+
+    # the cache is bounded and can be disabled
+    td.config.grid_cache_size = 1
+    assert GRID_CACHE.cache_info().currsize == 1
+    td.config.grid_cache_size = 0
+    assert sim.updated_copy(run_time=2e-12).grid == sim.grid
+    assert GRID_CACHE.cache_info().currsize == 0
+    td.config.grid_cache_size = DEFAULT_GRID_CACHE_SIZE
@@ -2,6 +2,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
 import pytest
+import xarray as xr
 import pydantic.v1 as pydantic
 import tidy3d as td
 
@@ -362,3 +363,159 @@ def test_parameter_perturbation():
     # array with mismatching coords
     with pytest.raises(ValueError):
         _ = param_perturb.apply_data(temperature2, electron_density, hole_density)
+
+
+def interp_xarray(values, interp_method, **points):
+    """Perturbation values interpolated with xarray at points clipped to the sampled range, with
+    the sample coordinates sorted. Points given as numpy arrays are meshed, as in ``sample``."""
+    values = values.sortby(list(points))
+    clipped = {}
+    for dim, val in points.items():
+        if isinstance(val, np.ndarray):
+            val = xr.DataArray(val, dims=f"{dim}_point")
+        clipped[dim] = np.clip(val, values.coords[dim][0].item(), values.coords[dim][-1].item())
+    return values.interp(**clipped, method=interp_method).drop_vars(list(points))
+
+
+@pytest.mark.parametrize("log_scale", [False, True])
+def test_interp_axis_search(monkeypatch, log_scale):
+    """Lookup tables locate points as ``np.searchsorted`` does, including at grid points and
+    midpoints, outside of the grid, and when falling back to a binary search."""
+    rng = np.random.default_rng(0)
+    if log_scale:
+        grid = np.sort(np.logspace(15, 20, 30) * rng.uniform(0.9, 1.1, 30))
+    else:
+        grid = np.sort(rng.uniform(200, 500, 30))
+    axis = td.components.parameter_perturbation._InterpAxis(grid)
+    assert axis._lookups["grid"][0] == log_scale
+
+    points = np.concatenate(
+        [grid, axis.midpoints, rng.uniform(grid[0], grid[-1], 1000), [grid[0] / 2, grid[-1] * 2]]
+    )
+    for name in ("grid", "midpoints"):
+        for side in ("left", "right"):
+            expected = np.searchsorted(getattr(axis, name), points, side=side)
+            assert np.array_equal(axis._search(name, points, side=side), expected)
+
+    # grid too fine for a lookup table
+    monkeypatch.setattr(td.components.parameter_perturbation._InterpAxis, "MAX_LOOKUP_SIZE", 2)
+    axis = td.components.parameter_perturbation._InterpAxis(grid)
+    assert axis._lookups["grid"] is None
+    expected = np.searchsorted(grid, points, side="right")
+    assert np.array_equal(axis._search("grid", points, side="right"), expected)
+
+
+@pytest.mark.parametrize("interp_method", ["linear", "nearest"])
+def test_custom_perturbation_interp(interp_method):
+    """Custom perturbations match xarray interpolation at unsorted sample coordinates, at the
+    sample points and their midpoints, and out of range, and are nan at nan inputs."""
+    rng = np.random.default_rng(1)
+
+    temperatures = rng.permutation(np.linspace(200, 500, 7))
+    heat_values = td.HeatDataArray(rng.random(7) + 1j * rng.random(7), coords=dict(T=temperatures))
+    heat = td.CustomHeatPerturbation(perturbation_values=heat_values, interp_method=interp_method)
+    t_sorted = np.sort(temperatures)
+    temperature = np.concatenate(
+        [t_sorted, (t_sorted[1:] + t_sorted[:-1]) / 2, rng.uniform(150, 550, 100)]
+    )
+    expected = interp_xarray(heat_values, interp_method, T=temperature)
+    assert np.allclose(heat.sample(temperature), expected.values)
+    assert np.all(np.isnan(heat.sample(np.array([300, np.nan]))) == [False, True])
+
+    electron_densities = rng.permutation(np.logspace(15, 20, 6))
+    hole_densities = rng.permutation(np.logspace(15, 20, 5))
+    charge_values = td.ChargeDataArray(
+        rng.random((6, 5)), coords=dict(n=electron_densities, p=hole_densities)
+    )
+    charge = td.CustomChargePerturbation(
+        perturbation_values=charge_values, interp_method=interp_method
+    )
+    n_sorted = np.sort(electron_densities)
+    p_sorted = np.sort(hole_densities)
+    electron_density = np.concatenate(
+        [n_sorted, (n_sorted[1:] + n_sorted[:-1]) / 2, 10 ** rng.uniform(14, 21, 100)]
+    )
+    hole_density = np.concatenate(
+        [p_sorted, (p_sorted[1:] + p_sorted[:-1]) / 2, 10 ** rng.uniform(14, 21, 102)]
+    )
+    expected = interp_xarray(charge_values, interp_method, n=electron_density, p=hole_density)
+    assert np.allclose(charge.sample(electron_density, hole_density), expected.values)
+    sampled = charge.sample(np.array([1e16, np.nan]), np.array([1e16, np.nan]))
+    assert np.all(np.isnan(sampled) == [[False, True], [True, True]])
+
+
+@pytest.mark.parametrize("interp_method", ["linear", "nearest"])
+def test_custom_perturbation_single_sample(interp_method):
+    """A single sample point along an axis gives a constant along that axis."""
+    heat = td.CustomHeatPerturbation(
+        perturbation_values=td.HeatDataArray([0.1 + 0.2j], coords=dict(T=[300])),
+        interp_method=interp_method,
+    )
+    assert np.allclose(heat.sample(np.array([250, 300, 350])), 0.1 + 0.2j)
+
+    charge_values = td.ChargeDataArray(
+        [[0.1, 0.3, 0.2]], coords=dict(n=[1e17], p=[1e16, 1e18, 1e17])
+    )
+    charge = td.CustomChargePerturbation(
+        perturbation_values=charge_values, interp_method=interp_method
+    )
+    electron_density = np.array([1e15, 1e17, 1e19, 1e17])
+    hole_density = np.array([1e15, 2e16, 5e17, 1e19])
+    expected = interp_xarray(charge_values.isel(n=0), interp_method, p=hole_density)
+    expected = np.broadcast_to(expected.values, (len(electron_density), len(hole_density)))
+    assert np.allclose(charge.sample(electron_density, hole_density), expected)
+
+
+@pytest.mark.parametrize("num_workers", [1, 3])
+def test_apply_data_in_chunks(monkeypatch, num_workers):
+    """Fields larger than the chunk size, sampled over several threads, match the sum of the
+    heat and charge perturbations interpolated with xarray."""
+    monkeypatch.setattr(td.components.parameter_perturbation, "PERTURBATION_CHUNK_SIZE", 7)
+
+    rng = np.random.default_rng(2)
+    heat_values = td.HeatDataArray(
+        rng.random(10) + 1j * rng.random(10), coords=dict(T=np.linspace(200, 500, 10))
+    )
+    charge_values = td.ChargeDataArray(
+        rng.random((8, 6)), coords=dict(n=np.logspace(15, 20, 8), p=np.logspace(15, 20, 6))
+    )
+    perturbation = td.ParameterPerturbation(
+        heat=td.CustomHeatPerturbation(perturbation_values=heat_values),
+        charge=td.CustomChargePerturbation(perturbation_values=charge_values),
+    )
+
+    coords = dict(x=np.linspace(0, 1, 5), y=np.linspace(0, 1, 6), z=np.linspace(0, 1, 4))
+    shape = (5, 6, 4)
+    temperature = td.SpatialDataArray(rng.uniform(250, 450, shape), coords=coords)
+    electron_density = td.SpatialDataArray(10 ** rng.uniform(16, 19, shape), coords=coords)
+    hole_density = td.SpatialDataArray(10 ** rng.uniform(16, 19, shape), coords=coords)
+    temperature[0, 0, 0] = np.nan
+
+    sampled = perturbation.apply_data(
+        temperature, electron_density, hole_density, num_workers=num_workers
+    )
+    expected = interp_xarray(heat_values, "linear", T=temperature) + interp_xarray(
+        charge_values, "linear", n=electron_density, p=hole_density
+    )
+    assert sampled.dims == temperature.dims
+    assert np.allclose(sampled.values, expected.transpose(*sampled.dims).values, equal_nan=True)
+    assert np.isnan(sampled.values[0, 0, 0])
+
+    # charge only, without hole density
+    sampled = perturbation.apply_data(electron_density=electron_density, num_workers=num_workers)
+    expected = interp_xarray(
+        charge_values, "linear", n=electron_density, p=xr.zeros_like(electron_density)
+    )
+    assert np.allclose(sampled.values, expected.transpose(*sampled.dims).values)
+
+
+def test_sample_in_chunks(monkeypatch):
+    """Chunked sums broadcast constant samplers and handle partial and empty chunks."""
+    monkeypatch.setattr(td.components.parameter_perturbation, "PERTURBATION_CHUNK_SIZE", 4)
+    sample_in_chunks = td.ParameterPerturbation._sample_in_chunks
+    values = np.arange(11) * (1 + 1j)
+    samplers = [lambda chunk: values[chunk], lambda chunk: 2.0]
+    for num_workers in (1, 3):
+        result = sample_in_chunks(samplers, size=11, num_workers=num_workers)
+        assert np.array_equal(result, values + 2)
+    assert sample_in_chunks(samplers, size=0).shape == (0,)
@@ -730,6 +730,33 @@ def test_filter_structures():
     SIM._filter_structures_plane(structures=[s1, s2], plane=plane)
 
 
+def test_structures_bounds_index():
+    structures = [
+        td.Structure(geometry=td.Box(size=(1, 1, 1), center=(x, 0, 0)), medium=td.Medium())
+        for x in range(-3, 4)
+    ]
+    structure_bounds = SIM._structures_bounds(structures)
+    assert structure_bounds.shape == (7, 2, 3)
+    assert SIM._structures_bounds([]).shape == (0, 2, 3)
+
+    # bounds intersection is inclusive and keeps the structure order
+    inds = SIM._inds_intersecting_bounds(structure_bounds, ((-1.5, -1, -1), (0.5, 1, 1)))
+    assert np.all(inds == [1, 2, 3, 4])
+
+    # plane intersections only account for the structures touching the plane
+    plane = td.Box(center=(0.5, 0, 0), size=(0, td.inf, td.inf))
+    assert SIM.intersecting_structures(plane, structures) == structures[3:5]
+    assert len(SIM._filter_structures_plane(structures, plane)) == 1
+
+    # permittivity on a grid that only overlaps some of the structures
+    sim = SIM.updated_copy(
+        size=(8, 1, 1),
+        structures=[s.updated_copy(medium=td.Medium(permittivity=2)) for s in structures],
+    )
+    grid = td.Grid(boundaries=td.Coords(x=[0.6, 0.8, 1.0], y=[-0.1, 0.1], z=[-0.1, 0.1]))
+    assert np.allclose(sim.epsilon_on_grid(grid).values, 2.0)
+
+
 def test_get_structure_plot_params():
     pp = SIM_FULL._get_structure_plot_params(mat_index=0, medium=SIM_FULL.medium)
     assert pp.facecolor == "white"
@@ -1962,3 +1989,53 @@ def test_perturbed_mediums_copy():
 
     assert isinstance(new_sim.medium, td.CustomMedium)
     assert isinstance(new_sim.structures[0].medium, td.CustomPoleResidue)
+
+
+def test_perturbed_mediums_copies():
+    """Batch application of heat snapshots matches applying them one at a time."""
+
+    pp_real = td.ParameterPerturbation(
+        heat=td.LinearHeatPerturbation(
+            coeff=-0.01,
+            temperature_ref=300,
+            temperature_range=(200, 500),
+        ),
+    )
+    pmed = td.PerturbationMedium(permittivity=3, permittivity_perturbation=pp_real)
+    struct_pert = td.Structure(geometry=td.Box(center=(0.2, 0, 0), size=(0.4, 1, 1)), medium=pmed)
+    struct = td.Structure(geometry=td.Box(size=(0.2, 0.2, 0.2)), medium=td.Medium(permittivity=2))
+
+    sim = td.Simulation(
+        size=(1, 1, 1),
+        run_time=1e-12,
+        medium=pmed,
+        grid_spec=td.GridSpec.uniform(dl=0.1),
+        structures=[struct_pert, struct],
+    )
+
+    coords = dict(x=np.linspace(-1, 1, 11), y=[-1, 1], z=[-1, 1])
+    temperatures = [
+        td.SpatialDataArray(300 + 10 * i * np.random.random((11, 2, 2)), coords=coords)
+        for i in range(3)
+    ]
+    new_sims = sim.perturbed_mediums_copies(temperature=temperatures)
+
+    assert len(new_sims) == len(temperatures)
+    for new_sim, temperature in zip(new_sims, temperatures):
+        assert new_sim == sim.perturbed_mediums_copy(temperature=temperature)
+        assert new_sim.structures[1] is struct
+
+    with pytest.raises(SetupError):
+        sim.perturbed_mediums_copies()
+
+    with pytest.raises(SetupError):
+        sim.perturbed_mediums_copies(temperature=temperatures, hole_density=temperatures[:2])
+
+    other_coords = dict(x=np.linspace(-1, 1, 5), y=[-1, 1], z=[-1, 1])
+    with pytest.raises(SetupError):
+        sim.perturbed_mediums_copies(
+            temperature=[
+                temperatures[0],
+                td.SpatialDataArray(300 * np.ones((5, 2, 2)), coords=other_coords),
+            ]
+        )
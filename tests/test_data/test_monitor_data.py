@@ -439,6 +439,16 @@ def test_field_data_symmetry_present():
         )
 
 
+def test_symmetry_expanded_copy_not_shared():
+    """Writing into the arrays of a symmetry expanded copy leaves the source data unchanged."""
+    for symmetry in (True, False):
+        data = make_field_data(symmetry=symmetry)
+        values_before = data.Ex.values.copy()
+        data_copy = data.symmetry_expanded_copy
+        data_copy.Ex.values[:] = 0
+        assert np.array_equal(data.Ex.values, values_before)
+
+
 def test_data_array_attrs():
     """Note, this is here because the attrs only get set when added to a pydantic model."""
     data = make_flux_data()
@@ -529,3 +539,8 @@ def test_outer_dot():
     _ = field_data.outer_dot(mode_data)
     _ = mode_data.outer_dot(field_data)
     _ = field_data.outer_dot(field_data)
+
+    # the overlaps of a mode with itself are the dot products
+    mode_overlaps = mode_data.outer_dot(mode_data)
+    mode_dots = mode_data.dot(mode_data).transpose("f", "mode_index")
+    assert np.allclose(np.diagonal(mode_overlaps.values, axis1=1, axis2=2), mode_dots.values)
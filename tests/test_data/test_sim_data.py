@@ -3,12 +3,14 @@ import pytest
 import numpy as np
 import matplotlib.pyplot as plt
 import pydantic.v1 as pydantic
+import dask.array
+import h5py
 
 import tidy3d as td
-from tidy3d.exceptions import DataError, Tidy3dKeyError
+from tidy3d.exceptions import DataError, FileError, Tidy3dKeyError
 
 from tidy3d.components.data.sim_data import SimulationData
-from tidy3d.components.data.data_array import ScalarFieldTimeDataArray
+from tidy3d.components.data.data_array import ScalarFieldTimeDataArray, DATA_ARRAY_VALUE_NAME
 from tidy3d.components.data.monitor_data import FieldTimeData
 from tidy3d.components.monitor import FieldMonitor, FieldTimeMonitor, ModeSolverMonitor
 
@@ -267,6 +269,84 @@ def test_to_hdf5(tmp_path):
     assert sim_data == sim_data2
 
 
+def test_to_hdf5_lazy(tmp_path):
+    """Lazily loaded data is only read when accessed and equals the eagerly loaded data."""
+    sim_data = make_sim_data()
+    FNAME = str(tmp_path / "sim_data_lazy.hdf5")
+    sim_data.to_file(fname=FNAME)
+    sim_data_lazy = SimulationData.from_file(fname=FNAME, lazy=True)
+    assert isinstance(sim_data_lazy.monitor_data["field"].Ex.data, dask.array.Array)
+    assert isinstance(sim_data_lazy["field"].Ex.data, np.ndarray)
+    for monitor_data in sim_data.data:
+        name = monitor_data.monitor.name
+        assert sim_data_lazy[name] == sim_data[name]
+
+    # select a region and frequencies of a field monitor
+    field_data = sim_data["field"]
+    bounds = ((-1, -1, -1), (0.5, 0.5, 0.5))
+    freqs = field_data.Ex.f.values[:1]
+    field_region = sim_data_lazy.load_field_monitor("field", bounds=bounds, freqs=freqs)
+    assert isinstance(field_region.Ex.data, np.ndarray)
+    assert field_region.Ex.f.size == 1
+    assert field_region.Ex.x.size < field_data.Ex.x.size
+    region_coords = {dim: field_region.Ex.coords[dim] for dim in "xyzf"}
+    assert np.all(field_region.Ex.values == field_data.Ex.sel(region_coords).values)
+    with pytest.raises(DataError):
+        sim_data_lazy.load_field_monitor("field_time", freqs=freqs)
+
+
+@pytest.mark.parametrize(
+    "compression, num_workers", [("gzip", 1), ("gzip", 4), ("lzf", 1), (None, 1)]
+)
+def test_to_hdf5_compression(tmp_path, compression, num_workers):
+    """Data written with chunking and compression, including lazily loaded data, loads back."""
+    sim_data = make_sim_data()
+    FNAME = str(tmp_path / "sim_data_compressed.hdf5")
+    chunks = dict(x=2, f=1)
+    sim_data.to_hdf5(fname=FNAME, chunks=chunks, compression=compression, num_workers=num_workers)
+    assert SimulationData.from_file(fname=FNAME) == sim_data
+
+    with h5py.File(FNAME, "r") as f_handle:
+        dataset = f_handle["data/0/Ex/" + DATA_ARRAY_VALUE_NAME]
+        assert dataset.compression == compression
+        assert dataset.chunks[0] == 2
+
+    # lazily loaded data is written block by block
+    sim_data_lazy = SimulationData.from_file(fname=FNAME, lazy=True)
+    FNAME_LAZY = str(tmp_path / "sim_data_lazy.hdf5")
+    sim_data_lazy.to_hdf5(fname=FNAME_LAZY, compression=compression)
+    assert SimulationData.from_file(fname=FNAME_LAZY) == sim_data
+
+    # invalid options are rejected before the existing file is overwritten
+    invalid_options = (
+        dict(compression="zip"),
+        dict(compression="lzf", compression_opts=4),
+        dict(compression="gzip", compression_opts=10),
+        dict(chunks=dict(x=0)),
+        dict(chunks=(2, 1)),
+    )
+    for options in invalid_options:
+        with pytest.raises(FileError):
+            sim_data.to_hdf5(fname=FNAME, **options)
+    assert SimulationData.from_file(fname=FNAME) == sim_data
+
+
+def test_to_hdf5_custom_encoders(tmp_path):
+    """Custom encoders receive the values of the model dict, with sub-models as dicts."""
+    sim_data = make_sim_data()
+    values = {}
+
+    def encoder(fname, group_path, value):
+        values[group_path] = value
+
+    FNAME = str(tmp_path / "sim_data_encoded.hdf5")
+    sim_data.to_hdf5(fname=FNAME, custom_encoders=[encoder])
+    assert isinstance(values["/simulation"], dict)
+    assert isinstance(values["/data/0"], dict)
+    assert isinstance(values["/data/0/Ex"], td.ScalarFieldDataArray)
+    assert SimulationData.from_file(fname=FNAME) == sim_data
+
+
 def test_from_hdf5_group_path(tmp_path):
     """Tests that individual monitor data can be loaded from a SimulationData hdf5."""
 
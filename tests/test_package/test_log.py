@@ -1,13 +1,15 @@
 """Test the logging."""
 
 import pytest
+import io
 import json
 
 import pydantic.v1 as pd
 import numpy as np
+from rich.console import Console
 import tidy3d as td
 from tidy3d.exceptions import Tidy3dError
-from tidy3d.log import DEFAULT_LEVEL, _get_level_int, set_logging_level
+from tidy3d.log import DEFAULT_LEVEL, _get_level_int, set_logging_level, Logger, LogHandler
 
 
 def test_log():
@@ -269,3 +271,43 @@ def test_log_suppression():
         assert td.log._counts is None
 
     td.config.log_suppression = True
+
+
+def test_log_lazy_formatting():
+    """Messages are only composed if a handler, a capture or a consolidation context needs them."""
+
+    class Message:
+        def __init__(self):
+            self.num_str = 0
+
+        def __str__(self):
+            self.num_str += 1
+            return "message"
+
+    logger = Logger()
+    logger.handlers["console"] = LogHandler(Console(file=io.StringIO()), "WARNING")
+    message = Message()
+    logger.debug(message)
+    assert message.num_str == 0
+
+    with logger as suppressed_log:
+        for _ in range(3):
+            suppressed_log.warning(message)
+        assert logger._counts[30] == 2
+    assert message.num_str == 1
+
+    logger.warning(message)
+    assert message.num_str == 2
+
+
+def test_log_capture_disabled():
+    """Warnings are not captured in a 'capture_disabled' context."""
+    logger = Logger()
+    logger.set_capture(True)
+    logger.begin_capture()
+    with logger.capture_disabled():
+        assert logger._stack is None
+        logger.warning("not captured")
+    logger.warning("captured")
+    logger.end_capture(td.Box(size=(1, 1, 1)))
+    assert logger.captured_warnings() == [{"loc": [], "msg": "captured"}]
@@ -27,6 +27,8 @@ from tidy3d.plugins.adjoint.components.data.sim_data import JaxSimulationData
 from tidy3d.plugins.adjoint.components.data.monitor_data import JaxModeData, JaxDiffractionData
 from tidy3d.plugins.adjoint.components.data.data_array import JaxDataArray, JAX_DATA_ARRAY_TAG
 from tidy3d.plugins.adjoint.components.data.dataset import JaxPermittivityDataset
+from tidy3d.plugins.adjoint.components.shared_data import SharedData, SharedDataArray
+from tidy3d.plugins.adjoint.components.shared_data import load_shared
 from tidy3d.plugins.adjoint.web import run, run_async
 from tidy3d.plugins.adjoint.web import run_local, run_async_local
 from tidy3d.plugins.adjoint.components.data.data_array import VALUE_FILTER_THRESHOLD
@@ -35,6 +37,7 @@ from tidy3d.plugins.adjoint.utils.filter import ConicFilter, BinaryProjector, Ci
 from tidy3d.web.container import BatchData
 
 from ..utils import run_emulated, assert_log_level, log_capture, run_async_emulated
+from ..test_data.test_monitor_data import make_field_data, make_permittivity_data
 
 TMP_PATH = None
 FWD_SIM_DATA_FILE = "adjoint_grad_data_fwd.hdf5"
@@ -1512,3 +1515,51 @@ def test_polyslab_structures(use_emulated_run):
         return jnp.sum(jnp.abs(jnp.array(sd["test"].amps.values)))
 
     jax.grad(f)(0.5)
+
+
+def test_store_vjp_shared_data():
+    """Parallel vjps with the field data shared through memory-mapped files match the
+    sequential ones."""
+    grad_data_fwd = make_field_data(symmetry=False)
+    grad_data_adj = make_field_data(symmetry=False)
+    grad_data_eps = make_permittivity_data(symmetry=False)
+
+    with SharedData() as shared:
+        fld_shared = shared.share(grad_data_fwd)
+        assert isinstance(fld_shared.Ex, SharedDataArray)
+        assert load_shared(fld_shared) == grad_data_fwd
+
+    polyslab = JaxPolySlab(vertices=((-0.5, -0.5), (0.5, -0.5), (0, 0.5)), slab_bounds=(-0.5, 0.5))
+    vjp_args = dict(
+        grad_data_fwd=grad_data_fwd,
+        grad_data_adj=grad_data_adj,
+        grad_data_eps=grad_data_eps,
+        sim_bounds=((-2, -2, -2), (2, 2, 2)),
+        wvl_mat=1.0,
+        eps_out=1.0,
+        eps_in=2.0,
+    )
+    vjp_sequential = polyslab.store_vjp(**vjp_args, num_proc=1)
+    vjp_parallel = polyslab.store_vjp(**vjp_args, num_proc=NUM_PROC_PARALLEL)
+    assert np.any(np.array(vjp_sequential.vertices) != 0)
+    assert np.allclose(vjp_parallel.vertices, vjp_sequential.vertices)
+
+    # the vectorized vjp of all vertices matches the vjp computed one edge at a time
+    e_mult_xyz, d_mult_xyz = polyslab.compute_dotted_e_d_fields(
+        grad_data_fwd=grad_data_fwd, grad_data_adj=grad_data_adj, grad_data_eps=grad_data_eps
+    )
+    edge_args = [vjp_args[key] for key in ("sim_bounds", "wvl_mat", "eps_out", "eps_in")]
+    for slab_bounds in [(-0.5, 0.5), (0, 0)]:
+        for vertices in [polyslab.vertices, polyslab.vertices[::-1]]:
+            polyslab_i = polyslab.updated_copy(vertices=vertices, slab_bounds=slab_bounds)
+            vjp_edges = [
+                polyslab_i.vertex_vjp(i, e_mult_xyz, d_mult_xyz, *edge_args)
+                for i in range(len(vertices))
+            ]
+            vjp_vectorized = polyslab_i.vertices_vjp(e_mult_xyz, d_mult_xyz, *edge_args)
+            assert np.allclose(vjp_vectorized, vjp_edges)
+
+    group = JaxGeometryGroup(geometries=(polyslab, polyslab))
+    vjp_group = group.store_vjp(**vjp_args, num_proc=NUM_PROC_PARALLEL)
+    for geometry in vjp_group.geometries:
+        assert np.allclose(geometry.vertices, vjp_sequential.vertices)
@@ -369,3 +369,26 @@ def test_mapping_exclusion(monkeypatch, tmp_path):
 
     s_matrix = run_component_modeler(monkeypatch, modeler)
     _test_mappings(element_mappings, s_matrix)
+
+
+def test_run_component_modeler_mapping_chain(monkeypatch, tmp_path):
+    """Make sure that mappings are applied in order, so an element set by a mapping can be used by
+    a later mapping."""
+    element_0 = (("left_bot", 0), ("right_bot", 0))
+    element_1 = (("left_top", 0), ("right_top", 0))
+    element_2 = (("left_top", 1), ("right_top", 1))
+    element_mappings = ((element_0, element_1, -1j), (element_1, element_2, 2))
+    modeler = make_component_modeler(element_mappings=element_mappings, path_dir=str(tmp_path))
+    s_matrix = run_component_modeler(monkeypatch, modeler)
+    _test_mappings(element_mappings, s_matrix)
+
+    def select(element):
+        (port_out, mode_index_out), (port_in, mode_index_in) = element
+        return s_matrix.sel(
+            port_out=port_out,
+            mode_index_out=mode_index_out,
+            port_in=port_in,
+            mode_index_in=mode_index_in,
+        ).values
+
+    assert np.allclose(select(element_2), -2j * select(element_0))
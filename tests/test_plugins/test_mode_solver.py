@@ -8,10 +8,14 @@ import tidy3d as td
 
 from tidy3d.version import __version__
 import tidy3d.plugins.mode.web as msweb
+import tidy3d.plugins.mode.mode_solver as mode_solver_module
+import tidy3d.plugins.mode.solver as solver_module
 from tidy3d.plugins.mode import ModeSolver
 from tidy3d.plugins.mode.mode_solver import MODE_MONITOR_NAME
 from tidy3d.plugins.mode.derivatives import create_sfactor_b, create_sfactor_f
-from tidy3d.plugins.mode.solver import compute_modes
+from tidy3d.plugins.mode.derivatives import create_d_matrices, create_s_matrices
+from tidy3d.plugins.mode.solver import compute_modes, EigsWarmStart
+from tidy3d.exceptions import Tidy3dError
 from ..utils import assert_log_level, log_capture
 from tidy3d import ScalarFieldDataArray
 from tidy3d.web.environment import Env
@@ -609,3 +613,179 @@ def test_pml_params():
     sf_f = create_sfactor_f(omega, dls, N, n_pml, dmin_pml=True)
     assert np.allclose(sf_f[:n_pml] / sf_f[n_pml - 1], target_profile[::-1])
     assert np.allclose(sf_f[N - n_pml :] / sf_f[N - n_pml], target_profile)
+
+
+def test_pml_d_mats():
+    """Derivative matrices with the PML are those of the S-matrices times the derivative matrices,
+    and the one dimensional operators are reused across frequencies."""
+    rng = np.random.default_rng(0)
+    solver_module.d_mats_1d_cached.cache_clear()
+    for shape in ((30, 20), (1, 20), (25, 1)):
+        dl_f = [rng.uniform(0.01, 0.02, num) for num in shape]
+        dl_b = [rng.uniform(0.01, 0.02, num) for num in shape]
+        dl_f_key, dl_b_key = (tuple(tuple(dl.tolist()) for dl in dls) for dls in (dl_f, dl_b))
+        for omega in (1e15, 2e15):
+            s_mats = create_s_matrices(omega, shape, (5, 4), dl_f, dl_b, (False, True))
+            d_mats = create_d_matrices(shape, dl_f, dl_b, (True, False))
+            der_mats = solver_module.pml_d_mats(
+                shape, dl_f_key, dl_b_key, (True, False), omega, (5, 4), (False, True)
+            )
+            for s_mat, d_mat, der_mat in zip(s_mats, d_mats, der_mats):
+                expected = s_mat.dot(d_mat) / (omega / td.C_0)
+                assert abs(der_mat - expected).max() <= 1e-12 * abs(expected).max()
+    assert solver_module.d_mats_1d_cached.cache_info().misses == 3
+    assert solver_module.d_mats_1d_cached.cache_info().hits == 3
+
+
+def test_mode_solver_parallel_freqs(monkeypatch):
+    """Solving frequencies in parallel gives the same, identically ordered, results, with a single
+    pool of processes for all the groups of frequencies."""
+    simulation = td.Simulation(
+        size=SIM_SIZE,
+        grid_spec=td.GridSpec(wavelength=1.0),
+        structures=[WAVEGUIDE],
+        run_time=1e-12,
+        boundary_spec=td.BoundarySpec.all_sides(boundary=td.Periodic()),
+    )
+    freqs = np.linspace(td.C_0 / 1.1, td.C_0 / 0.9, 5)
+    ms = ModeSolver(
+        simulation=simulation,
+        plane=PLANE,
+        mode_spec=td.ModeSpec(num_modes=2, track_freq="central", precision="double"),
+        freqs=freqs,
+    )
+    pools = []
+    pool_class = mode_solver_module.Pool
+
+    def pool_spy(*args, **kwargs):
+        pools.append(pool_class(*args, **kwargs))
+        return pools[-1]
+
+    monkeypatch.setattr(mode_solver_module, "Pool", pool_spy)
+    ms_parallel = ms.updated_copy(num_proc=2)
+    assert np.allclose(ms.data.n_complex, ms_parallel.data.n_complex)
+    assert len(pools) == 1
+    assert np.allclose(ms.data.Ex, ms_parallel.data.Ex)
+    assert np.allclose(ms_parallel.data.n_complex.f, freqs)
+
+    # lossy waveguide medium is dispersive, lossless one is not
+    assert not ms._eps_frequency_independent
+    lossless = td.Structure(geometry=WAVEGUIDE.geometry, medium=td.Medium(permittivity=4.0))
+    ms_lossless = ms.updated_copy(simulation=simulation.updated_copy(structures=[lossless]))
+    assert ms_lossless._eps_frequency_independent
+    assert ms_lossless.data.n_complex.shape == (5, 2)
+
+
+def test_mode_solver_warm_start():
+    """Warm started solves give the same modes."""
+    eps_cross = np.ones((40, 40))
+    eps_cross[15:25, 15:25] = 4.0
+    coords = np.linspace(0, 4, 41)
+    mode_spec = td.ModeSpec(num_modes=3, precision="double")
+    zeros = np.zeros_like(eps_cross)
+    eps_diag = [eps_cross, zeros, zeros, zeros, eps_cross, zeros, zeros, zeros, eps_cross]
+    kwargs = dict(eps_cross=eps_diag, coords=[coords, coords], mode_spec=mode_spec)
+    freqs = (td.C_0 / 1.0, td.C_0 / 0.98, td.C_0 / 0.96)
+
+    warm_start = EigsWarmStart(track_neff=True)
+    for freq in freqs:
+        _, n_cold, _ = compute_modes(freq=freq, **kwargs)
+        _, n_warm, _ = compute_modes(freq=freq, warm_start=warm_start, **kwargs)
+        assert np.allclose(n_cold, n_warm)
+        assert warm_start.num_iterations > 0
+
+    simulation = td.Simulation(
+        size=SIM_SIZE,
+        grid_spec=td.GridSpec(wavelength=1.0),
+        structures=[WAVEGUIDE],
+        run_time=1e-12,
+        boundary_spec=td.BoundarySpec.all_sides(boundary=td.Periodic()),
+    )
+    ms = ModeSolver(
+        simulation=simulation,
+        plane=PLANE,
+        mode_spec=td.ModeSpec(num_modes=2),
+        freqs=np.linspace(td.C_0 / 1.1, td.C_0 / 0.9, 5),
+    )
+    ms_tracked = ms.updated_copy(track_neff=True)
+    assert np.allclose(ms.data.n_complex, ms_tracked.data.n_complex, rtol=1e-4)
+
+
+def test_mode_solver_iterative_solve(monkeypatch):
+    """The iterative solve finds the same modes as the direct one, with diagonal and fully
+    anisotropic permittivity and with the PML, and raises an error if it does not converge."""
+    eps_cross = np.ones((40, 40))
+    eps_cross[15:25, 15:25] = 4.0
+    coords = np.linspace(0, 4, 41)
+    zeros = np.zeros_like(eps_cross)
+    eps_diag = [eps_cross, zeros, zeros, zeros, eps_cross, zeros, zeros, zeros, eps_cross]
+    eps_offdiag = [eps_cross, 0.1 * eps_cross, zeros, 0.1 * eps_cross, eps_cross, zeros]
+    eps_offdiag += [zeros, zeros, eps_cross]
+    for eps, num_pml in ((eps_diag, (0, 0)), (eps_diag, (8, 8)), (eps_offdiag, (8, 8))):
+        mode_spec = td.ModeSpec(num_modes=3, precision="double", num_pml=num_pml)
+        kwargs = dict(eps_cross=eps, coords=[coords, coords], freq=td.C_0, mode_spec=mode_spec)
+        _, n_direct, _ = compute_modes(**kwargs)
+        _, n_iterative, _ = compute_modes(iterative_solve=True, **kwargs)
+        assert np.allclose(n_direct, n_iterative, rtol=1e-8)
+
+    simulation = td.Simulation(
+        size=SIM_SIZE,
+        grid_spec=td.GridSpec(wavelength=1.0),
+        structures=[WAVEGUIDE],
+        run_time=1e-12,
+        boundary_spec=td.BoundarySpec.all_sides(boundary=td.Periodic()),
+    )
+    ms = ModeSolver(
+        simulation=simulation,
+        plane=PLANE,
+        mode_spec=td.ModeSpec(num_modes=2, precision="double"),
+        freqs=[td.C_0 / 1.0, td.C_0 / 0.9],
+    )
+    ms_iterative = ms.updated_copy(iterative_solve=True)
+    assert np.allclose(ms.data.n_complex, ms_iterative.data.n_complex, rtol=1e-6)
+
+    monkeypatch.setattr(solver_module.spl, "gmres", lambda mat, vec, **kwargs: (vec, 1))
+    with pytest.raises(Tidy3dError):
+        compute_modes(iterative_solve=True, **kwargs)
+
+
+def test_mode_solver_precision():
+    """Single precision is kept from the permittivity to the mode fields, and mixed precision
+    refines the single precision modes to those of the double precision solver."""
+    eps_cross = np.ones((40, 40))
+    eps_cross[15:25, 15:25] = 4.0
+    coords = np.linspace(0, 4, 41)
+    zeros = np.zeros_like(eps_cross)
+    eps_diag = [eps_cross, zeros, zeros, zeros, eps_cross, zeros, zeros, zeros, eps_cross]
+    eps_offdiag = [eps_cross, 0.1 * eps_cross, zeros, 0.1 * eps_cross, eps_cross, zeros]
+    eps_offdiag += [zeros, zeros, eps_cross]
+    for eps, num_pml in ((eps_diag, (0, 0)), (eps_diag, (8, 8)), (eps_offdiag, (8, 8))):
+        kwargs = dict(eps_cross=eps, coords=[coords, coords], freq=td.C_0)
+        mode_spec = td.ModeSpec(num_modes=3, precision="double", num_pml=num_pml)
+        _, n_double, _ = compute_modes(mode_spec=mode_spec, **kwargs)
+        mode_spec = mode_spec.updated_copy(precision="single")
+        fields, n_single, _ = compute_modes(mode_spec=mode_spec, **kwargs)
+        assert fields.dtype == np.complex64
+        assert np.allclose(n_double, n_single, rtol=1e-5)
+        fields, n_mixed, _ = compute_modes(mode_spec=mode_spec, mixed_precision=True, **kwargs)
+        assert fields.dtype == np.complex128
+        assert np.allclose(n_double, n_mixed, rtol=1e-10)
+
+    simulation = td.Simulation(
+        size=SIM_SIZE,
+        grid_spec=td.GridSpec(wavelength=1.0),
+        structures=[WAVEGUIDE],
+        run_time=1e-12,
+        boundary_spec=td.BoundarySpec.all_sides(boundary=td.Periodic()),
+    )
+    ms = ModeSolver(
+        simulation=simulation,
+        plane=PLANE,
+        mode_spec=td.ModeSpec(num_modes=2, precision="single", track_freq="central"),
+        freqs=[td.C_0 / 1.0, td.C_0 / 0.9],
+    )
+    assert all(field.dtype == np.complex64 for field in ms.data.field_components.values())
+    ms_double = ms.updated_copy(mode_spec=ms.mode_spec.updated_copy(precision="double"))
+    ms_mixed = ms.updated_copy(mixed_precision=True)
+    assert all(field.dtype == np.complex128 for field in ms_mixed.data.field_components.values())
+    assert np.allclose(ms_double.data.n_complex, ms_mixed.data.n_complex, rtol=1e-10)
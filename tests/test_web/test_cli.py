@@ -21,3 +21,23 @@ def test_tidy3d_cli():
     #
     # if os.path.exists(f"{CONFIG_FILE}.bak"):
     #     shutil.move(f"{CONFIG_FILE}.bak", CONFIG_FILE)
+
+
+def test_tidy3d_cli_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr("tidy3d.web.cache.RESULT_CACHE_DIR", str(tmp_path))
+    for ind in range(2):
+        with open(tmp_path / f"key_{ind}.hdf5", "wb") as f:
+            f.write(bytes(2**20))
+
+    runner = CliRunner()
+    result = runner.invoke(tidy3d_cli, ["cache", "info"])
+    assert result.exit_code == 0
+    assert "2 cached results" in result.output
+
+    result = runner.invoke(tidy3d_cli, ["cache", "prune", "--max-size", "0.0015"])
+    assert result.exit_code == 0
+    assert "Removed 1 cached results" in result.output
+
+    result = runner.invoke(tidy3d_cli, ["cache", "prune", "--max-size", "0"])
+    assert "Removed 1 cached results" in result.output
+    assert not list(tmp_path.iterdir())
@@ -1,4 +1,9 @@
 # Tests webapi and things that depend on it
+import os
+import json
+import threading
+
+import numpy as np
 
 import pytest
 import responses
@@ -11,8 +16,12 @@ from tidy3d.web.environment import Env
 from tidy3d.web.webapi import delete, delete_old, download, download_json, run, abort
 from tidy3d.web.webapi import download_log, estimate_cost, get_info, get_run_info, get_tasks
 from tidy3d.web.webapi import load, load_simulation, start, upload, monitor, real_cost
+from tidy3d.web.webapi import REFRESH_TIME, REFRESH_TIME_BACKOFF, get_statuses
+from tidy3d.web.task import TaskInfo
 from tidy3d.web.container import Job, Batch
+from tidy3d.web.simulation_task import Folder, SimulationTask, SIMULATION_DATA_HDF5
 from tidy3d.web.asynchronous import run_async
+from tidy3d.web import cache as result_cache
 
 from tidy3d.__main__ import main
 
@@ -398,6 +407,69 @@ def test_run(mock_webapi, monkeypatch, tmp_path):
     )
 
 
+@pytest.fixture
+def mock_result_cache(monkeypatch, tmp_path):
+    """Use an empty result cache in a temporary directory."""
+    monkeypatch.setattr("tidy3d.web.cache.RESULT_CACHE_DIR", str(tmp_path / "cache"))
+
+
+@responses.activate
+def test_run_cache(mock_webapi, mock_result_cache, monkeypatch, tmp_path):
+    sim = make_sim()
+    num_runs = [0]
+
+    def mock_load(task_id, path, **kwargs):
+        num_runs[0] += 1
+        sim_data = td.SimulationData(simulation=sim, data=())
+        sim_data.to_file(path)
+        return sim_data
+
+    monkeypatch.setattr("tidy3d.web.webapi.load", mock_load)
+    run_kwargs = dict(task_name=TASK_NAME, folder_name=PROJECT_NAME, use_cache=True)
+
+    path = str(tmp_path / "run_0.hdf5")
+    sim_data = run(sim, path=path, **run_kwargs)
+    assert num_runs[0] == 1
+
+    # identical simulation is not uploaded nor run again
+    def mock_upload(*args, **kwargs):
+        raise AssertionError("Cached simulation should not be uploaded.")
+
+    monkeypatch.setattr("tidy3d.web.webapi.upload", mock_upload)
+    path = str(tmp_path / "run_1.hdf5")
+    assert run(sim, path=path, **run_kwargs) == sim_data
+    assert num_runs[0] == 1
+
+    # a Job with the same simulation and solver version also hits the cache
+    monkeypatch.setattr("tidy3d.web.container.Job.start", mock_upload)
+    job = Job(simulation=sim, task_name=TASK_NAME, task_id=TASK_ID, use_cache=True)
+    assert job.run(path=str(tmp_path / "job.hdf5")) == sim_data
+    with pytest.raises(AssertionError):
+        job.updated_copy(solver_version="other").run(path=str(tmp_path / "job.hdf5"))
+
+    # a new Job with cached results is not uploaded
+    job = Job(simulation=sim, task_name=TASK_NAME, use_cache=True)
+    assert job.task_id is None
+    assert job.run(path=str(tmp_path / "new_job.hdf5")) == sim_data
+
+
+def test_result_cache_eviction(mock_result_cache, tmp_path):
+    for ind in range(3):
+        path = str(tmp_path / f"data_{ind}.hdf5")
+        with open(path, "wb") as f:
+            f.write(bytes(100))
+        result_cache.store_result(f"key_{ind}", path)
+    # make key_0 the most recently used
+    assert result_cache.fetch_cached_result("key_0", str(tmp_path / "data.hdf5"))
+    assert not result_cache.fetch_cached_result("key_3", str(tmp_path / "data.hdf5"))
+    assert [key for key, _, _ in result_cache.result_cache_entries()][0] == "key_0"
+
+    assert result_cache.prune_result_cache(max_size=250) == ["key_1"]
+    assert result_cache.prune_result_cache(max_size=100) == ["key_2"]
+    assert result_cache.prune_result_cache(max_size=0) == ["key_0"]
+    assert result_cache.result_cache_entries() == []
+
+
 @responses.activate
 def test_monitor(mock_get_info, mock_monitor):
     monitor(TASK_ID, verbose=True)
@@ -463,6 +535,232 @@ def test_batch(mock_webapi, mock_job_status, tmp_path):
     assert b.real_cost() == FLEX_UNIT * len(sims)
 
 
+@responses.activate
+def test_batch_cache(mock_webapi, mock_job_status, mock_result_cache, monkeypatch, tmp_path):
+    sims = {TASK_NAME: make_sim()}
+    b = Batch(simulations=sims, folder_name=PROJECT_NAME, use_cache=True)
+    job_path = b._job_data_path(task_id=TASK_ID, path_dir=str(tmp_path))
+    monkeypatch.setattr(
+        "tidy3d.web.webapi.download",
+        lambda task_id, path, **kwargs: td.SimulationData(
+            simulation=sims[TASK_NAME], data=()
+        ).to_file(path),
+    )
+    _ = b.run(path_dir=str(tmp_path))
+    assert len(result_cache.result_cache_entries()) == 1
+
+    # cached tasks are not started again
+    os.remove(job_path)
+    monkeypatch.setattr("tidy3d.web.container.Batch.start", lambda self: 1 / 0)
+    _ = b.run(path_dir=str(tmp_path))
+    assert os.path.exists(job_path)
+
+    # a new batch of cached simulations is not uploaded
+    def mock_upload(*args, **kwargs):
+        raise AssertionError("Cached simulation should not be uploaded.")
+
+    monkeypatch.setattr("tidy3d.web.webapi.upload", mock_upload)
+    b = Batch(simulations=sims, folder_name=PROJECT_NAME, use_cache=True)
+    assert all(job.task_id is None for job in b.jobs.values())
+    batch_data = b.run(path_dir=str(tmp_path / "cached"))
+    assert batch_data.task_ids == {TASK_NAME: None}
+    assert batch_data[TASK_NAME].simulation == sims[TASK_NAME]
+
+
+@responses.activate
+def test_batch_monitor_statuses(set_api_key, monkeypatch, tmp_path):
+    """Large batches check all statuses with one request, back off, and download early."""
+    num_tasks = 12
+    sims = {f"task_{i}": make_sim() for i in range(num_tasks)}
+    jobs = {
+        name: Job(simulation=sim, task_name=name, task_id=name, folder_name=PROJECT_NAME)
+        for name, sim in sims.items()
+    }
+    batch = Batch(simulations=sims, jobs=jobs, folder_name=PROJECT_NAME, verbose=False)
+
+    # status of all tasks in the folder at each request
+    statuses = [["running"] * num_tasks] * 2
+    statuses += [["success"] + ["running"] * (num_tasks - 1)] * 4
+    statuses += [["success"] * num_tasks]
+    num_requests = [0]
+    downloaded_early = [False]
+    first_downloaded = threading.Event()
+
+    def list_tasks(request):
+        ind = min(num_requests[0], len(statuses) - 1)
+        num_requests[0] += 1
+        if ind == len(statuses) - 1:
+            downloaded_early[0] = first_downloaded.wait(timeout=10)
+        tasks = [
+            {"taskId": f"task_{i}", "status": status, "createdAt": CREATED_AT}
+            for i, status in enumerate(statuses[ind])
+        ]
+        return 200, {}, json.dumps({"data": tasks})
+
+    responses.add(
+        responses.GET,
+        f"{Env.current.web_api_endpoint}/tidy3d/project",
+        match=[matchers.query_param_matcher({"projectName": PROJECT_NAME})],
+        json={"data": {"projectId": TASK_ID, "projectName": PROJECT_NAME}},
+        status=200,
+    )
+    responses.add_callback(
+        responses.GET, f"{Env.current.web_api_endpoint}/tidy3d/projects/{TASK_ID}/tasks", list_tasks
+    )
+
+    downloaded = []
+
+    def mock_download(task_id, path, **kwargs):
+        downloaded.append(task_id)
+        first_downloaded.set()
+
+    sleep_times = []
+    monkeypatch.setattr("tidy3d.web.webapi.download", mock_download)
+    monkeypatch.setattr("tidy3d.web.container.time.sleep", sleep_times.append)
+
+    batch.monitor(path_dir=str(tmp_path))
+
+    assert num_requests[0] == len(statuses)
+    assert downloaded_early[0]
+    assert sorted(downloaded) == sorted(sims)
+    refresh, backoff = REFRESH_TIME, REFRESH_TIME_BACKOFF
+    expected_sleeps = [refresh, refresh * backoff, refresh]
+    expected_sleeps += [refresh * backoff, refresh * backoff**2, refresh * backoff**3]
+    assert np.allclose(sleep_times, expected_sleeps)
+
+
+@responses.activate
+def test_get_statuses_large_folder(set_api_key, monkeypatch):
+    """Statuses of a few tasks in a folder holding many unrelated tasks are checked task by task
+    once the folder was listed."""
+    monkeypatch.setattr("tidy3d.web.webapi._FOLDER_NUM_TASKS", {})
+    task_ids = [f"task_{i}" for i in range(3)]
+    num_listed = [0]
+
+    def list_tasks(request):
+        num_listed[0] += 1
+        tasks = [
+            {"taskId": f"task_{i}", "status": "running", "createdAt": CREATED_AT}
+            for i in range(200)
+        ]
+        return 200, {}, json.dumps({"data": tasks})
+
+    responses.add(
+        responses.GET,
+        f"{Env.current.web_api_endpoint}/tidy3d/project",
+        match=[matchers.query_param_matcher({"projectName": PROJECT_NAME})],
+        json={"data": {"projectId": TASK_ID, "projectName": PROJECT_NAME}},
+        status=200,
+    )
+    responses.add_callback(
+        responses.GET, f"{Env.current.web_api_endpoint}/tidy3d/projects/{TASK_ID}/tasks", list_tasks
+    )
+    info_requests = []
+
+    def mock_get_info(task_id):
+        info_requests.append(task_id)
+        return TaskInfo(taskId=task_id, status="success")
+
+    monkeypatch.setattr("tidy3d.web.webapi.get_info", mock_get_info)
+
+    statuses = get_statuses(task_ids, folder_name=PROJECT_NAME)
+    assert statuses == dict.fromkeys(task_ids, "running")
+    assert num_listed[0] == 1 and not info_requests
+
+    for _ in range(2):
+        statuses = get_statuses(task_ids, folder_name=PROJECT_NAME)
+        assert statuses == dict.fromkeys(task_ids, "success")
+    assert num_listed[0] == 1
+    assert sorted(info_requests) == sorted(task_ids * 2)
+
+    # a batch of comparable size to the folder lists it again
+    many_task_ids = [f"task_{i}" for i in range(100)]
+    statuses = get_statuses(many_task_ids, folder_name=PROJECT_NAME)
+    assert statuses == dict.fromkeys(many_task_ids, "running")
+    assert num_listed[0] == 2
+
+
+class FakeS3:
+    """In-memory stand-in for the S3 storage that records how many transfers overlap."""
+
+    def __init__(self, num_concurrent: int):
+        self.objects = {}
+        self.barrier = threading.Barrier(num_concurrent, timeout=10)
+
+    def get_token(self, resource_id, file_name, extra_arguments=None):
+        s3 = self
+
+        class FakeToken:
+            def get_bucket(self):
+                return "bucket"
+
+            def get_s3_key(self):
+                return f"{resource_id}/{file_name}"
+
+            def get_client(self):
+                return s3
+
+        return FakeToken()
+
+    def upload_fileobj(self, data, Bucket, Key, Callback, **kwargs):
+        self.barrier.wait()
+        self.objects[Key] = data.read()
+        Callback(len(self.objects[Key]))
+
+    def head_object(self, Bucket, Key):
+        return {"ContentLength": len(self.objects[Key])}
+
+    def download_file(self, Bucket, Filename, Key, Callback):
+        self.barrier.wait()
+        with open(Filename, "wb") as f:
+            f.write(self.objects[Key])
+        Callback(len(self.objects[Key]))
+
+
+@responses.activate
+def test_batch_concurrent_transfers(set_api_key, monkeypatch, tmp_path):
+    """Uploads, downloads and loads of a batch run concurrently against a stand-in S3."""
+    num_tasks = 4
+    sims = {
+        f"task_{i}": make_sim().updated_copy(run_time=(i + 1) * 1e-12) for i in range(num_tasks)
+    }
+    s3 = FakeS3(num_concurrent=num_tasks)
+    folder = Folder(projectId=TASK_ID, projectName=PROJECT_NAME)
+
+    def create_task(simulation, task_name, *args, **kwargs):
+        return SimulationTask(taskId=f"id_{task_name}", simulation=simulation, folder=folder)
+
+    monkeypatch.setattr("tidy3d.web.s3utils.get_s3_sts_token", s3.get_token)
+    monkeypatch.setattr("tidy3d.web.webapi.SimulationTask.create", create_task)
+    monkeypatch.setattr("tidy3d.web.webapi.get_info", lambda task_id: None)
+    monkeypatch.setattr("tidy3d.web.container.Job.status", property(lambda self: "success"))
+
+    # all uploads must be in flight at the same time to pass the barrier
+    batch = Batch(simulations=sims, folder_name=PROJECT_NAME, num_transfer_workers=num_tasks)
+    assert len(s3.objects) == num_tasks
+
+    for task_name, sim in sims.items():
+        path = str(tmp_path / f"{task_name}.hdf5")
+        sim_data = td.SimulationData(simulation=sim, data=(), log="field decay: 0.0")
+        sim_data.to_file(path)
+        with open(path, "rb") as f:
+            s3.objects[f"id_{task_name}/{SIMULATION_DATA_HDF5}"] = f.read()
+
+    batch.download(path_dir=str(tmp_path))
+    for job in batch.jobs.values():
+        assert os.path.exists(batch._job_data_path(task_id=job.task_id, path_dir=str(tmp_path)))
+
+    # by default the data is loaded one by one, or prefetched in the background if requested
+    batch_data = batch.load(path_dir=str(tmp_path))
+    assert batch_data.num_load_ahead == 0
+    for num_load_ahead in (0, 2):
+        batch_data = batch_data.updated_copy(num_load_ahead=num_load_ahead)
+        items = list(batch_data.items())
+        assert [task_name for task_name, _ in items] == list(sims)
+        for task_name, sim_data in items:
+            assert sim_data.simulation == sims[task_name]
+
+
 """ Async """
 
 
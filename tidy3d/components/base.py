@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import hashlib
 import pathlib
 import os
 import tempfile
@@ -11,13 +12,17 @@ from typing import List, Callable, Dict, Union, Tuple, Any
 import rich
 import pydantic.v1 as pydantic
 from pydantic.v1.fields import ModelField
+from pydantic.v1.error_wrappers import ErrorWrapper
+from pydantic.v1.errors import MissingError
+from pydantic.v1.utils import ROOT_KEY
 import yaml
 import numpy as np
 import h5py
 import xarray as xr
 
 from .types import ComplexNumber, Literal, TYPE_TAG_STR
-from .data.data_array import DataArray, DATA_ARRAY_MAP
+from .data.data_array import DataArray, DATA_ARRAY_MAP, HASH_DIGEST_SIZE
+from .data.data_array import update_hasher_with_array, check_hdf5_write_options
 from .file_util import compress_file_to_gzip, extract_gzip_file
 from ..exceptions import FileError
 from ..log import log
@@ -72,6 +77,78 @@ def _get_valid_extension(fname: str) -> str:
     return extension
 
 
+def _is_numeric(value: Any) -> bool:
+    """Whether a value is a number, or a non-ragged (nested) list or tuple of numbers or numeric
+    arrays."""
+    if isinstance(value, (list, tuple)):
+        if not all(_is_numeric(item) for item in value):
+            return False
+        shapes = {np.shape(item) for item in value}
+        return len(shapes) <= 1
+    if isinstance(value, np.ndarray):
+        return value.dtype.kind in "biufc"
+    return isinstance(value, (int, float, complex, np.number)) and not isinstance(value, bool)
+
+
+class _RecordingDict(dict):
+    """Dictionary of field values passed to the validators, recording which keys they read. Reads
+    of the whole dictionary (iteration, copies, views) are recorded as ``all_read``."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.read = set()
+        self.all_read = False
+
+    def reset(self) -> None:
+        """Forget the recorded reads."""
+        self.read = set()
+        self.all_read = False
+
+    @property
+    def dependencies(self) -> Union[frozenset, None]:
+        """Keys read since the last reset, ``None`` if the whole dictionary was read."""
+        return None if self.all_read else frozenset(self.read)
+
+    def __getitem__(self, key):
+        self.read.add(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        self.read.add(key)
+        return super().__contains__(key)
+
+    def get(self, key, default=None):
+        self.read.add(key)
+        return super().get(key, default)
+
+    def _read_all(self) -> None:
+        self.all_read = True
+
+    def __iter__(self):
+        self._read_all()
+        return super().__iter__()
+
+    def keys(self):
+        self._read_all()
+        return super().keys()
+
+    def values(self):
+        self._read_all()
+        return super().values()
+
+    def items(self):
+        self._read_all()
+        return super().items()
+
+    def copy(self):
+        self._read_all()
+        return dict(super().items())
+
+    def __len__(self):
+        self._read_all()
+        return super().__len__()
+
+
 class Tidy3dBaseModel(pydantic.BaseModel):
     """Base pydantic model that all Tidy3d components inherit from.
     Defines configuration for handling data structures
@@ -82,10 +159,49 @@ class Tidy3dBaseModel(pydantic.BaseModel):
 
     def __hash__(self) -> int:
         """Hash method."""
-        try:
-            return super().__hash__(self)
-        except TypeError:
-            return hash(self.json())
+        return hash(self._hash_digest)
+
+    @cached_property
+    def _hash_digest(self) -> bytes:
+        """Digest of the field values of the model. Sub-models contribute their own (cached)
+        digests and arrays are hashed from their raw bytes, so no json serialization is needed."""
+        hasher = hashlib.blake2b(digest_size=HASH_DIGEST_SIZE)
+        for field_name in self.__fields__:
+            hasher.update(field_name.encode())
+            self._update_hasher(hasher, getattr(self, field_name))
+        return hasher.digest()
+
+    def _update_hasher(self, hasher: hashlib.blake2b, value: Any) -> None:
+        """Update a ``hashlib`` hasher with a (possibly nested) field value of the model."""
+        if isinstance(value, Tidy3dBaseModel):
+            hasher.update(b"model")
+            hasher.update(value._hash_digest)
+        elif isinstance(value, DataArray):
+            hasher.update(b"data_array")
+            value._update_hasher(hasher)
+        elif isinstance(value, (np.ndarray, np.number)) or _is_numeric(value):
+            # numbers in arrays, lists and tuples hash the same, as in the json representation
+            hasher.update(b"array")
+            update_hasher_with_array(hasher, value)
+        elif isinstance(value, (list, tuple)):
+            hasher.update(f"sequence{len(value)}".encode())
+            for item in value:
+                self._update_hasher(hasher, item)
+        elif isinstance(value, dict):
+            hasher.update(f"dict{len(value)}".encode())
+            for key, item in value.items():
+                self._update_hasher(hasher, key)
+                self._update_hasher(hasher, item)
+        elif value is None or isinstance(value, (str, bool, np.bool_)):
+            hasher.update(f"{type(value).__name__}:{value!r}".encode())
+        elif hasattr(value, "__array__"):
+            # other array types, such as jax arrays
+            try:
+                self._update_hasher(hasher, np.asarray(value))
+            except Exception:
+                hasher.update(repr(value).encode())
+        else:
+            hasher.update(json.dumps(value, default=self.__json_encoder__).encode())
 
     def __init__(self, **kwargs):
         """Init method, includes post-init validators."""
@@ -138,6 +254,10 @@ class Tidy3dBaseModel(pydantic.BaseModel):
 
     _cached_properties = pydantic.PrivateAttr({})
 
+    # keys of the field values read by each field validation and each post root validator, as
+    # recorded when the model was made by ``updated_copy``; ``None`` if unknown
+    _validator_dependencies = pydantic.PrivateAttr(None)
+
     def copy(self, **kwargs) -> Tidy3dBaseModel:
         """Copy a Tidy3dBaseModel.  With ``deep=True`` as default."""
         if "deep" in kwargs and kwargs["deep"] is False:
@@ -146,9 +266,113 @@ class Tidy3dBaseModel(pydantic.BaseModel):
         new_copy = pydantic.BaseModel.copy(self, **kwargs)
         return self.validate(new_copy.dict())
 
+    def _copy_revalidated(self, update: Dict[str, Any]) -> Tidy3dBaseModel:
+        """Copy of the model with updated field values. Each field, and each post root validator,
+        is validated again only if one of the field values it read when validating ``self`` was
+        updated. Sub-components are not validated again."""
+
+        cls = type(self)
+        old_values = {name: getattr(self, name) for name in self.__fields__}
+        input_data = dict(old_values, **update)
+
+        for validator in cls.__pre_root_validators__:
+            try:
+                input_data = validator(cls, input_data)
+            except (ValueError, TypeError, AssertionError) as exc:
+                raise pydantic.ValidationError([ErrorWrapper(exc, loc=ROOT_KEY)], cls) from None
+
+        dependencies = self._validator_dependencies
+        field_dependencies, root_dependencies = dependencies or ({}, ())
+        changed = {
+            name
+            for name, value in input_data.items()
+            if dependencies is None or name not in old_values or value is not old_values[name]
+        }
+
+        values = _RecordingDict()
+        errors = []
+        new_field_dependencies = {}
+        for name, field in cls.__fields__.items():
+            reads = field_dependencies.get(name)
+            if name not in changed and reads is not None and not reads & changed:
+                values[name] = old_values[name]
+                new_field_dependencies[name] = reads
+                continue
+            if field.alias in input_data:
+                value = input_data[field.alias]
+            elif name in input_data:
+                value = input_data[name]
+            elif field.required:
+                errors.append(ErrorWrapper(MissingError(), loc=field.alias))
+                continue
+            else:
+                value = field.get_default()
+            values.reset()
+            value, field_errors = field.validate(value, values, loc=field.alias, cls=cls)
+            new_field_dependencies[name] = values.dependencies
+            if field_errors:
+                errors.append(field_errors)
+                continue
+            if value is not old_values.get(name):
+                changed.add(name)
+            values[name] = value
+
+        new_root_dependencies = []
+        transformed = False
+        for index, (skip_on_failure, validator) in enumerate(cls.__post_root_validators__):
+            if skip_on_failure and errors:
+                new_root_dependencies.append(None)
+                continue
+            reads = root_dependencies[index] if index < len(root_dependencies) else None
+            if reads is not None and not reads & changed:
+                new_root_dependencies.append(reads)
+                continue
+            before = dict(dict.items(values))
+            values.reset()
+            try:
+                validated = validator(cls, values)
+            except (ValueError, TypeError, AssertionError) as exc:
+                errors.append(ErrorWrapper(exc, loc=ROOT_KEY))
+                new_root_dependencies.append(None)
+                continue
+            new_root_dependencies.append(values.dependencies)
+            validated = dict(dict.items(validated))
+            modified = {name for name, value in validated.items() if value is not before.get(name)}
+            if modified or validated.keys() != before.keys():
+                # the recorded reads don't hold for models whose values get transformed
+                transformed = True
+                changed |= modified
+            values = _RecordingDict(validated)
+
+        if errors:
+            raise pydantic.ValidationError(errors, cls)
+
+        fields_set = self.__fields_set__ | set(update)
+        log.begin_capture()
+        new_copy = cls.construct(_fields_set=fields_set, **values)
+        if not transformed:
+            new_copy._validator_dependencies = (
+                new_field_dependencies,
+                tuple(new_root_dependencies),
+            )
+        new_copy._post_init_validators()
+        log.end_capture(new_copy)
+        return new_copy
+
     def updated_copy(self, **kwargs) -> Tidy3dBaseModel:
-        """Make copy of a component instance with ``**kwargs`` indicating updated field values."""
-        return self.copy(update=kwargs)
+        """Make copy of a component instance with ``**kwargs`` indicating updated field values.
+
+        Unlike :meth:`copy`, unchanged sub-components and arrays are shared with the original by
+        reference, and only the validators that depend on the updated fields are run again. The
+        shared arrays must thus not be modified in place.
+        """
+        fields = self.__fields__
+        name_by_alias = {field.alias: name for name, field in fields.items()}
+        update = {name_by_alias.get(key, key): value for key, value in kwargs.items()}
+        if any(key not in fields for key in update):
+            # invalid fields: copy and validate the whole model to raise the usual error
+            return self.copy(update=kwargs)
+        return self._copy_revalidated(update)
 
     def help(self, methods: bool = False) -> None:
         """Prints message describing the fields and methods of a :class:`Tidy3dBaseModel`.
@@ -165,7 +389,9 @@ class Tidy3dBaseModel(pydantic.BaseModel):
         rich.inspect(self, methods=methods)
 
     @classmethod
-    def from_file(cls, fname: str, group_path: str = None, **parse_obj_kwargs) -> Tidy3dBaseModel:
+    def from_file(
+        cls, fname: str, group_path: str = None, lazy: bool = False, **parse_obj_kwargs
+    ) -> Tidy3dBaseModel:
         """Loads a :class:`Tidy3dBaseModel` from .yaml, .json, .hdf5, or .hdf5.gz file.
 
         Parameters
@@ -175,6 +401,9 @@ class Tidy3dBaseModel(pydantic.BaseModel):
         group_path : str, optional
             Path to a group inside the file to use as the base level. Only for hdf5 files.
             Starting `/` is optional.
+        lazy : bool = False
+            If ``True``, the values of the data arrays are only read from the file when accessed.
+            Only for .hdf5 files.
         **parse_obj_kwargs
             Keyword arguments passed to either pydantic's ``parse_obj`` function when loading model.
 
@@ -187,11 +416,11 @@ class Tidy3dBaseModel(pydantic.BaseModel):
         -------
         >>> simulation = Simulation.from_file(fname='folder/sim.json') # doctest: +SKIP
         """
-        model_dict = cls.dict_from_file(fname=fname, group_path=group_path)
+        model_dict = cls.dict_from_file(fname=fname, group_path=group_path, lazy=lazy)
         return cls.parse_obj(model_dict, **parse_obj_kwargs)
 
     @classmethod
-    def dict_from_file(cls, fname: str, group_path: str = None) -> dict:
+    def dict_from_file(cls, fname: str, group_path: str = None, lazy: bool = False) -> dict:
         """Loads a dictionary containing the model from a .yaml, .json, .hdf5, or .hdf5.gz file.
 
         Parameters
@@ -200,6 +429,9 @@ class Tidy3dBaseModel(pydantic.BaseModel):
             Full path to the file to load the :class:`Tidy3dBaseModel` from.
         group_path : str, optional
             Path to a group inside the file to use as the base level.
+        lazy : bool = False
+            If ``True``, the values of the data arrays are only read from the file when accessed.
+            Only for .hdf5 files.
 
         Returns
         -------
@@ -220,6 +452,12 @@ class Tidy3dBaseModel(pydantic.BaseModel):
             else:
                 log.warning("'group_path' provided, but this feature only works with hdf5 files.")
 
+        if lazy:
+            if extension == ".hdf5":
+                kwargs["lazy"] = lazy
+            else:
+                log.warning("'lazy' provided, but this feature only works with .hdf5 files.")
+
         converter = {
             ".json": cls.dict_from_json,
             ".yaml": cls.dict_from_yaml,
@@ -430,7 +668,11 @@ class Tidy3dBaseModel(pydantic.BaseModel):
 
     @classmethod
     def dict_from_hdf5(
-        cls, fname: str, group_path: str = "", custom_decoders: List[Callable] = None
+        cls,
+        fname: str,
+        group_path: str = "",
+        custom_decoders: List[Callable] = None,
+        lazy: bool = False,
     ) -> dict:
         """Loads a dictionary containing the model contents from a .hdf5 file.
 
@@ -444,6 +686,9 @@ class Tidy3dBaseModel(pydantic.BaseModel):
             List of functions accepting
             (fname: str, group_path: str, model_dict: dict, key: str, value: Any) that store the
             value in the model dict after a custom decoding.
+        lazy : bool = False
+            If ``True``, the values of the data arrays are dask arrays that are only read from the
+            file when accessed. The file must then remain in place while the data is used.
 
         Returns
         -------
@@ -480,7 +725,9 @@ class Tidy3dBaseModel(pydantic.BaseModel):
                 # write the path to the element of the json dict where the data_array should be
                 if is_data_array(value):
                     data_array_type = DATA_ARRAY_MAP[value]
-                    model_dict[key] = data_array_type.from_hdf5(fname=fname, group_path=subpath)
+                    model_dict[key] = data_array_type.from_hdf5(
+                        fname=fname, group_path=subpath, lazy=lazy
+                    )
                     continue
 
                 # if a list, assign each element a unique key, recurse
@@ -514,6 +761,7 @@ class Tidy3dBaseModel(pydantic.BaseModel):
         fname: str,
         group_path: str = "",
         custom_decoders: List[Callable] = None,
+        lazy: bool = False,
         **parse_obj_kwargs,
     ) -> Tidy3dBaseModel:
         """Loads :class:`Tidy3dBaseModel` instance to .hdf5 file.
@@ -529,6 +777,9 @@ class Tidy3dBaseModel(pydantic.BaseModel):
             List of functions accepting
             (fname: str, group_path: str, model_dict: dict, key: str, value: Any) that store the
             value in the model dict after a custom decoding.
+        lazy : bool = False
+            If ``True``, the values of the data arrays are dask arrays that are only read from the
+            file when accessed. The file must then remain in place while the data is used.
         **parse_obj_kwargs
             Keyword arguments passed to pydantic's ``parse_obj`` method.
 
@@ -539,11 +790,19 @@ class Tidy3dBaseModel(pydantic.BaseModel):
 
         group_path = cls._construct_group_path(group_path)
         model_dict = cls.dict_from_hdf5(
-            fname=fname, group_path=group_path, custom_decoders=custom_decoders
+            fname=fname, group_path=group_path, custom_decoders=custom_decoders, lazy=lazy
         )
         return cls.parse_obj(model_dict, **parse_obj_kwargs)
 
-    def to_hdf5(self, fname: str, custom_encoders: List[Callable] = None) -> None:
+    def to_hdf5(
+        self,
+        fname: str,
+        custom_encoders: List[Callable] = None,
+        chunks: Union[bool, Dict[str, int]] = None,
+        compression: Literal["gzip", "lzf", "blosc"] = None,
+        compression_opts: int = None,
+        num_workers: int = None,
+    ) -> None:
         """Exports :class:`Tidy3dBaseModel` instance to .hdf5 file.
 
         Parameters
@@ -552,43 +811,77 @@ class Tidy3dBaseModel(pydantic.BaseModel):
             Full path to the .hdf5 file to save the :class:`Tidy3dBaseModel` to.
         custom_encoders : List[Callable]
             List of functions accepting (fname: str, group_path: str, value: Any) that take
-            the ``value`` supplied and write it to the hdf5 ``fname`` at ``group_path``.
+            the ``value`` supplied and write it to the hdf5 ``fname`` at ``group_path``. The
+            values are those of the model dict, in which sub-models are dicts.
+        chunks : Union[bool, Dict[str, int]] = None
+            Chunk size of the data arrays along each of their dimensions (the whole dimension if
+            not given), or ``True`` for chunks guessed by h5py. Compressed data arrays are always
+            chunked.
+        compression : Literal["gzip", "lzf", "blosc"] = None
+            Compression filter of the data arrays. ``"blosc"`` requires the ``hdf5plugin``
+            package, and so does reading the file.
+        compression_opts : int = None
+            Compression level of the ``"gzip"`` and ``"blosc"`` filters.
+        num_workers : int = None
+            Number of threads compressing the chunks with the ``"gzip"`` filter. If ``None``,
+            the number of cpus.
 
         Example
         -------
         >>> simulation.to_hdf5(fname='folder/sim.hdf5') # doctest: +SKIP
         """
 
+        # check the options before the file is opened, which truncates any existing file
+        check_hdf5_write_options(
+            chunks=chunks, compression=compression, compression_opts=compression_opts
+        )
+        if num_workers is None:
+            num_workers = os.cpu_count() or 1
+
         with h5py.File(fname, "w") as f_handle:
 
             f_handle[JSON_TAG] = self._json_string
 
-            def add_data_to_file(data_dict: dict, group_path: str = "") -> None:
-                """For every DataArray item in dictionary, write path of hdf5 group as value."""
-
-                for key, value in data_dict.items():
+            def add_data_to_file(value: Any, group_path: str) -> None:
+                """Write every DataArray in the value of the model at ``group_path`` to the group
+                of the same path. Sub-models are walked directly, without making a dict, unless
+                custom encoders are given."""
+
+                if custom_encoders:
+                    for custom_encoder in custom_encoders:
+                        custom_encoder(fname=f_handle, group_path=group_path, value=value)
+
+                if isinstance(value, xr.DataArray):
+                    value.to_hdf5(
+                        fname=f_handle,
+                        group_path=group_path,
+                        chunks=chunks,
+                        compression=compression,
+                        compression_opts=compression_opts,
+                        num_workers=num_workers,
+                    )
+
+                elif isinstance(value, Tidy3dBaseModel):
+                    for field_name in value.__fields__:
+                        add_data_to_file(getattr(value, field_name), f"{group_path}/{field_name}")
+
+                # if a tuple, assign each element a unique key
+                elif isinstance(value, (list, tuple)):
+                    for key, item in self.tuple_to_dict(tuple_values=value).items():
+                        add_data_to_file(item, f"{group_path}/{key}")
 
-                    # append the key to the path
-                    subpath = f"{group_path}/{key}"
-
-                    if custom_encoders:
-                        for custom_encoder in custom_encoders:
-                            custom_encoder(fname=f_handle, group_path=subpath, value=value)
-
-                    # write the path to the element of the json dict where the data_array should be
-                    if isinstance(value, xr.DataArray):
-                        value.to_hdf5(fname=f_handle, group_path=subpath)
-
-                    # if a tuple, assign each element a unique key
-                    if isinstance(value, (list, tuple)):
-                        value_dict = self.tuple_to_dict(tuple_values=value)
-                        add_data_to_file(data_dict=value_dict, group_path=subpath)
-
-                    # if a dict, recurse
-                    elif isinstance(value, dict):
-                        add_data_to_file(data_dict=value, group_path=subpath)
+                # if a dict, recurse
+                elif isinstance(value, dict):
+                    for key, item in value.items():
+                        add_data_to_file(item, f"{group_path}/{key}")
 
-            add_data_to_file(data_dict=self.dict())
+            if custom_encoders:
+                # custom encoders receive the values of the model dict, with sub-models as dicts
+                fields = self.dict()
+            else:
+                fields = {field_name: getattr(self, field_name) for field_name in self.__fields__}
+            for field_name, value in fields.items():
+                add_data_to_file(value, f"/{field_name}")
 
     @classmethod
     def dict_from_hdf5_gz(
@@ -704,8 +997,12 @@ class Tidy3dBaseModel(pydantic.BaseModel):
         return hash(self) >= hash(other)
 
     def __eq__(self, other):
-        """Define == for two Tidy3DBaseModels."""
-        return self._json_string == other._json_string
+        """Define == for two Tidy3DBaseModels, by comparing the digests of their field values."""
+        if self is other:
+            return True
+        if not isinstance(other, Tidy3dBaseModel):
+            return NotImplemented
+        return self._hash_digest == other._hash_digest
 
     @cached_property
     def _json_string(self) -> str:
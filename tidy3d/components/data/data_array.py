@@ -1,16 +1,29 @@
 """Storing tidy3d data at it's most fundamental level as xr.DataArray objects"""
 from __future__ import annotations
-from typing import Dict, List
+from typing import Dict, List, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+
+import os
+import hashlib
+import zlib
 
 import xarray as xr
 import numpy as np
-import dask
+import dask.array
 import h5py
 
 from ...constants import HERTZ, SECOND, MICROMETER, RADIAN
 from ...exceptions import DataError, FileError
 from ..types import Bound
 
+try:
+    import hdf5plugin
+
+    HDF5PLUGIN_AVAILABLE = True
+except Exception:
+    HDF5PLUGIN_AVAILABLE = False
+
 # maps the dimension names to their attributes
 DIM_ATTRS = {
     "x": {"units": MICROMETER, "long_name": "x position"},
@@ -35,6 +48,193 @@ DIM_ATTRS = {
 # name of the DataArray.values in the hdf5 file (xarray's default name too)
 DATA_ARRAY_VALUE_NAME = "__xarray_dataarray_variable__"
 
+# size in bytes of the digests used to hash models and data arrays
+HASH_DIGEST_SIZE = 16
+
+# compression filters supported when writing data arrays to hdf5 files
+HDF5_COMPRESSIONS = ("gzip", "lzf", "blosc")
+
+# default compression level of the gzip filter
+DEFAULT_GZIP_LEVEL = 4
+
+
+def update_hasher_with_array(hasher: hashlib.blake2b, array: np.ndarray) -> None:
+    """Update a ``hashlib`` hasher with the shape and raw bytes of an array. Like in the json
+    representation, numeric values are hashed as float64, or complex128 if any is complex, so that
+    the same values stored with different dtypes give the same hash."""
+    array = np.asarray(array)
+    if array.dtype.kind == "c" and np.any(array.imag):
+        array = array.astype(np.complex128, copy=False)
+    elif array.dtype.kind in "biufc":
+        array = array.real.astype(np.float64, copy=False)
+    else:
+        hasher.update(f"{array.dtype.kind}{array.shape}".encode())
+        hasher.update(repr(array.tolist()).encode())
+        return
+    hasher.update(f"{array.dtype.str}{array.shape}".encode())
+    hasher.update(np.ascontiguousarray(array).data)
+
+
+class LazyHDF5Dataset:
+    """Array-like handle to a dataset in an hdf5 file, read only when indexed. The file is opened
+    for each read, so no file handle is kept open between reads."""
+
+    def __init__(self, fname: str, dataset_path: str, shape: Tuple[int, ...], dtype: np.dtype):
+        self.fname = fname
+        self.dataset_path = dataset_path
+        self.shape = shape
+        self.dtype = dtype
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions of the dataset."""
+        return len(self.shape)
+
+    def __getitem__(self, key) -> np.ndarray:
+        """Read a part of the dataset from the file."""
+        with h5py.File(self.fname, "r") as f:
+            return f[self.dataset_path][key]
+
+    def __dask_tokenize__(self):
+        """Tokens identifying the dataset, so that dask can tell when the file changes."""
+        stat = os.stat(self.fname)
+        return (os.path.abspath(self.fname), stat.st_mtime_ns, stat.st_size, self.dataset_path)
+
+
+def _compression_kwargs(compression: str, compression_opts: int = None) -> dict:
+    """Keyword arguments of ``h5py.Group.create_dataset`` for a compression filter."""
+    if compression not in HDF5_COMPRESSIONS:
+        raise FileError(
+            f"Compression '{compression}' not supported, must be one of {HDF5_COMPRESSIONS}."
+        )
+    if compression == "gzip":
+        level = DEFAULT_GZIP_LEVEL if compression_opts is None else compression_opts
+        return dict(compression="gzip", compression_opts=level)
+    if compression == "lzf":
+        return dict(compression="lzf")
+    if not HDF5PLUGIN_AVAILABLE:
+        raise ImportError(
+            "The package 'hdf5plugin' was not found. Please install it to write hdf5 files with "
+            "'blosc' compression. For example: pip install hdf5plugin."
+        )
+    blosc_kwargs = {} if compression_opts is None else dict(clevel=compression_opts)
+    return dict(hdf5plugin.Blosc(**blosc_kwargs))
+
+
+def check_hdf5_write_options(
+    chunks: Union[bool, Dict[str, int]] = None,
+    compression: str = None,
+    compression_opts: int = None,
+) -> None:
+    """Raise an error if the chunking and compression options of hdf5 data arrays are invalid,
+    so that they can be checked before the file is opened for writing."""
+    if compression is not None:
+        _compression_kwargs(compression, compression_opts)
+    if compression_opts is not None:
+        if compression not in ("gzip", "blosc"):
+            raise FileError("'compression_opts' only applies to 'gzip' and 'blosc' compression.")
+        is_int = isinstance(compression_opts, (int, np.integer))
+        if not is_int or isinstance(compression_opts, bool) or not 0 <= compression_opts <= 9:
+            raise FileError(
+                f"'compression_opts' must be an integer from 0 to 9, got {compression_opts}."
+            )
+    if chunks is None or isinstance(chunks, bool):
+        return
+    if isinstance(chunks, dict):
+        # bools are ints, but not chunk sizes
+        chunks_valid = all(
+            isinstance(dim, str)
+            and isinstance(size, (int, np.integer))
+            and not isinstance(size, bool)
+            and size > 0
+            for dim, size in chunks.items()
+        )
+    else:
+        chunks_valid = False
+    if not chunks_valid:
+        raise FileError(
+            "'chunks' must be a bool or a dict of positive chunk sizes by dimension name, "
+            f"got {chunks}."
+        )
+
+
+def _write_gzip_chunks(dataset: h5py.Dataset, values: np.ndarray, num_workers: int) -> None:
+    """Write the values of a chunked dataset with a gzip filter, compressing the chunks in
+    parallel (zlib releases the GIL) and writing them directly, one at a time."""
+    level = dataset.compression_opts
+    chunk_shape = dataset.chunks
+
+    def compress(offset: Tuple[int, ...]) -> Tuple[Tuple[int, ...], bytes]:
+        """Compressed bytes of the chunk at ``offset``, padded to the full chunk shape."""
+        block = values[
+            tuple(slice(start, start + size) for start, size in zip(offset, chunk_shape))
+        ]
+        if block.shape != chunk_shape:
+            block = np.pad(block, [(0, size - num) for size, num in zip(chunk_shape, block.shape)])
+        return offset, zlib.compress(np.ascontiguousarray(block).data, level)
+
+    offsets = product(*(range(0, num, size) for num, size in zip(values.shape, chunk_shape)))
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        for offset, chunk in executor.map(compress, offsets):
+            dataset.id.write_direct_chunk(offset, chunk)
+
+
+def write_hdf5_dataset(
+    group: h5py.Group,
+    name: str,
+    values: Union[np.ndarray, dask.array.Array],
+    chunks: Union[bool, Tuple[int, ...]] = None,
+    compression: str = None,
+    compression_opts: int = None,
+    num_workers: int = 1,
+) -> None:
+    """Write array values to a dataset in an hdf5 group. Dask arrays are written block by block,
+    without loading them fully into memory.
+
+    Parameters
+    ----------
+    group : h5py.Group
+        Group to write the dataset to.
+    name : str
+        Name of the dataset in the group.
+    values : Union[np.ndarray, dask.array.Array]
+        Values to write.
+    chunks : Union[bool, Tuple[int, ...]] = None
+        Chunk shape of the dataset, ``True`` for a shape guessed by h5py. Compressed datasets are
+        always chunked.
+    compression : Literal["gzip", "lzf", "blosc"] = None
+        Compression filter of the dataset. ``"blosc"`` requires the ``hdf5plugin`` package.
+    compression_opts : int = None
+        Compression level of the ``"gzip"`` and ``"blosc"`` filters.
+    num_workers : int = 1
+        Number of threads compressing the chunks of numpy arrays with the ``"gzip"`` filter.
+    """
+    is_dask = isinstance(values, dask.array.Array)
+    if not is_dask:
+        values = np.asarray(values)
+
+    if values.ndim == 0 or values.size == 0:
+        # scalar and empty datasets can't be chunked
+        chunks = compression = None
+    if chunks is None and compression is None and not is_dask:
+        group[name] = values
+        return
+
+    kwargs = {}
+    if compression is not None:
+        kwargs.update(_compression_kwargs(compression, compression_opts))
+        kwargs["chunks"] = True
+    if chunks is not None:
+        kwargs["chunks"] = chunks
+
+    dataset = group.create_dataset(name, shape=values.shape, dtype=values.dtype, **kwargs)
+    if is_dask:
+        dask.array.store(values, dataset, lock=True)
+    elif compression == "gzip" and num_workers > 1 and values.dtype.kind in "biufc":
+        _write_gzip_chunks(dataset, values, num_workers=num_workers)
+    else:
+        dataset[...] = values
+
 
 class DataArray(xr.DataArray):
     """Subclass of ``xr.DataArray`` that requires _dims to match the keys of the coords."""
@@ -127,10 +327,32 @@ class DataArray(xr.DataArray):
         """Absolute value of data array."""
         return abs(self)
 
-    def to_hdf5(self, fname: str, group_path: str) -> None:
-        """Save an xr.DataArray to the hdf5 file with a given path to the group."""
+    def to_hdf5(
+        self,
+        fname: str,
+        group_path: str,
+        chunks: Union[bool, Dict[str, int]] = None,
+        compression: str = None,
+        compression_opts: int = None,
+        num_workers: int = 1,
+    ) -> None:
+        """Save an xr.DataArray to the hdf5 file with a given path to the group. The values can be
+        chunked, with ``chunks`` giving the chunk size along each dimension, and compressed, see
+        :func:`write_hdf5_dataset`."""
+        if isinstance(chunks, dict):
+            chunks = tuple(
+                max(1, min(chunks.get(dim, num), num)) for dim, num in zip(self.dims, self.shape)
+            )
         sub_group = fname.create_group(group_path)
-        sub_group[DATA_ARRAY_VALUE_NAME] = self.values
+        write_hdf5_dataset(
+            sub_group,
+            DATA_ARRAY_VALUE_NAME,
+            self.data,
+            chunks=chunks,
+            compression=compression,
+            compression_opts=compression_opts,
+            num_workers=num_workers,
+        )
         for key, val in self.coords.items():
             # sub_group[key] = val
             if val.dtype == "<U1":
@@ -139,11 +361,20 @@ class DataArray(xr.DataArray):
                 sub_group[key] = val
 
     @classmethod
-    def from_hdf5(cls, fname: str, group_path: str) -> DataArray:
-        """Load an DataArray from an hdf5 file with a given path to the group."""
+    def from_hdf5(cls, fname: str, group_path: str, lazy: bool = False) -> DataArray:
+        """Load an DataArray from an hdf5 file with a given path to the group. If ``lazy``, the
+        values are a dask array that is only read from the file when computed."""
         with h5py.File(fname, "r") as f:
             sub_group = f[group_path]
-            values = np.array(sub_group[DATA_ARRAY_VALUE_NAME])
+            dataset = sub_group[DATA_ARRAY_VALUE_NAME]
+            if lazy:
+                lazy_dataset = LazyHDF5Dataset(
+                    fname=fname, dataset_path=dataset.name, shape=dataset.shape, dtype=dataset.dtype
+                )
+                meta = np.empty((0,) * dataset.ndim, dtype=dataset.dtype)
+                values = dask.array.from_array(lazy_dataset, chunks="auto", lock=True, meta=meta)
+            else:
+                values = np.array(dataset)
             coords = {dim: np.array(sub_group[dim]) for dim in cls._dims}
             for key, val in coords.items():
                 if val.dtype == "O":
@@ -162,8 +393,17 @@ class DataArray(xr.DataArray):
 
     def __hash__(self) -> int:
         """Generate hash value for a :class:.`DataArray` instance, needed for custom components."""
-        token_str = dask.base.tokenize(self)
-        return hash(token_str)
+        hasher = hashlib.blake2b(digest_size=HASH_DIGEST_SIZE)
+        self._update_hasher(hasher)
+        return hash(hasher.digest())
+
+    def _update_hasher(self, hasher: hashlib.blake2b) -> None:
+        """Update a ``hashlib`` hasher with the dims, coordinates and values of the data array."""
+        hasher.update(repr(self.dims).encode())
+        for coord_name in sorted(self.coords):
+            hasher.update(coord_name.encode())
+            update_hasher_with_array(hasher, self.coords[coord_name].values)
+        update_hasher_with_array(hasher, self.values)
 
     def multiply_at(self, value: complex, coord_name: str, indices: List[int]) -> DataArray:
         """Multiply self by value at indices into ."""
@@ -261,6 +501,14 @@ class SpatialDataArray(DataArray):
             Extracted spatial data array.
         """
 
+        inds_list = self._inds_inside(bounds)
+        return self.isel(x=inds_list[0], y=inds_list[1], z=inds_list[2])
+
+    def _inds_inside(self, bounds: Bound) -> List[np.ndarray]:
+        """Indices along each dimension of the minimal amount of data covering ``bounds``, as used
+        in :meth:`.sel_inside`. They only depend on the coordinates, so they can be reused for any
+        data array on the same coordinates."""
+
         inds_list = []
 
         for coord, smin, smax in zip(self.coords.values(), bounds[0], bounds[1]):
@@ -293,7 +541,7 @@ class SpatialDataArray(DataArray):
 
             inds_list.append(comp_inds)
 
-        return self.isel(x=inds_list[0], y=inds_list[1], z=inds_list[2])
+        return inds_list
 
     def does_cover(self, bounds: Bound) -> bool:
         """Check whether data fully covers specified by ``bounds`` spatial region.
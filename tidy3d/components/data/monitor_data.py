@@ -35,10 +35,39 @@ from ...exceptions import SetupError, DataError, Tidy3dNotImplementedError, Vali
 from ...constants import ETA_0, C_0, MICROMETER
 from ...log import log
 
+# Maximum number of field values stacked at once in ``outer_dot``, the frequencies are processed
+# in chunks such that the fields of both datasets at a chunk of frequencies fit within this size.
+OUTER_DOT_CHUNK_SIZE = 2**24
+
 
 Coords1D = ArrayFloat1D
 
 
+def _overlaps(fields_0: List[Numpy], fields_1: List[Numpy], d_area: Numpy) -> Numpy:
+    """Dot products, as in :meth:`.ElectromagneticFieldData.dot`, between all modes of two sets of
+    tangential fields at each frequency. The fields are given in the order ``(E1, E2, H1, H2)``,
+    with dimensions (plane point, frequency, mode), and the fields ``fields_0`` already
+    conjugated if needed. Returns an array with dimensions (frequency, mode_0, mode_1)."""
+
+    # the sum over components of the products of the area-weighted fields 0 and fields 1 in
+    # reverse order, with signs, gives the integrand of the dot product
+    weights = 0.25 * d_area.reshape(-1, 1, 1)
+    values_0 = np.stack([weights * field for field in fields_0])
+    values_1 = np.stack([sign * field for sign, field in zip((1, -1, -1, 1), fields_1[::-1])])
+
+    # points where the integrand is nan are skipped, as in an xarray sum
+    for values in (values_0, values_1):
+        nans = np.any(np.isnan(values), axis=0)
+        if np.any(nans):
+            values[:, nans] = 0
+
+    num_freqs = values_0.shape[2]
+    values_0 = values_0.transpose(2, 3, 0, 1).reshape(num_freqs, values_0.shape[3], -1)
+    values_1 = values_1.transpose(2, 0, 1, 3).reshape(num_freqs, -1, values_1.shape[3])
+    # batched matrix product over frequencies, dispatched to BLAS for each frequency
+    return np.matmul(values_0, values_1)
+
+
 class MonitorData(Dataset, ABC):
     """Abstract base class of objects that store data pertaining to a single :class:`.monitor`."""
 
@@ -665,6 +694,17 @@ class ElectromagneticFieldData(AbstractFieldData, ElectromagneticFieldDataset, A
         h_1 = "H" + dim1
         h_2 = "H" + dim2
 
+        # Keep the points of the plane common to both data, as in xarray operations between them
+        comps = (e_1, e_2, h_1, h_2)
+        aligned = xr.align(
+            *(fields_self[comp] for comp in comps),
+            *(fields_other[comp] for comp in comps),
+            join="inner",
+            exclude=[dim for dim in fields_self[e_1].dims if dim not in tan_dims],
+        )
+        fields_self = dict(zip(comps, aligned[:4]))
+        fields_other = dict(zip(comps, aligned[4:]))
+
         # Prepare array with proper dimensions for the dot product data
         arrays = (fields_self[e_1], fields_other[e_1])
         coords = (arrays[0].coords, arrays[1].coords)
@@ -678,37 +718,33 @@ class ElectromagneticFieldData(AbstractFieldData, ElectromagneticFieldDataset, A
         modes_in_other = "mode_index" in coords[1]
         mode_index_1 = coords[1]["mode_index"].values if modes_in_other else np.zeros(1, dtype=int)
 
+        # Field values flattened over the plane, with the modes along the last dimension
+        d_area = self._diff_area.transpose(*tan_dims).values
+        plane_shape = np.broadcast_shapes(
+            d_area.shape, *(tuple(field.sizes[dim] for dim in tan_dims) for field in arrays)
+        )
+
+        def plane_values(field: DataArray, modes: bool, freqs: np.ndarray) -> np.ndarray:
+            """Values of a field at the given frequencies, flattened over the plane."""
+            field = field.sel(f=freqs)
+            mode_dims = ("mode_index",) if modes else ()
+            values = field.transpose(*tan_dims, "f", *mode_dims).values
+            values = np.broadcast_to(values, plane_shape + values.shape[2:])
+            return values.reshape(-1, freqs.size, values.shape[3] if modes else 1)
+
+        # Overlaps for all mode pairs at once, in chunks of frequencies to bound the memory used by
+        # the stacked field values
         dtype = np.promote_types(arrays[0].dtype, arrays[1].dtype)
         dot = np.empty((f.size, mode_index_0.size, mode_index_1.size), dtype=dtype)
-
-        # Calculate overlap for each common frequency and each mode pair
-        for i, freq in enumerate(f):
-            indexer_self = {"f": freq}
-            indexer_other = {"f": freq}
-            for mi0 in mode_index_0:
-                if modes_in_self:
-                    indexer_self["mode_index"] = mi0
-                e_self_1 = fields_self[e_1].sel(indexer_self, drop=True)
-                e_self_2 = fields_self[e_2].sel(indexer_self, drop=True)
-                h_self_1 = fields_self[h_1].sel(indexer_self, drop=True)
-                h_self_2 = fields_self[h_2].sel(indexer_self, drop=True)
-
-                for mi1 in mode_index_1:
-                    if modes_in_other:
-                        indexer_other["mode_index"] = mi1
-                    e_other_1 = fields_other[e_1].sel(indexer_other, drop=True)
-                    e_other_2 = fields_other[e_2].sel(indexer_other, drop=True)
-                    h_other_1 = fields_other[h_1].sel(indexer_other, drop=True)
-                    h_other_2 = fields_other[h_2].sel(indexer_other, drop=True)
-
-                    # Cross products of fields
-                    e_self_x_h_other = e_self_1 * h_other_2 - e_self_2 * h_other_1
-                    h_self_x_e_other = h_self_1 * e_other_2 - h_self_2 * e_other_1
-
-                    # Integrate over plane
-                    d_area = self._diff_area
-                    integrand = (e_self_x_h_other - h_self_x_e_other) * d_area
-                    dot[i, mi0, mi1] = 0.25 * integrand.sum(dim=d_area.dims)
+        num_values = 4 * np.prod(plane_shape) * (mode_index_0.size + mode_index_1.size)
+        chunk_size = max(1, OUTER_DOT_CHUNK_SIZE // max(num_values, 1))
+        for start in range(0, f.size, chunk_size):
+            freqs = f[start : start + chunk_size]
+            dot[start : start + freqs.size] = _overlaps(
+                [plane_values(fields_self[comp], modes_in_self, freqs) for comp in comps],
+                [plane_values(fields_other[comp], modes_in_other, freqs) for comp in comps],
+                d_area.ravel(),
+            )
 
         coords = {"f": f, "mode_index_0": mode_index_0, "mode_index_1": mode_index_1}
         result = xr.DataArray(dot, coords=coords)
@@ -967,6 +1003,11 @@ class ModeSolverData(ModeSolverDataset, ElectromagneticFieldData):
         elif track_freq == "central":
             f0_ind = num_freqs // 2
 
+        # Overlaps between all modes at neighboring frequencies
+        overlaps = self._neighbor_overlaps()
+        if self.monitor.direction == "-":
+            overlaps *= -1
+
         # Compute sorting order and overlaps with neighboring frequencies
         sorting = -np.ones((num_freqs, num_modes), dtype=int)
         overlap = np.zeros((num_freqs, num_modes))
@@ -977,20 +1018,18 @@ class ModeSolverData(ModeSolverDataset, ElectromagneticFieldData):
         # Sort in two directions from the base frequency
         for step, last_ind in zip([-1, 1], [-1, num_freqs]):
 
-            # Start with the base frequency
-            data_template = self._isel(f=[f0_ind])
-
             # March to lower/higher frequencies
             for freq_id in range(f0_ind + step, last_ind, step):
 
-                # Get next frequency to sort
-                data_to_sort = self._isel(f=[freq_id])
+                # Overlaps of the modes at the previous frequency (rows) with the modes to sort
+                # (columns), the dot product being hermitian
+                if step == 1:
+                    amps = overlaps[freq_id - 1]
+                else:
+                    amps = overlaps[freq_id].conj().T
 
                 # Compute "sorting w.r.t. to neighbor" and overlap values
-
-                sorting_one_mode, amps_one_mode = data_template._find_ordering_one_freq(
-                    data_to_sort, overlap_thresh
-                )
+                sorting_one_mode, amps_one_mode = self._find_ordering_one_freq(amps, overlap_thresh)
 
                 # Transform "sorting w.r.t. neighbor" to "sorting w.r.t. to f0_ind"
                 sorting[freq_id, :] = sorting_one_mode[sorting[freq_id - step, :]]
@@ -1008,9 +1047,6 @@ class ModeSolverData(ModeSolverDataset, ElectromagneticFieldData):
                         f"(overlap: '{overlap[freq_id, mode_ind]:.2f}')."
                     )
 
-                # Reassign for the next iteration
-                data_template = data_to_sort
-
         # Rearrange modes using computed sorting values
         mode_data_sorted = self._reorder_modes(
             sorting=sorting,
@@ -1022,28 +1058,49 @@ class ModeSolverData(ModeSolverDataset, ElectromagneticFieldData):
 
     def _isel(self, **isel_kwargs):
         """Wraps ``xarray.DataArray.isel`` for all data fields that are defined over frequency and
-        mode index. Used in ``overlap_sort`` but not officially supported since for example
-        ``self.monitor.mode_spec`` and ``self.monitor.freqs`` will no longer be matching the
-        newly created data."""
+        mode index. Not officially supported since for example ``self.monitor.mode_spec`` and
+        ``self.monitor.freqs`` will no longer be matching the newly created data."""
 
         update_dict = dict(self._grid_correction_dict, **self.field_components)
         update_dict = {key: field.isel(**isel_kwargs) for key, field in update_dict.items()}
         return self._updated(update=update_dict)
 
+    def _neighbor_overlaps(self) -> Numpy:
+        """Dot products between all modes at each frequency and all modes at the next frequency,
+        with dimensions (frequency, mode_0, mode_1), computed directly on the field arrays in
+        chunks of frequencies."""
+
+        tan_dims = self._tangential_dims
+        fields = self._colocated_tangential_fields
+        comps = ["E" + dim for dim in tan_dims] + ["H" + dim for dim in tan_dims]
+        values = [fields[comp].transpose(*tan_dims, "f", "mode_index").values for comp in comps]
+        d_area = self._diff_area.transpose(*tan_dims).values.ravel()
+        num_freqs, num_modes = values[0].shape[2:]
+
+        overlaps = np.zeros((max(num_freqs - 1, 0), num_modes, num_modes), dtype=np.complex128)
+        chunk_size = max(1, OUTER_DOT_CHUNK_SIZE // max(8 * d_area.size * num_modes, 1))
+        for start in range(0, num_freqs - 1, chunk_size):
+            inds = np.arange(start, min(start + chunk_size, num_freqs - 1))
+            overlaps[inds] = _overlaps(
+                [np.conj(val[:, :, inds]).reshape(-1, inds.size, num_modes) for val in values],
+                [val[:, :, inds + 1].reshape(-1, inds.size, num_modes) for val in values],
+                d_area,
+            )
+        return overlaps
+
     def _find_ordering_one_freq(
         self,
-        data_to_sort: ModeSolverData,
+        amps: Numpy,
         overlap_thresh: float,
     ) -> Tuple[Numpy, Numpy]:
-        """Find new ordering of modes in data_to_sort based on their similarity to own modes."""
+        """Find new ordering of modes to sort based on their overlaps ``amps`` with own modes, own
+        modes being along the rows and modes to sort along the columns."""
 
-        num_modes = self.n_complex.sizes["mode_index"]
+        num_modes = amps.shape[0]
 
         # Current pairs and their overlaps
         pairs = np.arange(num_modes)
-        complex_amps = self.dot(data_to_sort).data.ravel()
-        if self.monitor.direction == "-":
-            complex_amps *= -1
+        complex_amps = np.diagonal(amps).copy()
 
         # Check whether modes already match
         modes_to_sort = np.where(np.abs(complex_amps) < overlap_thresh)[0]
@@ -1051,22 +1108,8 @@ class ModeSolverData(ModeSolverDataset, ElectromagneticFieldData):
         if num_modes_to_sort <= 1:
             return pairs, complex_amps
 
-        # Compute an overlap matrix for modes chosen for sorting
-        amps_reduced = np.zeros((num_modes_to_sort, num_modes_to_sort), dtype=np.complex128)
-
-        # Extract all modes of interest from template data
-        data_template_reduced = self._isel(mode_index=modes_to_sort)
-
-        for i, mode_index in enumerate(modes_to_sort):
-
-            # Get one mode from data_to_sort
-
-            one_mode = data_to_sort._isel(mode_index=[mode_index])
-
-            # Project to all modes of interest from data_template
-            amps_reduced[:, i] = data_template_reduced.dot(one_mode).data.ravel()
-            if self.monitor.direction == "-":
-                amps_reduced[:, i] *= -1
+        # Overlap matrix for modes chosen for sorting
+        amps_reduced = amps[np.ix_(modes_to_sort, modes_to_sort)]
 
         # Find the most similar modes and corresponding overlap values
         pairs_reduced, amps_reduced = self._find_closest_pairs(amps_reduced)
@@ -1106,33 +1149,18 @@ class ModeSolverData(ModeSolverDataset, ElectromagneticFieldData):
         """Rearrange modes for the i-th frequency according to sorting[i, :] and apply phase
         shifts."""
 
-        num_freqs, _ = np.shape(sorting)
-
         # Create new dict with rearranged field components
         update_dict = {}
         for field_name, field in self.field_components.items():
-
-            field_sorted = field.copy()
-
-            # Rearrange modes
-            for freq_id in range(num_freqs):
-                field_sorted.data[..., freq_id, :] = field_sorted.data[
-                    ..., freq_id, sorting[freq_id, :]
-                ]
-
-            # Apply phase shift
-            field_sorted.data = field_sorted.data * np.exp(-1j * phase[None, None, None, :, :])
-
-            update_dict[field_name] = field_sorted
+            # Rearrange modes and apply phase shift
+            field_sorted = np.take_along_axis(field.data, sorting[None, None, None], axis=-1)
+            field_sorted *= np.exp(-1j * phase[None, None, None, :, :])
+            update_dict[field_name] = field.copy(data=field_sorted)
 
         # Rearrange data over f and mode_index
         data_dict = dict(**self._grid_correction_dict, n_complex=self.n_complex)
         for key, data in data_dict.items():
-            update_dict[key] = data.copy()
-            for freq_id in range(num_freqs):
-                update_dict[key].data[freq_id, :] = update_dict[key].data[
-                    freq_id, sorting[freq_id, :]
-                ]
+            update_dict[key] = data.copy(data=np.take_along_axis(data.data, sorting, axis=-1))
 
         # Update mode_spec in the monitor
         mode_spec = self.monitor.mode_spec.copy(update=dict(track_freq=track_freq))
@@ -5,13 +5,16 @@ from typing import Dict, Callable, Tuple
 import xarray as xr
 import pydantic.v1 as pd
 import numpy as np
+import dask.array
 
 from .monitor_data import MonitorDataTypes, MonitorDataType, AbstractFieldData, FieldTimeData
+from .data_array import DataArray
 from ..base import Tidy3dBaseModel
 from ..simulation import Simulation
 from ..boundary import BlochBoundary
 from ..source import TFSF
-from ..types import Ax, Axis, annotate_type, FieldVal, PlotScale, ColormapType
+from ..types import Ax, Axis, annotate_type, FieldVal, PlotScale, ColormapType, Bound
+from ..types import ArrayFloat1D
 from ..viz import equal_aspect, add_ax_if_none
 from ...exceptions import DataError, Tidy3dKeyError, ValidationError
 from ...log import log
@@ -88,10 +91,24 @@ class SimulationData(Tidy3dBaseModel):
     )
 
     def __getitem__(self, monitor_name: str) -> MonitorDataType:
-        """Get a :class:`.MonitorData` by name. Apply symmetry if applicable."""
-        monitor_data = self.monitor_data[monitor_name]
+        """Get a :class:`.MonitorData` by name. Apply symmetry if applicable. If the data was
+        loaded with ``lazy=True``, only the data of this monitor is read from the file."""
+        monitor_data = self._load_data_arrays(self.monitor_data[monitor_name])
         return monitor_data.symmetry_expanded_copy
 
+    @staticmethod
+    def _load_data_arrays(monitor_data: MonitorDataType) -> MonitorDataType:
+        """Copy of ``monitor_data`` with the values of lazily loaded data arrays read into memory,
+        or ``monitor_data`` itself if all of its data is in memory already."""
+        update = {
+            field_name: val.compute()
+            for field_name, val in monitor_data
+            if isinstance(val, DataArray) and isinstance(val.data, dask.array.Array)
+        }
+        if not update:
+            return monitor_data
+        return monitor_data._updated(update)
+
     @property
     def monitor_data(self) -> Dict[str, MonitorDataType]:
         """Dictionary mapping monitor name to its associated :class:`.MonitorData`."""
@@ -189,15 +206,57 @@ class SimulationData(Tidy3dBaseModel):
 
         return self.copy(update=dict(simulation=simulation, data=data_normalized))
 
-    def load_field_monitor(self, monitor_name: str) -> AbstractFieldData:
-        """Load monitor and raise exception if not a field monitor."""
-        mon_data = self[monitor_name]
+    def load_field_monitor(
+        self, monitor_name: str, bounds: Bound = None, freqs: ArrayFloat1D = None
+    ) -> AbstractFieldData:
+        """Load monitor and raise exception if not a field monitor. Optionally, only load the
+        fields in a spatial region and at a set of frequencies. If the data was loaded with
+        ``lazy=True``, only the selected part of the fields is then read from the file.
+
+        Parameters
+        ----------
+        monitor_name : str
+            Name of the field monitor used in the original :class:`Simulation`.
+        bounds : Tuple[float, float, float], Tuple[float, float float] = None
+            Min and max bounds packaged as ``(minx, miny, minz), (maxx, maxy, maxz)`` of the region
+            to load. The fields at the closest coordinates outside of the region are included.
+        freqs : ArrayFloat1D = None
+            Frequencies to load, the closest frequencies in the data are selected.
+            Only for frequency-domain field data.
+
+        Returns
+        -------
+        :class:`.AbstractFieldData`
+            Field data of the monitor. Quantities that need the full monitor grid, such as flux,
+            are not available on the data of a region.
+        """
+        mon_data = self.monitor_data[monitor_name]
         if not isinstance(mon_data, AbstractFieldData):
             raise DataError(
                 f"data for monitor '{monitor_name}' does not contain field data "
                 f"as it is a `{type(mon_data)}`."
             )
-        return mon_data
+        if bounds is None and freqs is None:
+            return self[monitor_name]
+
+        if freqs is not None and isinstance(mon_data, FieldTimeData):
+            raise DataError(f"Can't select frequencies of time-domain monitor '{monitor_name}'.")
+
+        mon_data = mon_data.symmetry_expanded_copy
+        update = {}
+        for field_name, field in mon_data.field_components.items():
+            if bounds is not None:
+                region_inds = {}
+                for dim, smin, smax in zip("xyz", *bounds):
+                    coords = field.coords[dim].values
+                    ind_min = max(np.searchsorted(coords, smin, side="right") - 1, 0)
+                    ind_max = min(np.searchsorted(coords, smax, side="left"), len(coords) - 1)
+                    region_inds[dim] = slice(ind_min, max(ind_min, ind_max) + 1)
+                field = field.isel(region_inds)
+            if freqs is not None:
+                field = field.sel(f=freqs, method="nearest")
+            update[field_name] = field.compute()
+        return mon_data._updated(update)
 
     def at_centers(self, field_monitor_name: str) -> xr.Dataset:
         """Return xarray.Dataset representation of field monitor data colocated at Yee cell centers.
@@ -2,6 +2,8 @@
 """
 from __future__ import annotations
 from typing import Dict, Tuple, Union, List
+from multiprocessing import Pool
+import functools
 import numpy as np
 import xarray as xr
 import pydantic.v1 as pydantic
@@ -27,6 +29,14 @@ from ..log import get_logging_console
 # Default number of points per wavelength in the background medium to use for resampling fields.
 PTS_PER_WVL = 10
 
+# Maximum number of array elements allocated at once when computing far fields for a chunk
+# of observation angles.
+FAR_FIELD_CHUNK_SIZE = 2**24
+
+# Maximum number of (point, x, y, z, frequency) elements per batch of observation points when
+# computing exact projections. Several temporaries of this size are allocated for each batch.
+EXACT_PROJECTION_CHUNK_SIZE = 2**20
+
 # Numpy float array and related array types
 
 ArrayLikeN2F = Union[float, Tuple[float, ...], ArrayComplex4D]
@@ -334,6 +344,16 @@ class FieldProjector(Tidy3dBaseModel):
         """Trapezoidal integration in two dimensions."""
         return np.trapz(np.trapz(np.squeeze(function) * phase, pts_u, axis=0), pts_v, axis=0)
 
+    @staticmethod
+    def trapezoid_weights(pts: np.ndarray) -> np.ndarray:
+        """Weights ``w`` such that ``np.sum(w * f)`` equals ``np.trapz(f, pts)``."""
+        weights = np.zeros(len(pts))
+        if len(pts) > 1:
+            half_steps = np.diff(pts) / 2
+            weights[:-1] += half_steps
+            weights[1:] += half_steps
+        return weights
+
     def _far_fields_for_surface(
         self,
         frequency: float,
@@ -388,50 +408,59 @@ class FieldProjector(Tidy3dBaseModel):
         sin_phi = np.sin(phi)
         cos_phi = np.cos(phi)
 
-        J = np.zeros((3, len(theta), len(phi)), dtype=complex)
-        M = np.zeros_like(J)
-
-        phase = [None] * 3
         propagation_factor = -1j * AbstractFieldProjectionData.wavenumber(
             medium=self.medium, frequency=frequency
         )
 
-        def integrate_for_one_theta(i_th: int):
-            """Perform integration for a given theta angle index"""
-
-            for j_ph in np.arange(len(phi)):
-
-                phase[0] = np.exp(propagation_factor * pts[0] * sin_theta[i_th] * cos_phi[j_ph])
-                phase[1] = np.exp(propagation_factor * pts[1] * sin_theta[i_th] * sin_phi[j_ph])
-                phase[2] = np.exp(propagation_factor * pts[2] * cos_theta[i_th])
-
-                phase_ij = phase[idx_u][:, None] * phase[idx_v][None, :] * phase[idx_w]
-
-                J[idx_u, i_th, j_ph] = self.integrate_2d(
-                    currents_f[f"E{cmp_1}"].values, phase_ij, pts[idx_u], pts[idx_v]
-                )
-
-                J[idx_v, i_th, j_ph] = self.integrate_2d(
-                    currents_f[f"E{cmp_2}"].values, phase_ij, pts[idx_u], pts[idx_v]
-                )
-
-                M[idx_u, i_th, j_ph] = self.integrate_2d(
-                    currents_f[f"H{cmp_1}"].values, phase_ij, pts[idx_u], pts[idx_v]
-                )
-
-                M[idx_v, i_th, j_ph] = self.integrate_2d(
-                    currents_f[f"H{cmp_2}"].values, phase_ij, pts[idx_u], pts[idx_v]
-                )
-
-        if len(theta) < 2:
-            integrate_for_one_theta(0)
-        else:
-            for i_th in track(
-                np.arange(len(theta)),
+        # direction cosines of all observation angles, flattened over (theta, phi)
+        directions = np.stack(
+            [
+                (sin_theta[:, None] * cos_phi[None, :]).ravel(),
+                (sin_theta[:, None] * sin_phi[None, :]).ravel(),
+                np.repeat(cos_theta, len(phi)),
+            ]
+        )
+        num_angles = directions.shape[1]
+
+        # the four tangential currents, stacked into a single (4, Nu, Nv) array
+        pts_u, pts_v = pts[idx_u], pts[idx_v]
+        currents_uv = np.stack(
+            [
+                currents_f[name].values.reshape(len(pts_u), len(pts_v))
+                for name in (f"E{cmp_1}", f"E{cmp_2}", f"H{cmp_1}", f"H{cmp_2}")
+            ]
+        )
+        weights_u = self.trapezoid_weights(pts_u)
+        weights_v = self.trapezoid_weights(pts_v)
+
+        # the phase is separable along u and v, so the 2D integral for all angles in a chunk
+        # reduces to two matrix products with (num_angles, Nu) and (num_angles, Nv) phase matrices
+        chunk_size = max(1, FAR_FIELD_CHUNK_SIZE // (len(pts_u) + 5 * len(pts_v)))
+        chunk_starts = range(0, num_angles, chunk_size)
+        if len(chunk_starts) > 1:
+            chunk_starts = track(
+                chunk_starts,
                 description=f"Processing surface monitor '{surface.monitor.name}'...",
                 console=get_logging_console(),
-            ):
-                integrate_for_one_theta(i_th)
+            )
+
+        integrals = np.zeros((4, num_angles), dtype=complex)
+        for chunk_start in chunk_starts:
+            chunk = slice(chunk_start, chunk_start + chunk_size)
+            phase_u = weights_u * np.exp(
+                propagation_factor * np.outer(directions[idx_u, chunk], pts_u)
+            )
+            phase_v = weights_v * np.exp(
+                propagation_factor * np.outer(directions[idx_v, chunk], pts_v)
+            )
+            phase_w = np.exp(propagation_factor * directions[idx_w, chunk] * pts[idx_w][0])
+            integrand_v = np.einsum("au,cuv->cav", phase_u, currents_uv)
+            integrals[:, chunk] = np.einsum("cav,av->ca", integrand_v, phase_v) * phase_w
+
+        integrals = integrals.reshape(4, len(theta), len(phi))
+        J = np.zeros((3, len(theta), len(phi)), dtype=complex)
+        M = np.zeros_like(J)
+        J[idx_u], J[idx_v], M[idx_u], M[idx_v] = integrals
 
         cos_th_cos_phi = cos_theta[:, None] * cos_phi[None, :]
         cos_th_sin_phi = cos_theta[:, None] * sin_phi[None, :]
@@ -460,7 +489,7 @@ class FieldProjector(Tidy3dBaseModel):
         return Er, Etheta, Ephi, Hr, Htheta, Hphi
 
     def project_fields(
-        self, proj_monitor: AbstractFieldProjectionMonitor
+        self, proj_monitor: AbstractFieldProjectionMonitor, num_proc: int = 1
     ) -> AbstractFieldProjectionData:
         """Compute projected fields.
 
@@ -469,6 +498,9 @@ class FieldProjector(Tidy3dBaseModel):
         proj_monitor : :class:`.AbstractFieldProjectionMonitor`
             Instance of :class:`.AbstractFieldProjectionMonitor` defining the projection
             observation grid.
+        num_proc : int = 1
+            Number of processes over which batches of observation points are distributed when
+            computing exact projections (``far_field_approx=False``).
 
         Returns
         -------
@@ -476,13 +508,13 @@ class FieldProjector(Tidy3dBaseModel):
             Data structure with ``Er``, ``Etheta``, ``Ephi``, ``Hr``, ``Htheta``, ``Hphi``.
         """
         if isinstance(proj_monitor, FieldProjectionAngleMonitor):
-            return self._project_fields_angular(proj_monitor)
+            return self._project_fields_angular(proj_monitor, num_proc=num_proc)
         if isinstance(proj_monitor, FieldProjectionCartesianMonitor):
-            return self._project_fields_cartesian(proj_monitor)
-        return self._project_fields_kspace(proj_monitor)
+            return self._project_fields_cartesian(proj_monitor, num_proc=num_proc)
+        return self._project_fields_kspace(proj_monitor, num_proc=num_proc)
 
     def _project_fields_angular(
-        self, monitor: FieldProjectionAngleMonitor
+        self, monitor: FieldProjectionAngleMonitor, num_proc: int = 1
     ) -> FieldProjectionAngleData:
         """Compute projected fields on an angle-based grid in spherical coordinates.
 
@@ -491,6 +523,8 @@ class FieldProjector(Tidy3dBaseModel):
         monitor : :class:`.FieldProjectionAngleMonitor`
             Instance of :class:`.FieldProjectionAngleMonitor` defining the projection
             observation grid.
+        num_proc : int = 1
+            Number of processes to use for exact projections.
 
         Returns
         -------
@@ -522,22 +556,12 @@ class FieldProjector(Tidy3dBaseModel):
                     for field, _field in zip(fields, _fields):
                         field[..., idx_f] += _field * phase[idx_f]
             else:
-                iter_coords = [
-                    ([_theta, _phi], [i, j])
-                    for i, _theta in enumerate(theta)
-                    for j, _phi in enumerate(phi)
-                ]
-                for (_theta, _phi), (i, j) in track(
-                    iter_coords,
-                    description=f"Processing surface monitor '{surface.monitor.name}'...",
-                    console=get_logging_console(),
-                ):
-                    _x, _y, _z = monitor.sph_2_car(monitor.proj_distance, _theta, _phi)
-                    _fields = self._fields_for_surface_exact(
-                        _x, _y, _z, surface, self.currents[surface.monitor.name]
-                    )
-                    for field, _field in zip(fields, _fields):
-                        field[0, i, j, :] += _field
+                _x, _y, _z = monitor.sph_2_car(monitor.proj_distance, theta[:, None], phi[None, :])
+                _fields = self._fields_for_surface_exact_batched(
+                    _x, _y, _z, surface, num_proc=num_proc
+                )
+                for field, _field in zip(fields, _fields):
+                    field[0] += _field.reshape(field.shape[1:])
 
         coords = {"r": np.atleast_1d(monitor.proj_distance), "theta": theta, "phi": phi, "f": freqs}
         fields = {
@@ -549,7 +573,7 @@ class FieldProjector(Tidy3dBaseModel):
         )
 
     def _project_fields_cartesian(
-        self, monitor: FieldProjectionCartesianMonitor
+        self, monitor: FieldProjectionCartesianMonitor, num_proc: int = 1
     ) -> FieldProjectionCartesianData:
         """Compute projected fields on a Cartesian grid in spherical coordinates.
 
@@ -558,6 +582,8 @@ class FieldProjector(Tidy3dBaseModel):
         monitor : :class:`.FieldProjectionCartesianMonitor`
             Instance of :class:`.FieldProjectionCartesianMonitor` defining the projection
             observation grid.
+        num_proc : int = 1
+            Number of processes to use for exact projections.
 
         Returns
         -------
@@ -578,37 +604,38 @@ class FieldProjector(Tidy3dBaseModel):
 
         wavenumber = AbstractFieldProjectionData.wavenumber(medium=self.medium, frequency=freqs)
 
-        # Zip together all combinations of observation points for better progress tracking
-        iter_coords = [
-            ([_x, _y, _z], [i, j, k])
-            for i, _x in enumerate(x)
-            for j, _y in enumerate(y)
-            for k, _z in enumerate(z)
-        ]
-
-        for (_x, _y, _z), (i, j, k) in track(
-            iter_coords, description="Computing projected fields", console=get_logging_console()
-        ):
-            r, theta, phi = monitor.car_2_sph(_x, _y, _z)
-            phase = np.atleast_1d(
-                AbstractFieldProjectionData.propagation_phase(dist=r, k=wavenumber)
-            )
+        if monitor.far_field_approx:
+            # Zip together all combinations of observation points for better progress tracking
+            iter_coords = [
+                ([_x, _y, _z], [i, j, k])
+                for i, _x in enumerate(x)
+                for j, _y in enumerate(y)
+                for k, _z in enumerate(z)
+            ]
 
-            for surface in self.surfaces:
+            for (_x, _y, _z), (i, j, k) in track(
+                iter_coords, description="Computing projected fields", console=get_logging_console()
+            ):
+                r, theta, phi = monitor.car_2_sph(_x, _y, _z)
+                phase = np.atleast_1d(
+                    AbstractFieldProjectionData.propagation_phase(dist=r, k=wavenumber)
+                )
 
-                if monitor.far_field_approx:
+                for surface in self.surfaces:
                     for idx_f, frequency in enumerate(freqs):
                         _fields = self._far_fields_for_surface(
                             frequency, theta, phi, surface, self.currents[surface.monitor.name]
                         )
                         for field, _field in zip(fields, _fields):
                             field[i, j, k, idx_f] += _field * phase[idx_f]
-                else:
-                    _fields = self._fields_for_surface_exact(
-                        _x, _y, _z, surface, self.currents[surface.monitor.name]
-                    )
-                    for field, _field in zip(fields, _fields):
-                        field[i, j, k, :] += _field
+        else:
+            _x, _y, _z = np.meshgrid(x, y, z, indexing="ij")
+            for surface in self.surfaces:
+                _fields = self._fields_for_surface_exact_batched(
+                    _x, _y, _z, surface, num_proc=num_proc
+                )
+                for field, _field in zip(fields, _fields):
+                    field += _field.reshape(field.shape)
 
         coords = {"x": x, "y": y, "z": z, "f": freqs}
         fields = {
@@ -620,7 +647,7 @@ class FieldProjector(Tidy3dBaseModel):
         )
 
     def _project_fields_kspace(
-        self, monitor: FieldProjectionKSpaceMonitor
+        self, monitor: FieldProjectionKSpaceMonitor, num_proc: int = 1
     ) -> FieldProjectionKSpaceData:
         """Compute projected fields on a k-space grid in spherical coordinates.
 
@@ -629,6 +656,8 @@ class FieldProjector(Tidy3dBaseModel):
         monitor : :class:`.FieldProjectionKSpaceMonitor`
             Instance of :class:`.FieldProjectionKSpaceMonitor` defining the projection
             observation grid.
+        num_proc : int = 1
+            Number of processes to use for exact projections.
 
         Returns
         -------
@@ -648,31 +677,33 @@ class FieldProjector(Tidy3dBaseModel):
             AbstractFieldProjectionData.propagation_phase(dist=monitor.proj_distance, k=k)
         )
 
-        # Zip together all combinations of observation points for better progress tracking
-        iter_coords = [([_ux, _uy], [i, j]) for i, _ux in enumerate(ux) for j, _uy in enumerate(uy)]
-
-        for (_ux, _uy), (i, j) in track(
-            iter_coords, description="Computing projected fields", console=get_logging_console()
-        ):
-            theta, phi = monitor.kspace_2_sph(_ux, _uy, monitor.proj_axis)
+        if monitor.far_field_approx:
+            # Zip together all combinations of observation points for better progress tracking
+            iter_coords = [
+                ([_ux, _uy], [i, j]) for i, _ux in enumerate(ux) for j, _uy in enumerate(uy)
+            ]
 
-            for surface in self.surfaces:
+            for (_ux, _uy), (i, j) in track(
+                iter_coords, description="Computing projected fields", console=get_logging_console()
+            ):
+                theta, phi = monitor.kspace_2_sph(_ux, _uy, monitor.proj_axis)
 
-                if monitor.far_field_approx:
+                for surface in self.surfaces:
                     for idx_f, frequency in enumerate(freqs):
                         _fields = self._far_fields_for_surface(
                             frequency, theta, phi, surface, self.currents[surface.monitor.name]
                         )
                         for field, _field in zip(fields, _fields):
                             field[i, j, 0, idx_f] += _field * phase[idx_f]
-
-                else:
-                    _x, _y, _z = monitor.sph_2_car(monitor.proj_distance, theta, phi)
-                    _fields = self._fields_for_surface_exact(
-                        _x, _y, _z, surface, self.currents[surface.monitor.name]
-                    )
-                    for field, _field in zip(fields, _fields):
-                        field[i, j, 0, :] += _field
+        else:
+            theta, phi = monitor.kspace_2_sph(ux[:, None], uy[None, :], monitor.proj_axis)
+            _x, _y, _z = monitor.sph_2_car(monitor.proj_distance, theta, phi)
+            for surface in self.surfaces:
+                _fields = self._fields_for_surface_exact_batched(
+                    _x, _y, _z, surface, num_proc=num_proc
+                )
+                for field, _field in zip(fields, _fields):
+                    field[:, :, 0] += _field.reshape(len(ux), len(uy), len(freqs))
 
         coords = {
             "ux": np.array(monitor.ux),
@@ -690,52 +721,116 @@ class FieldProjector(Tidy3dBaseModel):
 
     """Exact projections"""
 
-    def _fields_for_surface_exact(
+    def _fields_for_surface_exact_batched(
         self,
-        x: float,
-        y: float,
-        z: float,
+        x: np.ndarray,
+        y: np.ndarray,
+        z: np.ndarray,
+        surface: FieldProjectionSurface,
+        num_proc: int = 1,
+    ) -> List[np.ndarray]:
+        """Compute exact projected fields at all observation points ``zip(x, y, z)``, evaluated
+        in batches of points that are optionally distributed over ``num_proc`` processes.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            Observation point x-coordinates (microns) relative to the local origin.
+        y : np.ndarray
+            Observation point y-coordinates (microns) relative to the local origin.
+        z : np.ndarray
+            Observation point z-coordinates (microns) relative to the local origin.
+        surface: :class:`FieldProjectionSurface`
+            :class:`FieldProjectionSurface` object to use as source of near field.
+        num_proc : int = 1
+            Number of processes to use. Batches are computed sequentially if ``1`` or ``None``.
+
+        Returns
+        -------
+        List[np.ndarray]
+            ``Er``, ``Etheta``, ``Ephi``, ``Hr``, ``Htheta``, ``Hphi`` projected fields with
+            shape ``(num_points, num_frequencies)``, with points ordered as in ``np.ravel(x)``.
+        """
+
+        currents = self.currents[surface.monitor.name]
+        points = np.stack([np.ravel(coord) for coord in np.broadcast_arrays(x, y, z)])
+        num_points = points.shape[1]
+
+        # bound the size of the (point, x, y, z, frequency) arrays allocated for each batch
+        num_elements = currents.x.size * currents.y.size * currents.z.size * currents.f.size
+        batch_size = max(1, EXACT_PROJECTION_CHUNK_SIZE // num_elements)
+        batches = [points[:, i : i + batch_size] for i in range(0, num_points, batch_size)]
+
+        compute_batch = functools.partial(
+            self._fields_for_surface_exact,
+            surface=surface,
+            currents=currents,
+            frequencies=self.frequencies,
+            medium=self.medium,
+        )
+        progress_kwargs = dict(
+            description=f"Processing surface monitor '{surface.monitor.name}'...",
+            total=len(batches),
+            console=get_logging_console(),
+        )
+
+        if num_proc is not None and num_proc > 1 and len(batches) > 1:
+            with Pool(min(num_proc, len(batches))) as pool:
+                results = list(track(pool.imap(compute_batch, batches), **progress_kwargs))
+        else:
+            results = list(track(map(compute_batch, batches), **progress_kwargs))
+
+        return [np.concatenate(fields, axis=0) for fields in zip(*results)]
+
+    @staticmethod
+    def _fields_for_surface_exact(
+        points: np.ndarray,
         surface: FieldProjectionSurface,
         currents: xr.Dataset,
+        frequencies: List[float],
+        medium: MediumType,
     ):
-        """Compute projected fields in spherical coordinates at a given projection point on a
-        Cartesian grid for a given set of surface currents using the exact homogeneous medium
+        """Compute projected fields in spherical coordinates at a batch of projection points on
+        a Cartesian grid for a given set of surface currents using the exact homogeneous medium
         Green's function without geometric approximations.
 
         Parameters
         ----------
-        x : float
-            Observation point x-coordinate (microns) relative to the local origin.
-        y : float
-            Observation point y-coordinate (microns) relative to the local origin.
-        z : float
-            Observation point z-coordinate (microns) relative to the local origin.
+        points : np.ndarray
+            Array of shape ``(3, num_points)`` with the observation point coordinates (microns)
+            relative to the local origin.
         surface: :class:`FieldProjectionSurface`
             :class:`FieldProjectionSurface` object to use as source of near field.
         currents : xarray.Dataset
             xarray Dataset containing surface currents associated with the surface monitor.
+        frequencies : List[float]
+            Frequencies at which to compute the projected fields.
+        medium : :class:`.MediumType`
+            Background medium through which to project fields.
 
         Returns
         -------
         tuple(np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray)
-            ``Er``, ``Etheta``, ``Ephi``, ``Hr``, ``Htheta``, ``Hphi`` projected fields for
-            each frequency.
+            ``Er``, ``Etheta``, ``Ephi``, ``Hr``, ``Htheta``, ``Hphi`` projected fields with
+            shape ``(num_points, num_frequencies)``.
         """
 
-        freqs = np.array(self.frequencies)
-        i_omega = 1j * 2.0 * np.pi * freqs[None, None, None, :]
-        wavenumber = AbstractFieldProjectionData.wavenumber(frequency=freqs, medium=self.medium)
-        wavenumber = wavenumber[None, None, None, :]  # add space dimensions
+        freqs = np.array(frequencies)
+        i_omega = 1j * 2.0 * np.pi * freqs[None, None, None, None, :]
+        wavenumber = AbstractFieldProjectionData.wavenumber(frequency=freqs, medium=medium)
+        wavenumber = wavenumber[None, None, None, None, :]  # add point and space dimensions
 
-        eps_complex = self.medium.eps_model(frequency=freqs)
-        epsilon = EPSILON_0 * eps_complex[None, None, None, :]
+        eps_complex = medium.eps_model(frequency=freqs)
+        epsilon = EPSILON_0 * eps_complex[None, None, None, None, :]
 
         # source points
         pts = [currents[name].values for name in ["x", "y", "z"]]
 
         # transform the coordinate system so that the origin is at the source point
         # then the observation points in the new system are:
-        x_new, y_new, z_new = (pt_obs - pt_src for pt_src, pt_obs in zip(pts, [x, y, z]))
+        x_new, y_new, z_new = (
+            pt_obs[:, None] - pt_src[None, :] for pt_src, pt_obs in zip(pts, points)
+        )
 
         # tangential source components to use
         idx_w, idx_uv = surface.monitor.pop_axis((0, 1, 2), axis=surface.axis)
@@ -757,7 +852,9 @@ class FieldProjector(Tidy3dBaseModel):
 
         # observation point in the new spherical system
         r, theta_obs, phi_obs = surface.monitor.car_2_sph(
-            x_new[:, None, None, None], y_new[None, :, None, None], z_new[None, None, :, None]
+            x_new[:, :, None, None, None],
+            y_new[:, None, :, None, None],
+            z_new[:, None, None, :, None],
         )
 
         # angle terms
@@ -840,16 +937,28 @@ class FieldProjector(Tidy3dBaseModel):
             for f, grad_div_f, curl_a in zip(F, grad_div_F, curl_A)
         )
 
-        # integrate over the surface
-        e_x = self.integrate_2d(e_x_integrand, 1.0, pts[idx_u], pts[idx_v])
-        e_y = self.integrate_2d(e_y_integrand, 1.0, pts[idx_u], pts[idx_v])
-        e_z = self.integrate_2d(e_z_integrand, 1.0, pts[idx_u], pts[idx_v])
-        h_x = self.integrate_2d(h_x_integrand, 1.0, pts[idx_u], pts[idx_v])
-        h_y = self.integrate_2d(h_y_integrand, 1.0, pts[idx_u], pts[idx_v])
-        h_z = self.integrate_2d(h_z_integrand, 1.0, pts[idx_u], pts[idx_v])
+        # integrate over the surface with trapezoidal weights along the tangential directions
+        weights = [np.ones(len(pts[idx_w]))] * 3
+        weights[idx_u] = FieldProjector.trapezoid_weights(pts[idx_u])
+        weights[idx_v] = FieldProjector.trapezoid_weights(pts[idx_v])
+        weights = np.einsum("i,j,k->ijk", *weights)[None, :, :, :, None]
+
+        e_x, e_y, e_z, h_x, h_y, h_z = (
+            np.sum(integrand * weights, axis=(1, 2, 3))
+            for integrand in (
+                e_x_integrand,
+                e_y_integrand,
+                e_z_integrand,
+                h_x_integrand,
+                h_y_integrand,
+                h_z_integrand,
+            )
+        )
 
-        # observation point in the original spherical system
-        _, theta_obs, phi_obs = surface.monitor.car_2_sph(x, y, z)
+        # observation points in the original spherical system
+        _, theta_obs, phi_obs = surface.monitor.car_2_sph(*points)
+        theta_obs = theta_obs[:, None]
+        phi_obs = phi_obs[:, None]
 
         # convert fields to the original spherical system
         e_r, e_theta, e_phi = surface.monitor.car_2_sph_field(e_x, e_y, e_z, theta_obs, phi_obs)
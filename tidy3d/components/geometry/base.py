@@ -56,18 +56,22 @@ class Geometry(Tidy3dBaseModel, ABC):
             ``True`` for every point that is inside the geometry.
         """
 
-        def point_inside(x: float, y: float, z: float):
-            """Returns ``True`` if a single point ``(x, y, z)`` is inside."""
-            shapes_intersect = self.intersections_plane(z=z)
-            loc = shapely.Point(x, y)
-            return any(shape.contains(loc) for shape in shapes_intersect)
-
         arrays = tuple(map(np.array, (x, y, z)))
         self._ensure_equal_shape(*arrays)
+        x_flat, y_flat, z_flat = map(np.ravel, arrays)
         inside = np.zeros((arrays[0].size,), dtype=bool)
-        arrays_flat = map(np.ravel, arrays)
-        for ipt, args in enumerate(zip(*arrays_flat)):
-            inside[ipt] = point_inside(*args)
+
+        # group points by plane so that each cross section is only computed once
+        z_unique, z_inverse, z_counts = np.unique(z_flat, return_inverse=True, return_counts=True)
+        inds_sorted = np.argsort(z_inverse, kind="stable")
+        inds_planes = np.split(inds_sorted, np.cumsum(z_counts)[:-1])
+        for z_plane, inds_plane in zip(z_unique, inds_planes):
+            x_plane = x_flat[inds_plane]
+            y_plane = y_flat[inds_plane]
+            inside_plane = np.zeros(inds_plane.size, dtype=bool)
+            for shape in self.intersections_plane(z=z_plane):
+                inside_plane |= shapely.contains_xy(shape, x_plane, y_plane)
+            inside[inds_plane] = inside_plane
         return inside.reshape(arrays[0].shape)
 
     @staticmethod
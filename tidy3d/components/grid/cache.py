@@ -0,0 +1,79 @@
+"""Process-wide cache of the grids made by :meth:`.GridSpec.make_grid`, so that simulations with the
+same structures, grid specification and boundaries, for example in a sweep over sources or
+monitors, are meshed only once."""
+from __future__ import annotations
+
+from collections import OrderedDict, namedtuple
+from threading import Lock
+from typing import Any, Callable, Hashable
+
+# default maximum number of grids kept in the cache
+DEFAULT_GRID_CACHE_SIZE = 32
+
+GridCacheInfo = namedtuple("GridCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class GridCache:
+    """Bounded least recently used cache, with hit and miss counters for profiling.
+
+    Example
+    -------
+    >>> cache = GridCache(maxsize=2)
+    >>> cache.get(key="a", make=lambda: 1)
+    1
+    >>> cache.get(key="a", make=lambda: 2)
+    1
+    >>> cache.cache_info()
+    GridCacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_GRID_CACHE_SIZE):
+        self._items = OrderedDict()
+        self._lock = Lock()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, make: Callable[[], Any]) -> Any:
+        """Value stored for ``key``, or computed with ``make()`` and stored if not present."""
+        with self._lock:
+            if key in self._items:
+                self.hits += 1
+                self._items.move_to_end(key)
+                return self._items[key]
+            self.misses += 1
+
+        # computed outside of the lock, so that other threads are not blocked meanwhile
+        value = make()
+
+        with self._lock:
+            self._items[key] = value
+            self._evict()
+        return value
+
+    def resize(self, maxsize: int) -> None:
+        """Change the maximum number of stored values, ``0`` disables the cache."""
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used values in excess of ``maxsize``."""
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def cache_info(self) -> GridCacheInfo:
+        """Number of hits and misses, maximum and current number of stored values."""
+        with self._lock:
+            return GridCacheInfo(self.hits, self.misses, self.maxsize, len(self._items))
+
+    def cache_clear(self) -> None:
+        """Remove all stored values and reset the counters."""
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# cache shared by all the simulations in the process, size set by ``td.config.grid_cache_size``
+GRID_CACHE = GridCache()
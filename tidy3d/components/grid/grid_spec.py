@@ -3,15 +3,18 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from typing import Tuple, List, Union
+import hashlib
 
 import numpy as np
 import pydantic.v1 as pd
 
 from .grid import Coords1D, Coords, Grid
 from .mesher import GradedMesher, MesherType
+from .cache import GRID_CACHE
 from ..base import Tidy3dBaseModel
 from ..types import Axis, Symmetry, annotate_type, TYPE_TAG_STR
 from ..source import SourceType
+from ..data.data_array import HASH_DIGEST_SIZE
 from ..structure import Structure, StructureType
 from ..geometry.base import Box
 from ...log import log
@@ -521,7 +524,9 @@ class GridSpec(Tidy3dBaseModel):
         sources: List[SourceType],
         num_pml_layers: List[Tuple[pd.NonNegativeInt, pd.NonNegativeInt]],
     ) -> Grid:
-        """Make the entire simulation grid based on some simulation parameters.
+        """Make the entire simulation grid based on some simulation parameters. The grids are
+        stored in a process-wide least recently used cache, whose size is set by
+        ``td.config.grid_cache_size``, and reused for identical parameters.
 
         Parameters
         ----------
@@ -562,6 +567,61 @@ class GridSpec(Tidy3dBaseModel):
                     capture=False,
                 )
 
+        # The grid only depends on the sources through the wavelength, so simulations that only
+        # differ in their sources or monitors share the same cached grid.
+        key = self._grid_cache_key(
+            structures=structures,
+            symmetry=symmetry,
+            periodic=periodic,
+            wavelength=wavelength,
+            num_pml_layers=num_pml_layers,
+        )
+        return GRID_CACHE.get(
+            key=key,
+            make=lambda: self._make_grid_read_only(
+                self._make_grid(
+                    structures=structures,
+                    symmetry=symmetry,
+                    periodic=periodic,
+                    wavelength=wavelength,
+                    num_pml_layers=num_pml_layers,
+                )
+            ),
+        )
+
+    @staticmethod
+    def _make_grid_read_only(grid: Grid) -> Grid:
+        """Make the coordinate arrays of a grid read-only, as the grid is shared through the grid
+        cache by all the simulations with the same meshing inputs."""
+        boundaries = grid.boundaries
+        for coords_1d in (boundaries.x, boundaries.y, boundaries.z):
+            coords_1d.flags.writeable = False
+        return grid
+
+    def _grid_cache_key(
+        self,
+        structures: List[Structure],
+        symmetry: Tuple[Symmetry, Symmetry, Symmetry],
+        periodic: Tuple[bool, bool, bool],
+        wavelength: float,
+        num_pml_layers: List[Tuple[pd.NonNegativeInt, pd.NonNegativeInt]],
+    ) -> bytes:
+        """Key of the grid in the grid cache, digest of all the inputs of the mesher."""
+        hasher = hashlib.blake2b(digest_size=HASH_DIGEST_SIZE)
+        for value in (self, list(structures), symmetry, periodic, wavelength, num_pml_layers):
+            self._update_hasher(hasher, value)
+        return hasher.digest()
+
+    def _make_grid(
+        self,
+        structures: List[Structure],
+        symmetry: Tuple[Symmetry, Symmetry, Symmetry],
+        periodic: Tuple[bool, bool, bool],
+        wavelength: float,
+        num_pml_layers: List[Tuple[pd.NonNegativeInt, pd.NonNegativeInt]],
+    ) -> Grid:
+        """Make the grid, bypassing the grid cache."""
+
         grids_1d = [self.grid_x, self.grid_y, self.grid_z]
         coords_dict = {}
         for idim, (dim, grid_1d) in enumerate(zip("xyz", grids_1d)):
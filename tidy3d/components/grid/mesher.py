@@ -4,13 +4,14 @@ from abc import ABC, abstractmethod
 from typing import Tuple, List, Union, Dict
 from math import isclose
 from itertools import compress
+from bisect import bisect_left, bisect_right
 import warnings
 
 import pydantic.v1 as pd
 import numpy as np
 from pyroots import Brentq
+import shapely
 from shapely.strtree import STRtree
-from shapely.geometry import box as shapely_box
 from shapely.errors import ShapelyDeprecationWarning
 
 from ..base import Tidy3dBaseModel
@@ -130,42 +131,33 @@ class GradedMesher(Mesher):
             return np.array(interval_coords), np.array(max_steps)
 
         # Bounding boxes with the meshing axis rotated to z
-        struct_bbox = self.rotate_structure_bounds(structures_ordered, axis)
+        struct_bbox = np.array(self.rotate_structure_bounds(structures_ordered, axis))
         # Rtree from the 2D part of the bounding boxes
         tree = self.bounds_2d_tree(struct_bbox)
 
         intervals = {"coords": list(domain_bounds), "structs": [[]]}
         # Iterate in reverse order as latter structures override earlier ones. To properly handle
         # containment then we need to populate interval coordinates starting from the top.
-        # If a structure is found to be completely contained, the corresponding ``struct_bbox`` is
-        # set to ``None``.
+        # If a structure is found to be completely contained, it is marked as ``removed``.
+        removed = np.zeros(len(structures_ordered), dtype=bool)
         for str_ind in range(len(structures_ordered) - 1, -1, -1):
-            # 3D and 2D bounding box of current structure
-            bbox = struct_bbox[str_ind]
-            if bbox is None:
+            if removed[str_ind]:
                 # Structure has been removed because it is completely contained
                 continue
-            bbox_2d = shapely_box(bbox[0, 0], bbox[0, 1], bbox[1, 0], bbox[1, 1])
+            # 3D bounding box of current structure
+            bbox = struct_bbox[str_ind]
 
             # List of structure indexes that may intersect the current structure in 2D
-            try:
-                query_inds = tree.query_items(bbox_2d)
-            except AttributeError:
-                query_inds = tree.query(bbox_2d)
+            query_inds = tree.query(tree.geometries[str_ind])
 
             # Remove all lower structures that the current structure completely contains
-            inds_lower = [
-                ind for ind in query_inds if ind < str_ind and struct_bbox[ind] is not None
-            ]
-            query_bbox = [struct_bbox[ind] for ind in inds_lower]
-            bbox_contains_inds = self.contains_3d(bbox, query_bbox)
-            for ind in bbox_contains_inds:
-                struct_bbox[inds_lower[ind]] = None
+            inds_lower = query_inds[(query_inds < str_ind) & ~removed[query_inds]]
+            bbox_contains_inds = self.contains_3d(bbox, struct_bbox[inds_lower])
+            removed[inds_lower[bbox_contains_inds]] = True
 
             # List of structure bboxes that contain the current structure in 2D
-            inds_upper = [ind for ind in query_inds if ind > str_ind]
-            query_bbox = [struct_bbox[ind] for ind in inds_upper if struct_bbox[ind] is not None]
-            bbox_contained_2d = self.contained_2d(bbox, query_bbox)
+            inds_upper = query_inds[(query_inds > str_ind) & ~removed[query_inds]]
+            bbox_contained_2d = self.contained_2d(bbox, struct_bbox[inds_upper])
 
             # Handle insertion of the current structure bounds in the intervals
             intervals = self.insert_bbox(intervals, str_ind, bbox, bbox_contained_2d, min_step)
@@ -233,8 +225,8 @@ class GradedMesher(Mesher):
 
         # Left structure bound
         bound_coord = str_bbox[0, 2]
-        indsmin = np.nonzero(bound_coord <= coords)[0]
-        indmin = int(indsmin[0])  # coordinate is in interval index ``indmin - 1````
+        # the coordinates are sorted, first index with coordinate not smaller than the bound
+        indmin = bisect_left(coords, bound_coord)  # coordinate is in interval index ``indmin - 1``
         is_close_l = self.is_close(bound_coord, coords, indmin - 1, min_step)
         is_close_r = self.is_close(bound_coord, coords, indmin, min_step)
         is_contained = self.is_contained(bound_coord, bbox_contained_2d)
@@ -252,8 +244,8 @@ class GradedMesher(Mesher):
 
         # Right structure bound
         bound_coord = str_bbox[1, 2]
-        indsmax = np.nonzero(bound_coord >= coords)[0]
-        indmax = int(indsmax[-1])  # coordinate is in interval index ``indmax``
+        # last index with coordinate not larger than the bound
+        indmax = bisect_right(coords, bound_coord) - 1  # coordinate is in interval index ``indmax``
         is_close_l = self.is_close(bound_coord, coords, indmax, min_step)
         is_close_r = self.is_close(bound_coord, coords, indmax + 1, min_step)
         is_contained = self.is_contained(bound_coord, bbox_contained_2d)
@@ -272,11 +264,16 @@ class GradedMesher(Mesher):
 
         # Add the current structure index to all intervals that it spans, if it is not
         # contained in any of the latter structures
-        for interval_ind in range(indmin, indmax):
-            # Check at the midpoint to avoid numerical issues at the interval boundaries
-            mid_coord = (coords[interval_ind] + coords[interval_ind + 1]) / 2
-            if not self.is_contained(mid_coord, bbox_contained_2d):
-                structs[interval_ind].append(str_ind)
+        interval_inds = range(indmin, indmax)
+        if len(bbox_contained_2d) > 0 and len(interval_inds) > 0:
+            # Check at the midpoints to avoid numerical issues at the interval boundaries
+            interval_coords = np.array(coords[indmin : indmax + 1])
+            mid_coords = (interval_coords[:-1] + interval_coords[1:]) / 2
+            is_contained = self.is_contained(mid_coords, bbox_contained_2d)
+            interval_inds = compress(interval_inds, ~is_contained)
+
+        for interval_ind in interval_inds:
+            structs[interval_ind].append(str_ind)
 
         return {"coords": coords, "structs": structs}
 
@@ -370,18 +367,21 @@ class GradedMesher(Mesher):
         axis : Axis
             Axis index along which to operate.
         """
+        # steps of the media already seen, as many structures usually share a few media
+        medium_steps = {}
         min_steps = []
         for structure in structures:
             if isinstance(structure, Structure):
-                if isinstance(structure.medium, (PECMedium, Medium2D)):
-                    index = 1.0
-                else:
-                    n, k = structure.medium.eps_complex_to_nk(
-                        structure.medium.eps_diagonal(C_0 / wavelength)
-                    )
-                    # take max among all directions because perpendicular eps defines wavelength
-                    index = max(max(abs(n)), max(abs(k)))
-                min_steps.append(max(dl_min, wavelength / index / min_steps_per_wvl))
+                medium = structure.medium
+                if medium not in medium_steps:
+                    if isinstance(medium, (PECMedium, Medium2D)):
+                        index = 1.0
+                    else:
+                        n, k = medium.eps_complex_to_nk(medium.eps_diagonal(C_0 / wavelength))
+                        # take max among all directions because perpendicular eps defines wavelength
+                        index = max(max(abs(n)), max(abs(k)))
+                    medium_steps[medium] = max(dl_min, wavelength / index / min_steps_per_wvl)
+                min_steps.append(medium_steps[medium])
             elif isinstance(structure, MeshOverrideStructure):
                 min_steps.append(max(dl_min, structure.dl[axis]))
         return np.array(min_steps)
@@ -403,25 +403,20 @@ class GradedMesher(Mesher):
             A list of the bounding boxes of shape ``(2, 3)`` for each structure, with the bounds
             along ``axis`` being ``(:, 2)``.
         """
-        struct_bbox = []
-        for structure in structures:
-            # Get 3D bounding box and rotate axes
-            bmin, bmax = structure.geometry.bounds
-            bmin_ax, bmin_plane = structure.geometry.pop_axis(bmin, axis=axis)
-            bmax_ax, bmax_plane = structure.geometry.pop_axis(bmax, axis=axis)
-            bounds = np.array([list(bmin_plane) + [bmin_ax], list(bmax_plane) + [bmax_ax]])
-            struct_bbox.append(bounds)
-        return struct_bbox
+        # Get 3D bounding boxes and rotate axes
+        bounds = np.array([structure.geometry.bounds for structure in structures], dtype=float)
+        axis_order = [dim for dim in range(3) if dim != axis] + [axis]
+        return list(bounds.reshape(-1, 2, 3)[:, :, axis_order])
 
     @staticmethod
     def bounds_2d_tree(struct_bbox: List[ArrayFloat1D]):
         """Make a shapely Rtree for the 2D bounding boxes of all structures in the plane
         perpendicular to the meshing axis."""
 
-        boxes_2d = []
-        for bbox in struct_bbox:
-            box = shapely_box(bbox[0, 0], bbox[0, 1], bbox[1, 0], bbox[1, 1])
-            boxes_2d.append(box)
+        struct_bbox = np.reshape(struct_bbox, (-1, 2, 3))
+        boxes_2d = shapely.box(
+            struct_bbox[:, 0, 0], struct_bbox[:, 0, 1], struct_bbox[:, 1, 0], struct_bbox[:, 1, 1]
+        )
 
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=ShapelyDeprecationWarning)
@@ -431,37 +426,25 @@ class GradedMesher(Mesher):
     @staticmethod
     def contained_2d(bbox0: ArrayFloat1D, query_bbox: List[ArrayFloat1D]) -> List[ArrayFloat1D]:
         """Return a list of all bounding boxes among ``query_bbox`` that contain ``bbox0`` in 2D."""
-        return [
-            bbox
-            for bbox in query_bbox
-            if all(
-                [
-                    bbox0[0, 0] + fp_eps >= bbox[0, 0],
-                    bbox0[1, 0] <= bbox[1, 0] + fp_eps,
-                    bbox0[0, 1] + fp_eps >= bbox[0, 1],
-                    bbox0[1, 1] <= bbox[1, 1] + fp_eps,
-                ]
-            )
-        ]
+        query_bbox = np.asarray(query_bbox).reshape(-1, 2, 3)
+        is_contained = (
+            (bbox0[0, 0] + fp_eps >= query_bbox[:, 0, 0])
+            & (bbox0[1, 0] <= query_bbox[:, 1, 0] + fp_eps)
+            & (bbox0[0, 1] + fp_eps >= query_bbox[:, 0, 1])
+            & (bbox0[1, 1] <= query_bbox[:, 1, 1] + fp_eps)
+        )
+        return query_bbox[is_contained]
 
     @staticmethod
     def contains_3d(bbox0: ArrayFloat1D, query_bbox: List[ArrayFloat1D]) -> List[int]:
         """Return a list of all indexes of bounding boxes in the ``query_bbox`` list that ``bbox0``
         fully contains."""
-        return [
-            ind
-            for ind, bbox in enumerate(query_bbox)
-            if all(
-                [
-                    bbox[0, 0] + fp_eps >= bbox0[0, 0],
-                    bbox[1, 0] <= bbox0[1, 0] + fp_eps,
-                    bbox[0, 1] + fp_eps >= bbox0[0, 1],
-                    bbox[1, 1] <= bbox0[1, 1] + fp_eps,
-                    bbox[0, 2] + fp_eps >= bbox0[0, 2],
-                    bbox[1, 2] <= bbox0[1, 2] + fp_eps,
-                ]
-            )
-        ]
+        query_bbox = np.asarray(query_bbox).reshape(-1, 2, 3)
+        is_contained = np.all(
+            (query_bbox[:, 0] + fp_eps >= bbox0[0]) & (query_bbox[:, 1] <= bbox0[1] + fp_eps),
+            axis=1,
+        )
+        return np.nonzero(is_contained)[0]
 
     @staticmethod
     def is_close(coord: float, interval_coords: List[float], coord_ind: int, atol: float) -> bool:
@@ -474,13 +457,19 @@ class GradedMesher(Mesher):
         )
 
     @staticmethod
-    def is_contained(normal_pos: float, contained_2d: List[ArrayFloat1D]) -> bool:
+    def is_contained(
+        normal_pos: Union[float, ArrayFloat1D], contained_2d: List[ArrayFloat1D]
+    ) -> Union[bool, np.ndarray]:
         """Check if a given ``normal_pos`` along the meshing direction is contained inside any
-        of the bounding boxes that are in the ``contained_2d`` list.
+        of the bounding boxes that are in the ``contained_2d`` list. If ``normal_pos`` is an
+        array of positions, return a boolean array with the check for each position.
         """
-        return any(
-            contain_box[0, 2] <= normal_pos <= contain_box[1, 2] for contain_box in contained_2d
-        )
+        contained_2d = np.asarray(contained_2d).reshape(-1, 2, 3)
+        pos = np.asarray(normal_pos)[..., None]
+        is_contained = (contained_2d[:, 0, 2] <= pos) & (pos <= contained_2d[:, 1, 2])
+        if np.ndim(normal_pos) == 0:
+            return bool(is_contained.any())
+        return is_contained.any(axis=-1)
 
     @staticmethod
     def filter_min_step(
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Union, Tuple, List
 import functools
 
@@ -17,6 +18,114 @@ from ..log import log
 from ..components.types import Ax, ArrayLike, Complex, FieldVal, InterpMethod, TYPE_TAG_STR
 from ..components.viz import add_ax_if_none
 
+# number of points sampled at once in ``ParameterPerturbation.apply_data``
+PERTURBATION_CHUNK_SIZE = 2**20
+
+
+def _outside_range(values: ArrayLike[float], value_range: Tuple[float, float]) -> bool:
+    """Whether any of the values is outside of the range, ignoring nans. Uses reductions that do
+    not create temporary arrays of the size of the values."""
+    values = np.asarray(values)
+    if values.size == 0:
+        return False
+    return np.fmin.reduce(values, axis=None) < value_range[0] or (
+        np.fmax.reduce(values, axis=None) > value_range[1]
+    )
+
+
+class _InterpAxis:
+    """Sorted sample points along one axis of an interpolation table, with uniform lookup tables
+    to locate the interval containing each point in constant time, instead of a binary search."""
+
+    # maximum number of entries of a lookup table, binary search is used for finer grids
+    MAX_LOOKUP_SIZE = 2**18
+
+    def __init__(self, grid: np.ndarray):
+        self.grid = np.asarray(grid, dtype=float)
+        self.midpoints = (self.grid[1:] + self.grid[:-1]) / 2
+        self.inv_spacing = 1 / np.diff(self.grid)
+        # grid padded with infinite values, to check the found indices without bound checks
+        self._padded = {
+            name: (np.append(grid, np.inf), np.insert(grid, 0, -np.inf))
+            for name, grid in (("grid", self.grid), ("midpoints", self.midpoints))
+        }
+        self._lookups = {
+            "grid": self._make_lookup(self.grid),
+            "midpoints": self._make_lookup(self.midpoints),
+        }
+
+    @classmethod
+    def _make_lookup(cls, grid: np.ndarray) -> Tuple[bool, float, float, np.ndarray]:
+        """Uniform buckets no wider than half the smallest spacing of the grid, each storing the
+        number of grid points not larger than its left end, or ``None`` if too many are needed.
+        For positive grids, such as carrier densities, the buckets can be uniform in log scale if
+        that needs fewer of them."""
+        if len(grid) < 2 or np.any(np.diff(grid) <= 0):
+            return None
+
+        best = None
+        for log_scale in (False, True):
+            if log_scale and grid[0] <= 0:
+                continue
+            bucket_grid = np.log(grid) if log_scale else grid
+            step = np.min(np.diff(bucket_grid)) / 2
+            if step <= 0:
+                continue
+            size = int((bucket_grid[-1] - bucket_grid[0]) / step) + 2
+            if size <= cls.MAX_LOOKUP_SIZE and (best is None or size < len(best[3])):
+                starts = bucket_grid[0] + step * np.arange(size)
+                counts = np.searchsorted(bucket_grid, starts, side="right")
+                best = (log_scale, bucket_grid[0], 1 / step, counts)
+        return best
+
+    def _search(self, name: str, points: np.ndarray, side: str) -> np.ndarray:
+        """Same as ``np.searchsorted(grid, points, side)`` for the grid or the midpoints."""
+        grid = getattr(self, name)
+        lookup = self._lookups[name]
+        if lookup is None:
+            return np.searchsorted(grid, points, side=side)
+
+        log_scale, start, inv_step, counts = lookup
+        bucket_points = np.log(np.maximum(points, grid[0])) if log_scale else points
+        buckets = np.clip((bucket_points - start) * inv_step, 0, len(counts) - 1)
+        # nan points give invalid buckets, clipped again after the conversion to integers
+        with np.errstate(invalid="ignore"):
+            buckets = np.asarray(buckets).astype(int)
+        inds = counts[np.clip(buckets, 0, len(counts) - 1, out=buckets)]
+
+        # two consecutive buckets contain at most one grid point, so the bucket count is off by at
+        # most one, in either direction because of the rounding of the bucket position
+        grid_above, grid_below = self._padded[name]
+        if side == "right":
+            inds += grid_above[inds] <= points
+            inds -= grid_below[inds] > points
+        else:
+            inds += grid_above[inds] < points
+            inds -= grid_below[inds] >= points
+        return inds
+
+    @property
+    def num_cells(self) -> int:
+        """Number of intervals between grid points, a single point counts as one interval."""
+        return max(len(self.grid) - 1, 1)
+
+    def cells(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Index of the grid interval containing each of the ``points``, assumed within the grid,
+        and the relative position of the points in it."""
+        if len(self.grid) == 1:
+            return np.zeros(np.shape(points), dtype=int), np.zeros(np.shape(points))
+        inds = self._search("grid", points, side="right")
+        inds = np.clip(inds - 1, 0, len(self.grid) - 2, out=np.asarray(inds))
+        return inds, (points - self.grid[inds]) * self.inv_spacing[inds]
+
+    def nearest(self, points: np.ndarray) -> np.ndarray:
+        """Index of the grid point nearest to each of the ``points``, taking the lower one at
+        midpoints as in scipy. The index is arbitrary for nan points."""
+        if len(self.grid) == 1:
+            return np.zeros(np.shape(points), dtype=int)
+        return self._search("midpoints", points, side="left")
+
+
 """ Generic perturbation classes """
 
 
@@ -96,16 +205,7 @@ def ensure_temp_in_range(
     ) -> Union[ArrayLike[float], ArrayLike[Complex], SpatialDataArray]:
         """New sample function."""
 
-        if np.iscomplexobj(temperature):
-            raise ValueError("Cannot pass complex 'temperature' to 'sample()'")
-
-        temp_min, temp_max = self.temperature_range
-        temperature_numpy = np.array(temperature)
-        if np.any(temperature_numpy < temp_min) or np.any(temperature_numpy > temp_max):
-            log.warning(
-                "Temperature passed to 'HeatPerturbation.sample()'"
-                f"is outside of 'HeatPerturbation.temperature_range' = {self.temperature_range}"
-            )
+        self._check_temperature(temperature)
         return sample(self, temperature)
 
     return _sample
@@ -138,6 +238,22 @@ class HeatPerturbation(AbstractPerturbation):
             Sampled perturbation value(s).
         """
 
+    @abstractmethod
+    def _sample_values(self, temperature: np.ndarray) -> np.ndarray:
+        """Sample perturbation at temperature points given as a numpy array, without checks."""
+
+    def _check_temperature(self, temperature: Union[ArrayLike[float], SpatialDataArray]) -> None:
+        """Error if temperature is complex, warning if it is outside of ``temperature_range``."""
+
+        if np.iscomplexobj(temperature):
+            raise ValueError("Cannot pass complex 'temperature' to 'sample()'")
+
+        if _outside_range(temperature, self.temperature_range):
+            log.warning(
+                "Temperature passed to 'HeatPerturbation.sample()'"
+                f"is outside of 'HeatPerturbation.temperature_range' = {self.temperature_range}"
+            )
+
     @add_ax_if_none
     def plot(
         self,
@@ -244,6 +360,10 @@ class LinearHeatPerturbation(HeatPerturbation):
 
         return self.coeff * (t_vals - self.temperature_ref)
 
+    def _sample_values(self, temperature: np.ndarray) -> np.ndarray:
+        """Sample perturbation at temperature points given as a numpy array, without checks."""
+        return self.coeff * (temperature - self.temperature_ref)
+
     @cached_property
     def is_complex(self) -> bool:
         """Whether perturbation is complex valued."""
@@ -337,15 +457,38 @@ class CustomHeatPerturbation(HeatPerturbation):
             Sampled perturbation value(s).
         """
 
-        t_range = self.temperature_range
-        temperature_clip = np.clip(temperature, t_range[0], t_range[1])
-        data = self.perturbation_values.interp(T=temperature_clip, method=self.interp_method)
+        data = self._sample_values(np.asarray(temperature))
         # preserve input type
         if isinstance(temperature, SpatialDataArray):
-            return SpatialDataArray(data.drop_vars("T"))
+            return SpatialDataArray(data, coords=temperature.coords)
         if np.ndim(temperature) == 0:
             return data.item()
-        return data.data
+        return data
+
+    @cached_property
+    def _interp_table(self) -> Tuple[_InterpAxis, np.ndarray, np.ndarray]:
+        """Sample temperatures in increasing order, the corresponding perturbation values, and the
+        coefficients of the linear interpolation in each interval, stacked along the last axis."""
+        temperatures = self.perturbation_values.coords["T"].values
+        order = np.argsort(temperatures)
+        values = self.perturbation_values.values[order]
+        # a single sample gives a constant, interpolated on a zero-width interval
+        values_edges = np.repeat(values, 2) if len(values) == 1 else values
+        coeffs = np.stack([values_edges[:-1], np.diff(values_edges)], axis=-1)
+        return _InterpAxis(temperatures[order]), values, coeffs
+
+    def _sample_values(self, temperature: np.ndarray) -> np.ndarray:
+        """Sample perturbation at temperature points given as a numpy array, without checks. The
+        perturbation values are extrapolated as constants outside of the sampled temperatures,
+        and are nan at nan temperatures."""
+        axis, values, coeffs = self._interp_table
+        temperature = np.clip(temperature, axis.grid[0], axis.grid[-1])
+        if self.interp_method == "nearest":
+            data = values[axis.nearest(temperature)]
+            return np.where(np.isnan(temperature), np.nan, data)
+        cells, weight = axis.cells(temperature)
+        coeffs = coeffs[cells]
+        return coeffs[..., 0] + weight * coeffs[..., 1]
 
     @cached_property
     def is_complex(self) -> bool:
@@ -378,32 +521,7 @@ def ensure_charge_in_range(
     ) -> Union[ArrayLike[float], ArrayLike[Complex], SpatialDataArray]:
         """New sample function."""
 
-        # disable complex input
-        if np.iscomplexobj(electron_density):
-            raise ValueError("Cannot pass complex 'electron_density' to 'sample()'")
-
-        if np.iscomplexobj(hole_density):
-            raise ValueError("Cannot pass complex 'hole_density' to 'sample()'")
-
-        # check ranges
-        e_min, e_max = self.electron_range
-
-        electron_numpy = np.array(electron_density)
-        if np.any(electron_numpy < e_min) or np.any(electron_numpy > e_max):
-            log.warning(
-                "Electron density values passed to 'ChargePerturbation.sample()'"
-                f"is outside of 'ChargePerturbation.electron_range' = {self.electron_range}"
-            )
-
-        h_min, h_max = self.hole_range
-
-        hole_numpy = np.array(hole_density)
-        if np.any(hole_numpy < h_min) or np.any(hole_numpy > h_max):
-            log.warning(
-                "Hole density values passed to 'ChargePerturbation.sample()'"
-                f"is outside of 'ChargePerturbation.hole_range' = {self.hole_range}"
-            )
-
+        self._check_densities(electron_density, hole_density)
         return sample(self, electron_density, hole_density)
 
     return _sample
@@ -451,6 +569,43 @@ class ChargePerturbation(AbstractPerturbation):
             Sampled perturbation value(s).
         """
 
+    @abstractmethod
+    def _sample_values(
+        self,
+        electron_density: Union[float, np.ndarray],
+        hole_density: Union[float, np.ndarray],
+    ) -> np.ndarray:
+        """Sample perturbation at pairs of electron and hole densities given as numbers or
+        broadcastable numpy arrays, without checks."""
+
+    def _check_densities(
+        self,
+        electron_density: Union[ArrayLike[float], SpatialDataArray],
+        hole_density: Union[ArrayLike[float], SpatialDataArray],
+    ) -> None:
+        """Error if densities are complex, warning if they are outside of ``electron_range`` and
+        ``hole_range``."""
+
+        # disable complex input
+        if np.iscomplexobj(electron_density):
+            raise ValueError("Cannot pass complex 'electron_density' to 'sample()'")
+
+        if np.iscomplexobj(hole_density):
+            raise ValueError("Cannot pass complex 'hole_density' to 'sample()'")
+
+        # check ranges
+        if _outside_range(electron_density, self.electron_range):
+            log.warning(
+                "Electron density values passed to 'ChargePerturbation.sample()'"
+                f"is outside of 'ChargePerturbation.electron_range' = {self.electron_range}"
+            )
+
+        if _outside_range(hole_density, self.hole_range):
+            log.warning(
+                "Hole density values passed to 'ChargePerturbation.sample()'"
+                f"is outside of 'ChargePerturbation.hole_range' = {self.hole_range}"
+            )
+
     @add_ax_if_none
     def plot(
         self,
@@ -651,6 +806,17 @@ class LinearChargePerturbation(ChargePerturbation):
             h_vals - self.hole_ref
         )
 
+    def _sample_values(
+        self,
+        electron_density: Union[float, np.ndarray],
+        hole_density: Union[float, np.ndarray],
+    ) -> np.ndarray:
+        """Sample perturbation at pairs of electron and hole densities given as numbers or
+        broadcastable numpy arrays, without checks."""
+        return self.electron_coeff * (electron_density - self.electron_ref) + self.hole_coeff * (
+            hole_density - self.hole_ref
+        )
+
     @cached_property
     def is_complex(self) -> bool:
         """Whether perturbation is complex valued."""
@@ -779,16 +945,78 @@ class CustomChargePerturbation(ChargePerturbation):
         """
         e_type, h_type = self._get_eh_types(electron_density, hole_density)
 
-        e_clip = np.clip(electron_density, self.electron_range[0], self.electron_range[1])
-        h_clip = np.clip(hole_density, self.hole_range[0], self.hole_range[1])
+        if e_type == "array" and h_type == "array":
+            e_vals, h_vals = np.meshgrid(electron_density, hole_density, indexing="ij")
+        else:
+            e_vals, h_vals = np.asarray(electron_density), np.asarray(hole_density)
 
-        data = self.perturbation_values.interp(n=e_clip, p=h_clip, method=self.interp_method)
+        data = self._sample_values(e_vals, h_vals)
 
         if e_type == "scalar" and h_type == "scalar":
             return data.item()
         if e_type == "spatial" or h_type == "spatial":
-            return SpatialDataArray(data.drop_vars(["n", "p"]))
-        return data.data
+            template = electron_density if e_type == "spatial" else hole_density
+            return SpatialDataArray(data, coords=template.coords)
+        return data
+
+    @cached_property
+    def _interp_table(self) -> Tuple[_InterpAxis, _InterpAxis, np.ndarray, np.ndarray]:
+        """Sample electron and hole densities in increasing order, the corresponding 2D array of
+        perturbation values, and the coefficients of the bilinear interpolation in each cell,
+        flattened in row-major order and stacked along the last axis."""
+        values = self.perturbation_values.transpose("n", "p")
+        electron_densities = values.coords["n"].values
+        hole_densities = values.coords["p"].values
+        e_order = np.argsort(electron_densities)
+        h_order = np.argsort(hole_densities)
+        values = values.values[np.ix_(e_order, h_order)]
+
+        # a single sample along an axis gives a constant, interpolated on a zero-width interval
+        corners = values
+        for axis in range(2):
+            if corners.shape[axis] == 1:
+                corners = np.repeat(corners, 2, axis=axis)
+        v00, v10 = corners[:-1, :-1], corners[1:, :-1]
+        v01, v11 = corners[:-1, 1:], corners[1:, 1:]
+        coeffs = np.stack([v00, v10 - v00, v01 - v00, v11 - v10 - v01 + v00], axis=-1)
+
+        return (
+            _InterpAxis(electron_densities[e_order]),
+            _InterpAxis(hole_densities[h_order]),
+            values,
+            coeffs.reshape(-1, 4),
+        )
+
+    def _sample_values(
+        self,
+        electron_density: Union[float, np.ndarray],
+        hole_density: Union[float, np.ndarray],
+    ) -> np.ndarray:
+        """Sample perturbation at pairs of electron and hole densities given as numbers or
+        broadcastable numpy arrays, without checks. The perturbation values are bilinearly
+        interpolated, or taken at the nearest sample point, extrapolated as constants outside of
+        the sampled densities, and nan at nan densities."""
+        e_axis, h_axis, values, coeffs = self._interp_table
+        electron_density, hole_density = np.broadcast_arrays(electron_density, hole_density)
+        e_clip = np.clip(electron_density, e_axis.grid[0], e_axis.grid[-1])
+        h_clip = np.clip(hole_density, h_axis.grid[0], h_axis.grid[-1])
+
+        if self.interp_method == "nearest":
+            inds = e_axis.nearest(e_clip) * values.shape[1]
+            inds += h_axis.nearest(h_clip)
+            data = values.ravel()[inds]
+            return np.where(np.isnan(e_clip) | np.isnan(h_clip), np.nan, data)
+
+        e_cells, e_weight = e_axis.cells(e_clip)
+        h_cells, h_weight = h_axis.cells(h_clip)
+        e_cells *= h_axis.num_cells
+        e_cells += h_cells
+        coeffs = coeffs[e_cells]
+        return (
+            coeffs[..., 0]
+            + e_weight * coeffs[..., 1]
+            + h_weight * (coeffs[..., 2] + e_weight * coeffs[..., 3])
+        )
 
     @cached_property
     def is_complex(self) -> bool:
@@ -864,6 +1092,15 @@ class ParameterPerturbation(Tidy3dBaseModel):
         p: SpatialDataArray = None,
     ):
         """Check that fields have the same coordinates and return an array field with zeros."""
+        return xr.zeros_like(ParameterPerturbation._template(T, n, p))
+
+    @staticmethod
+    def _template(
+        T: SpatialDataArray = None,
+        n: SpatialDataArray = None,
+        p: SpatialDataArray = None,
+    ) -> SpatialDataArray:
+        """Check that fields have the same coordinates and return one of them."""
         template = None
         for field in [T, n, p]:
             if field is not None:
@@ -880,17 +1117,20 @@ class ParameterPerturbation(Tidy3dBaseModel):
                 "provided."
             )
 
-        return xr.zeros_like(template)
+        return template
 
     def apply_data(
         self,
         temperature: SpatialDataArray = None,
         electron_density: SpatialDataArray = None,
         hole_density: SpatialDataArray = None,
+        num_workers: int = 1,
     ) -> SpatialDataArray:
         """Sample perturbations on provided heat and/or charge data. At least one of
         ``temperature``, ``electron_density``, and ``hole_density`` must be not ``None``.
-        All provided fields must have identical coords.
+        All provided fields must have identical coords. The heat and charge perturbations are
+        sampled and summed in chunks of points, so that no temporary arrays of the size of the
+        fields are created.
 
         Parameters
         ----------
@@ -900,6 +1140,8 @@ class ParameterPerturbation(Tidy3dBaseModel):
             Electron density field data.
         hole_density : SpatialDataArray = None
             Hole density field data.
+        num_workers : int = 1
+            Number of threads sampling the chunks of points.
 
         Returns
         -------
@@ -907,20 +1149,75 @@ class ParameterPerturbation(Tidy3dBaseModel):
             Sampled perturbation field.
         """
 
-        result = self._zeros_like(temperature, electron_density, hole_density)
+        template = self._template(temperature, electron_density, hole_density)
+
+        def flat_values(field: SpatialDataArray) -> np.ndarray:
+            """Field values as a flat array, in the same order as the template."""
+            return np.ravel(field.transpose(*template.dims).values)
+
+        # functions sampling a perturbation on a slice of the flattened fields
+        samplers = []
 
         if temperature is not None and self.heat is not None:
-            result = result + self.heat.sample(temperature)
+            self.heat._check_temperature(temperature)
+            t_vals = flat_values(temperature)
+            samplers.append(lambda chunk: self.heat._sample_values(t_vals[chunk]))
 
         if (electron_density is not None or hole_density is not None) and self.charge is not None:
 
-            if electron_density is None:
-                electron_density = 0
+            e_vals = 0 if electron_density is None else flat_values(electron_density)
+            h_vals = 0 if hole_density is None else flat_values(hole_density)
+            self.charge._check_densities(e_vals, h_vals)
+
+            def sample_charge(chunk: slice) -> np.ndarray:
+                """Sample the charge perturbation on a slice of the flattened fields."""
+                return self.charge._sample_values(
+                    e_vals if np.ndim(e_vals) == 0 else e_vals[chunk],
+                    h_vals if np.ndim(h_vals) == 0 else h_vals[chunk],
+                )
+
+            samplers.append(sample_charge)
 
-            if hole_density is None:
-                hole_density = 0
+        if len(samplers) == 0:
+            return xr.zeros_like(template)
 
-            result = result + self.charge.sample(electron_density, hole_density)
+        result = self._sample_in_chunks(samplers, size=template.size, num_workers=num_workers)
+        return SpatialDataArray(result.reshape(template.shape), coords=template.coords)
+
+    @staticmethod
+    def _sample_in_chunks(
+        samplers: List[Callable[[slice], np.ndarray]], size: int, num_workers: int = 1
+    ) -> np.ndarray:
+        """Sum of the values of the ``samplers`` over the slices of ``size`` points, evaluated in
+        chunks of ``PERTURBATION_CHUNK_SIZE`` points, possibly in several threads. The type of
+        the result is that of the values of the first chunk."""
+
+        chunks = [
+            slice(start, min(start + PERTURBATION_CHUNK_SIZE, size))
+            for start in range(0, size, PERTURBATION_CHUNK_SIZE)
+        ] or [slice(0, 0)]
+
+        def sample_chunk(chunk: slice) -> np.ndarray:
+            """Sum of the values of the samplers on a chunk."""
+            values = samplers[0](chunk)
+            for sampler in samplers[1:]:
+                values = values + sampler(chunk)
+            return np.broadcast_to(values, (chunk.stop - chunk.start,))
+
+        first_values = sample_chunk(chunks[0])
+        result = np.empty(size, dtype=first_values.dtype)
+        result[chunks[0]] = first_values
+
+        def store_chunk(chunk: slice) -> None:
+            """Sample a chunk and store it in the result."""
+            result[chunk] = sample_chunk(chunk)
+
+        if num_workers > 1 and len(chunks) > 2:
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                list(executor.map(store_chunk, chunks[1:]))
+        else:
+            for chunk in chunks[1:]:
+                store_chunk(chunk)
 
         return result
 
@@ -19,7 +19,7 @@ from .geometry.primitives import Cylinder
 from .geometry.mesh import TriangleMesh
 from .geometry.polyslab import PolySlab
 from .geometry.utils import flatten_groups, traverse_geometries
-from .types import Ax, Shapely, FreqBound, Axis, annotate_type, Symmetry, TYPE_TAG_STR
+from .types import Ax, Shapely, FreqBound, Axis, annotate_type, Symmetry, TYPE_TAG_STR, Bound
 from .grid.grid import Coords1D, Grid, Coords
 from .grid.grid_spec import GridSpec, UniformGrid, AutoGrid
 from .medium import Medium, MediumType, AbstractMedium, PECMedium
@@ -1305,8 +1305,16 @@ class Simulation(Box):
             pos = test_object.center[normal_axis_index]
             xyz_kwargs = {dim: pos}
 
+            # only structures whose bounds contain the plane position can intersect it
+            structure_bounds = Simulation._structures_bounds(structures)
+            inds_candidates = np.nonzero(
+                (structure_bounds[:, 0, normal_axis_index] <= pos)
+                & (structure_bounds[:, 1, normal_axis_index] >= pos)
+            )[0]
+
             structures_merged = []
-            for structure in structures:
+            for index in inds_candidates:
+                structure = structures[index]
                 intersections = structure.geometry.intersections_plane(**xyz_kwargs)
                 if len(intersections) > 0:
                     structures_merged.append(structure)
@@ -1319,6 +1327,36 @@ class Simulation(Box):
             structures_merged += Simulation.intersecting_structures(surface, structures)
         return structures_merged
 
+    @staticmethod
+    def _structures_bounds(structures: Tuple[Structure, ...]) -> np.ndarray:
+        """Array of shape ``(len(structures), 2, 3)`` storing the bounds of each structure."""
+        if len(structures) == 0:
+            return np.zeros((0, 2, 3))
+        return np.array([structure.geometry.bounds for structure in structures], dtype=float)
+
+    @staticmethod
+    def _inds_intersecting_bounds(structure_bounds: np.ndarray, bounds: Bound) -> np.ndarray:
+        """Indices, in increasing order, of the structures whose bounding boxes (as stored in
+        ``structure_bounds``) intersect with ``bounds``. Intersection is inclusive, consistent
+        with :meth:`.Geometry.intersects`.
+
+        Parameters
+        ----------
+        structure_bounds : np.ndarray
+            Array of shape ``(N, 2, 3)`` with the bounds of ``N`` structures.
+        bounds : Tuple[Tuple[float, float, float], Tuple[float, float, float]]
+            Min and max bounds of the region to test against.
+
+        Returns
+        -------
+        np.ndarray
+            Indices of the intersecting structures.
+        """
+        bmin, bmax = np.array(bounds, dtype=float)
+        in_minus = np.all(structure_bounds[:, 0] <= bmax, axis=1)
+        in_plus = np.all(structure_bounds[:, 1] >= bmin, axis=1)
+        return np.nonzero(in_minus & in_plus)[0]
+
     def monitor_medium(self, monitor: MonitorType):
         """Return the medium in which the given monitor resides.
 
@@ -2501,8 +2539,13 @@ class Simulation(Box):
             List of shapes and mediums on the plane after merging.
         """
 
+        # skip all structures whose bounding box does not intersect the plane
+        structure_bounds = Simulation._structures_bounds(structures)
+        inds_candidates = Simulation._inds_intersecting_bounds(structure_bounds, plane.bounds)
+
         shapes = []
-        for structure in structures:
+        for index in inds_candidates:
+            structure = structures[index]
 
             # get list of Shapely shapes that intersect at the plane
             shapes_plane = plane.intersections_with(structure.geometry)
@@ -2961,8 +3004,16 @@ class Simulation(Box):
             shape = tuple(len(array) for array in arrays)
             eps_array = eps_background * np.ones(shape, dtype=complex)
             # replace 2d materials with volumetric equivalents
+            # only structures overlapping the requested coordinates need to be processed
+            coords_bounds = tuple(
+                zip(*((arr.min(), arr.max()) if arr.size > 0 else (inf, -inf) for arr in arrays))
+            )
+            inds_structures = self._inds_intersecting_bounds(
+                self._volumetric_structures_bounds, coords_bounds
+            )
             with log as consolidated_logger:
-                for structure in self.volumetric_structures:
+                for index in inds_structures:
+                    structure = self.volumetric_structures[index]
                     # Indexing subset within the bounds of the structure
 
                     inds = structure.geometry._inds_inside_bounds(*arrays)
@@ -3152,6 +3203,12 @@ class Simulation(Box):
         volumetric equivalents."""
         return self._volumetric_structures_grid(self.grid)
 
+    @cached_property
+    def _volumetric_structures_bounds(self) -> np.ndarray:
+        """Bounds of all :attr:`.volumetric_structures`, stored as an array of shape
+        ``(num_structures, 2, 3)`` for fast spatial queries."""
+        return self._structures_bounds(self.volumetric_structures)
+
     @cached_property
     def allow_gain(self) -> bool:
         """``True`` if any of the mediums in the simulation allows gain."""
@@ -3191,69 +3248,134 @@ class Simulation(Box):
             Simulation after application of heat and/or charge data.
         """
 
-        sim_dict = self.dict()
-        structures = self.structures
-        sim_bounds = self.bounds_pml
         array_dict = {
             "temperature": temperature,
             "electron_density": electron_density,
             "hole_density": hole_density,
         }
+        array_dict = {name: [array] for name, array in array_dict.items() if array is not None}
+        return self._perturbed_mediums_copies(array_dict=array_dict, num_copies=1)[0]
 
-        # For each structure made of mediums with perturbation models, convert those mediums into
-        # spatially dependent mediums by selecting minimal amount of heat and charge data points
-        # covering the structure, and create a new structure containing the resulting custom medium
-        new_structures = []
-        for s_ind, structure in enumerate(structures):
-            med = structure.medium
-            if isinstance(med, AbstractPerturbationMedium):
-                # get structure's bounding box
-                s_bounds = structure.geometry.bounds
+    def perturbed_mediums_copies(
+        self,
+        temperature: List[SpatialDataArray] = None,
+        electron_density: List[SpatialDataArray] = None,
+        hole_density: List[SpatialDataArray] = None,
+    ) -> List[Simulation]:
+        """Return copies of the simulation with a sequence of heat and/or charge data snapshots
+        applied to all mediums that have perturbation models specified, as in
+        :meth:`.perturbed_mediums_copy`. The data covering each structure is located once for all
+        snapshots, and the parts of the simulation not affected by the perturbations are shared
+        with the copies instead of being validated again. Any of temperature, electron_density,
+        and hole_density can be ``None``. All provided sequences must have the same length, and
+        all provided fields must have identical coords.
 
-                bounds = [
-                    np.max([sim_bounds[0], s_bounds[0]], axis=0),
-                    np.min([sim_bounds[1], s_bounds[1]], axis=0),
-                ]
+        Parameters
+        ----------
+        temperature : List[SpatialDataArray] = None
+            Temperature field data snapshots.
+        electron_density : List[SpatialDataArray] = None
+            Electron density field data snapshots.
+        hole_density : List[SpatialDataArray] = None
+            Hole density field data snapshots.
 
-                # for each structure select a minimal subset of data that covers it
-                restricted_arrays = {}
+        Returns
+        -------
+        List[Simulation]
+            Simulations after application of each snapshot of heat and/or charge data.
+        """
 
-                for name, array in array_dict.items():
-                    if array is not None:
-                        restricted_arrays[name] = array.sel_inside(bounds)
+        array_dict = {
+            "temperature": temperature,
+            "electron_density": electron_density,
+            "hole_density": hole_density,
+        }
+        array_dict = {
+            name: list(arrays) for name, arrays in array_dict.items() if arrays is not None
+        }
 
-                        # check provided data fully cover structure
-                        if not array.does_cover(bounds):
-                            log.warning(
-                                f"Provided '{name}' does not fully cover structures[{s_ind}]."
-                            )
+        if len(array_dict) == 0:
+            raise SetupError(
+                "At least one of 'temperature', 'electron_density', and 'hole_density' "
+                "must be provided."
+            )
 
-                new_medium = med.perturbed_copy(**restricted_arrays)
-                new_structure = structure.updated_copy(medium=new_medium)
-                new_structures.append(new_structure)
-            else:
-                new_structures.append(structure)
+        num_copies = {len(arrays) for arrays in array_dict.values()}
+        if len(num_copies) > 1:
+            raise SetupError(
+                "The same number of snapshots must be provided for 'temperature', "
+                "'electron_density', and 'hole_density'."
+            )
 
-        sim_dict["structures"] = new_structures
+        for name, arrays in array_dict.items():
+            for array in arrays[1:]:
+                if not all(
+                    np.array_equal(array.coords[dim], arrays[0].coords[dim]) for dim in "xyz"
+                ):
+                    raise SetupError(f"All snapshots of '{name}' must have identical coords.")
 
-        # do the same for background medium if it a medium with perturbation models.
-        med = self.medium
-        if isinstance(med, AbstractPerturbationMedium):
+        return self._perturbed_mediums_copies(array_dict=array_dict, num_copies=num_copies.pop())
 
-            # get simulation's bounding box
-            bounds = sim_bounds
+    def _perturbed_mediums_copies(
+        self, array_dict: Dict[str, List[SpatialDataArray]], num_copies: int
+    ) -> List[Simulation]:
+        """Copies of the simulation with perturbed mediums for each of ``num_copies`` snapshots of
+        the data in ``array_dict``, whose snapshots share the same coords."""
 
-            # for each structure select a minimal subset of data that covers it
-            restricted_arrays = {}
+        sim_bounds = self.bounds_pml
 
-            for name, array in array_dict.items():
-                if array is not None:
-                    restricted_arrays[name] = array.sel_inside(bounds)
+        # For each structure made of mediums with perturbation models, and for the background
+        # medium, find the bounds of the region it covers in the simulation
+        regions = []
+        for s_ind, structure in enumerate(self.structures):
+            med = structure.medium
+            if isinstance(med, AbstractPerturbationMedium):
+                # get structure's bounding box
+                s_bounds = structure.geometry.bounds
 
-                    # check provided data fully cover simulation
-                    if not array.does_cover(bounds):
+                bounds = [
+                    np.max([sim_bounds[0], s_bounds[0]], axis=0),
+                    np.min([sim_bounds[1], s_bounds[1]], axis=0),
+                ]
+                regions.append((s_ind, med, bounds))
+
+        if isinstance(self.medium, AbstractPerturbationMedium):
+            regions.append((None, self.medium, sim_bounds))
+
+        # For each region select a minimal subset of data that covers it. The indices only depend
+        # on the coords, so they are computed once for all snapshots
+        region_inds = []
+        for s_ind, _, bounds in regions:
+            inds = {}
+            for name, arrays in array_dict.items():
+                inds[name] = arrays[0]._inds_inside(bounds)
+
+                # check provided data fully cover structure or simulation
+                if not arrays[0].does_cover(bounds):
+                    if s_ind is None:
                         log.warning(f"Provided '{name}' does not fully cover simulation domain.")
+                    else:
+                        log.warning(f"Provided '{name}' does not fully cover structures[{s_ind}].")
+            region_inds.append(inds)
+
+        # Convert the mediums with perturbation models into spatially dependent mediums for each
+        # snapshot. Only the affected structures are replaced, so that the rest of the simulation
+        # is shared with the copies
+        sims = []
+        for snapshot in range(num_copies):
+            structures = list(self.structures)
+            medium = self.medium
+            for (s_ind, med, _), inds in zip(regions, region_inds):
+                restricted_arrays = {
+                    name: arrays[snapshot].isel(x=inds[name][0], y=inds[name][1], z=inds[name][2])
+                    for name, arrays in array_dict.items()
+                }
+                new_medium = med.perturbed_copy(**restricted_arrays)
+                if s_ind is None:
+                    medium = new_medium
+                else:
+                    structures[s_ind] = structures[s_ind].updated_copy(medium=new_medium)
 
-            sim_dict["medium"] = med.perturbed_copy(**restricted_arrays)
+            sims.append(self.updated_copy(structures=structures, medium=medium))
 
-        return Simulation.parse_obj(sim_dict)
+        return sims
@@ -3,6 +3,7 @@
 import pydantic.v1 as pd
 
 from .log import DEFAULT_LEVEL, LogLevel, set_logging_level, set_log_suppression
+from .components.grid.cache import DEFAULT_GRID_CACHE_SIZE, GRID_CACHE
 
 
 class Tidy3dConfig(pd.BaseModel):
@@ -32,6 +33,15 @@ class Tidy3dConfig(pd.BaseModel):
         "for several elements.",
     )
 
+    grid_cache_size: pd.NonNegativeInt = pd.Field(
+        DEFAULT_GRID_CACHE_SIZE,
+        title="Grid cache size",
+        description="Maximum number of simulation grids kept in the process-wide cache, reused by "
+        "simulations with the same structures, grid specification and boundaries. "
+        "Set to 0 to disable the cache. Hits and misses are given by "
+        "``tidy3d.components.grid.cache.GRID_CACHE.cache_info()``.",
+    )
+
     @pd.validator("logging_level", pre=True, always=True)
     def _set_logging_level(cls, val):
         """Set the logging level if logging_level is changed."""
@@ -44,6 +54,12 @@ class Tidy3dConfig(pd.BaseModel):
         set_log_suppression(val)
         return val
 
+    @pd.validator("grid_cache_size", always=True)
+    def _set_grid_cache_size(cls, val):
+        """Resize the grid cache if grid_cache_size is changed."""
+        GRID_CACHE.resize(val)
+        return val
+
 
 # instance of the config that can be modified.
 config = Tidy3dConfig()
@@ -1,6 +1,7 @@
 """Logging for Tidy3d."""
 
-import inspect
+import sys
+from contextlib import contextmanager
 
 from typing import Union, List
 from typing_extensions import Literal
@@ -60,9 +61,9 @@ class LogHandler:
     def handle(self, level, level_name, message):
         """Output log messages depending on log level"""
         if level >= self.level:
-            stack = inspect.stack()
             offset = 4
-            if stack[offset - 1].filename.endswith("exceptions.py"):
+            # Only the calling frame is needed, not the records of the whole stack
+            if sys._getframe(offset - 1).f_code.co_filename.endswith("exceptions.py"):
                 # We want the calling site for exceptions.py
                 offset += 1
             self.console.log(
@@ -101,6 +102,17 @@ class Logger:
         """Turn on/off tree-like capturing of log messages."""
         self._capture = capture
 
+    @contextmanager
+    def capture_disabled(self):
+        """Context in which log messages are not captured, for example to construct many models in
+        bulk without recording their validation warnings. Capturing resumes on exit."""
+        capture, stack = self._capture, self._stack
+        self._capture, self._stack = False, None
+        try:
+            yield self
+        finally:
+            self._capture, self._stack = capture, stack
+
     def captured_warnings(self):
         """Get the formatted list of captured log messages."""
         captured_warnings = self._captured_warnings
@@ -220,6 +232,20 @@ class Logger:
     ) -> None:
         """Distribute log messages to all handlers"""
 
+        # Fast path: skip composing the message if nothing would use it
+        capture = capture and bool(self._stack)
+        if not capture and not log_once:
+            if self._counts is not None and len(self._counts) > 0:
+                # Discarded in a consolidation context
+                self._counts[level] = 1 + self._counts.get(level, 0)
+                return
+            if self._counts is None:
+                for handler in self.handlers.values():
+                    if level >= handler.level:
+                        break
+                else:
+                    return
+
         # Compose message
         if len(args) > 0:
             try:
@@ -231,7 +257,7 @@ class Logger:
             composed_message = str(message)
 
         # Capture all messages (even if suppressed later)
-        if self._stack and capture:
+        if capture:
             if custom_loc is None:
                 custom_loc = []
             self._stack[-1]["messages"].append((level_name, composed_message, custom_loc))
@@ -105,7 +105,7 @@ class JaxObject(Tidy3dBaseModel):
         strip_data_array(json_dict)
         return json.dumps(json_dict)
 
-    def to_hdf5(self, fname: str, custom_encoders: List[Callable] = None) -> None:
+    def to_hdf5(self, fname: str, custom_encoders: List[Callable] = None, **kwargs) -> None:
         """Exports :class:`JaxObject` instance to .hdf5 file.
 
         Parameters
@@ -115,6 +115,8 @@ class JaxObject(Tidy3dBaseModel):
         custom_encoders : List[Callable]
             List of functions accepting (fname: str, group_path: str, value: Any) that take
             the ``value`` supplied and write it to the hdf5 ``fname`` at ``group_path``.
+        **kwargs
+            Chunking and compression options of :meth:`.Tidy3dBaseModel.to_hdf5`.
 
         Example
         -------
@@ -132,11 +134,15 @@ class JaxObject(Tidy3dBaseModel):
 
         custom_encoders += [data_array_encoder]
 
-        return super().to_hdf5(fname=fname, custom_encoders=custom_encoders)
+        return super().to_hdf5(fname=fname, custom_encoders=custom_encoders, **kwargs)
 
     @classmethod
     def dict_from_hdf5(
-        cls, fname: str, group_path: str = "", custom_decoders: List[Callable] = None
+        cls,
+        fname: str,
+        group_path: str = "",
+        custom_decoders: List[Callable] = None,
+        lazy: bool = False,
     ) -> dict:
         """Loads a dictionary containing the model contents from a .hdf5 file.
 
@@ -150,6 +156,9 @@ class JaxObject(Tidy3dBaseModel):
             List of functions accepting
             (fname: str, group_path: str, model_dict: dict, key: str, value: Any) that store the
             value in the model dict after a custom decoding.
+        lazy : bool = False
+            If ``True``, the values of the regular data arrays are only read when accessed.
+            :class:`.JaxDataArray` values are always loaded.
 
         Returns
         -------
@@ -177,5 +186,5 @@ class JaxObject(Tidy3dBaseModel):
         custom_decoders += [data_array_decoder]
 
         return super().dict_from_hdf5(
-            fname=fname, group_path=group_path, custom_decoders=custom_decoders
+            fname=fname, group_path=group_path, custom_decoders=custom_decoders, lazy=lazy
         )
@@ -23,6 +23,7 @@ from ....constants import fp_eps, MICROMETER
 from ....exceptions import AdjointError
 
 from .base import JaxObject
+from .shared_data import SharedData, load_shared
 from .types import JaxFloat, validate_jax_tuple, validate_jax_tuple_tuple
 
 # number of integration points per unit wavelength in material
@@ -35,6 +36,22 @@ GRAD_MONITOR_EXPANSION = fp_eps
 MAX_NUM_VERTICES = 1000
 
 
+def _linear_interp_weights(
+    coords: np.ndarray, points: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Indices of the lower and upper neighbors of each point in the sorted ``coords``, weight of
+    the upper neighbor, and whether the point is within the coordinates, like ``xr.interp``."""
+    num_coords = len(coords)
+    inds_lower = np.clip(np.searchsorted(coords, points, side="right") - 1, 0, num_coords - 1)
+    inds_upper = np.minimum(inds_lower + 1, num_coords - 1)
+    spacing = coords[inds_upper] - coords[inds_lower]
+    weights = np.divide(
+        points - coords[inds_lower], spacing, out=np.zeros(len(points)), where=spacing != 0
+    )
+    inside = (points >= coords[0]) & (points <= coords[-1])
+    return inds_lower, inds_upper, weights, inside
+
+
 class JaxGeometry(Geometry, ABC):
     """Abstract :class:`.Geometry` with methods useful for all Jax subclasses."""
 
@@ -559,6 +576,169 @@ class JaxPolySlab(JaxGeometry, PolySlab, JaxObject):
         # add the "forward" contribution from the "previous" contribution to get the vertex VJP
         return contrib_prev + contrib_next
 
+    def edges_vjp(
+        self,
+        edge_indices: np.ndarray,
+        e_mult_xyz: Dict[str, ScalarFieldDataArray],
+        d_mult_xyz: Dict[str, ScalarFieldDataArray],
+        sim_bounds: Bound,
+        wvl_mat: float,
+        eps_out: complex,
+        eps_in: complex,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Gradients w.r.t. the start and the end vertex of the edges from vertex ``i`` to vertex
+        ``i + 1`` for each ``i`` in ``edge_indices``. Same as :meth:`.edge_contrib`, but the
+        points along all edges are gathered in a single array and all field components are
+        interpolated at once, with interpolation weights computed once per set of coordinates.
+        The contributions of an edge to its two vertices only differ by the weight ``s`` of the
+        points, so the fields along each edge are interpolated only once."""
+
+        delta_eps_12 = eps_in - eps_out
+        delta_eps_inv_12 = 1.0 / eps_in - 1.0 / eps_out
+
+        vertices = np.array(jax.lax.stop_gradient(self.vertices))
+        num_vertices = len(vertices)
+        edge_indices = np.asarray(edge_indices, dtype=int)
+        num_edges = len(edge_indices)
+
+        # edges from the gradient vertex to the static vertex, for the start vertex
+        vertex_grad = vertices[edge_indices]
+        vertex_stat = vertices[(edge_indices + 1) % num_vertices]
+        edge = vertex_stat - vertex_grad
+        length_edge = np.linalg.norm(edge, axis=-1)
+        tx, ty = (edge / length_edge[:, None]).T
+
+        # normal vectors out of the polygon, the same for the start and end vertices of an edge
+        nx, ny = -ty, tx
+        normal_vector = np.stack((nx, ny), axis=-1)
+        if self.is_ccw:
+            normal_vector *= -1
+
+        # discretize along the edges, s=0 at the static vertex and s=1 at the gradient vertex
+        num_cells_edge = (length_edge * PTS_PER_WVL_INTEGRATION / wvl_mat).astype(int) + 1
+        ds = 1.0 / num_cells_edge
+        edge_index = np.repeat(np.arange(num_edges), num_cells_edge)
+        offsets = np.cumsum(num_cells_edge) - num_cells_edge
+        s_vals = (np.arange(len(edge_index)) - offsets[edge_index] + 0.5) * ds[edge_index]
+        x, y = (
+            (1 - s_vals[:, None]) * vertex_stat[edge_index]
+            + s_vals[:, None] * vertex_grad[edge_index]
+        ).T
+
+        # discretize along the axis, within the simulation bounds
+        slab_min, slab_max = self.slab_bounds
+        sim_rmin, sim_rmax = sim_bounds
+        z_max = min(slab_max, sim_rmax[self.axis])
+        z_min = max(slab_min, sim_rmin[self.axis])
+        length_axis = abs(z_max - z_min)
+        num_cells_axis = int(length_axis * PTS_PER_WVL_INTEGRATION / wvl_mat) + 1
+        dz = float(length_axis) / float(num_cells_axis)
+        z_vals = np.linspace(z_min + dz / 2, z_max - dz / 2, num_cells_axis)
+        if dz == 0.0:
+            dz = 1.0
+
+        interp_weights = {}
+
+        def get_weights(coords: np.ndarray, points: np.ndarray, dim: str) -> tuple:
+            """Interpolation weights of ``points`` along ``dim``, cached by coordinates."""
+            key = (dim, coords.tobytes())
+            if key not in interp_weights:
+                interp_weights[key] = _linear_interp_weights(coords, points)
+            return interp_weights[key]
+
+        def evaluate(scalar_field: ScalarFieldDataArray) -> np.ndarray:
+            """Trilinear interpolation of a field at the (point, z) samples, NaN outside."""
+            scalar_field = scalar_field.isel(f=0).transpose("x", "y", "z")
+            values = scalar_field.values
+            ix_lo, ix_hi, wx, inside_x = get_weights(scalar_field.x.values, x, "x")
+            iy_lo, iy_hi, wy, inside_y = get_weights(scalar_field.y.values, y, "y")
+
+            # if only 1 z coordinate, just take the first z of the data
+            if len(z_vals) == 1:
+                iz_lo = iz_hi = np.zeros(1, dtype=int)
+                wz, inside_z = np.zeros(1), np.ones(1, dtype=bool)
+            else:
+                iz_lo, iz_hi, wz, inside_z = get_weights(scalar_field.z.values, z_vals, "z")
+
+            result = 0.0
+            for ix, wx_i in ((ix_lo, 1 - wx), (ix_hi, wx)):
+                for iy, wy_i in ((iy_lo, 1 - wy), (iy_hi, wy)):
+                    w_xy = (wx_i * wy_i)[:, None]
+                    for iz, wz_i in ((iz_lo, 1 - wz), (iz_hi, wz)):
+                        corner = values[ix[:, None], iy[:, None], iz[None, :]]
+                        result = result + w_xy * wz_i[None, :] * corner
+            inside = (inside_x & inside_y)[:, None] & inside_z[None, :]
+            return np.where(inside, result, np.nan)
+
+        e_z, (e_x_edge, e_y_edge) = self.pop_axis(
+            [evaluate(fld) for fld in e_mult_xyz.values()], axis=self.axis
+        )
+        _, (d_x_edge, d_y_edge) = self.pop_axis(
+            [evaluate(fld) for fld in d_mult_xyz.values()], axis=self.axis
+        )
+
+        # fields in the (t, n, z) basis of each edge, times the sign of the basis
+        tx_pts, ty_pts = tx[edge_index, None], ty[edge_index, None]
+        nx_pts, ny_pts = nx[edge_index, None], ny[edge_index, None]
+        e_t_edge = (e_x_edge * tx_pts + e_y_edge * ty_pts) * (tx_pts + ty_pts)
+        d_n_edge = (d_x_edge * nx_pts + d_y_edge * ny_pts) * (nx_pts + ny_pts)
+
+        # multiply by the change in epsilon (in, out) terms and sum over the axis
+        integrand = delta_eps_12 * (e_t_edge + e_z) - delta_eps_inv_12 * d_n_edge
+        integrand = np.sum(np.nan_to_num(integrand, nan=0.0), axis=1)
+
+        def integrate(weights: np.ndarray) -> np.ndarray:
+            """Real part of the weighted sum of the integrand along each edge."""
+            weighted = weights * integrand
+            return np.bincount(edge_index, weights=weighted.real, minlength=num_edges)
+
+        # scale the contribution by the normalized distance from the static vertex
+        scale = length_edge * ds * dz
+        contrib_start = (scale * integrate(s_vals))[:, None] * normal_vector
+        contrib_end = (scale * integrate(1 - s_vals))[:, None] * normal_vector
+        return contrib_start, contrib_end
+
+    def vertices_vjp(
+        self,
+        e_mult_xyz: Dict[str, ScalarFieldDataArray],
+        d_mult_xyz: Dict[str, ScalarFieldDataArray],
+        sim_bounds: Bound,
+        wvl_mat: float,
+        eps_out: complex,
+        eps_in: complex,
+        vertex_indices: np.ndarray = None,
+    ) -> np.ndarray:
+        """Compute the vjp of the vertices with indices ``vertex_indices`` (all if ``None``) at
+        once, as the sum of the contributions of the edges to the next and previous vertices."""
+
+        # load the fields if shared with a worker process
+        e_mult_xyz = load_shared(e_mult_xyz)
+        d_mult_xyz = load_shared(d_mult_xyz)
+
+        num_vertices = len(self.vertices)
+        if vertex_indices is None:
+            vertex_indices = np.arange(num_vertices)
+        vertex_indices = np.asarray(vertex_indices, dtype=int)
+        edge_indices = np.unique(
+            np.concatenate((vertex_indices, (vertex_indices - 1) % num_vertices))
+        )
+        contrib_start, contrib_end = self.edges_vjp(
+            edge_indices=edge_indices,
+            e_mult_xyz=e_mult_xyz,
+            d_mult_xyz=d_mult_xyz,
+            sim_bounds=sim_bounds,
+            wvl_mat=wvl_mat,
+            eps_out=eps_out,
+            eps_in=eps_in,
+        )
+
+        # vertex i is the start of edge i and the end of edge i - 1
+        contrib_next = np.zeros((num_vertices, 2))
+        contrib_prev = np.zeros((num_vertices, 2))
+        contrib_next[edge_indices] = contrib_start
+        contrib_prev[(edge_indices + 1) % num_vertices] = contrib_end
+        return contrib_prev[vertex_indices] + contrib_next[vertex_indices]
+
     def store_vjp(
         self,
         grad_data_fwd: FieldData,
@@ -597,25 +777,6 @@ class JaxPolySlab(JaxGeometry, PolySlab, JaxObject):
             eps_in=eps_in,
         )
 
-    def _make_vertex_args(
-        self,
-        e_mult_xyz: FieldData,
-        d_mult_xyz: FieldData,
-        sim_bounds: Bound,
-        wvl_mat: float,
-        eps_out: complex,
-        eps_in: complex,
-    ) -> tuple:
-        """Generate arguments for `vertex_vjp`."""
-
-        num_verts = len(self.vertices)
-        args = [range(num_verts)]
-
-        # append all of the arguments that are the same for each call
-        constant_args = [e_mult_xyz, d_mult_xyz, sim_bounds, wvl_mat, eps_out, eps_in]
-        args += [[arg] * num_verts for arg in constant_args]
-        return args
-
     def store_vjp_sequential(
         self,
         e_mult_xyz: FieldData,
@@ -626,11 +787,10 @@ class JaxPolySlab(JaxGeometry, PolySlab, JaxObject):
         eps_in: complex,
     ) -> JaxPolySlab:
         """Stores the gradient of the vertices given forward and adjoint field data."""
-        # Construct arguments to pass to the parallel vertices_vjp computation
-
-        args = self._make_vertex_args(e_mult_xyz, d_mult_xyz, sim_bounds, wvl_mat, eps_out, eps_in)
-        vertices_vjp = list(map(self.vertex_vjp, *args))
-        return self.copy(update=dict(vertices=vertices_vjp))
+        vertices_vjp = self.vertices_vjp(
+            e_mult_xyz, d_mult_xyz, sim_bounds, wvl_mat, eps_out, eps_in
+        )
+        return self.copy(update=dict(vertices=vertices_vjp.tolist()))
 
     def store_vjp_parallel(
         self,
@@ -642,12 +802,19 @@ class JaxPolySlab(JaxGeometry, PolySlab, JaxObject):
         eps_in: complex,
         num_proc: int = 1,
     ) -> JaxPolySlab:
-        """Stores the gradient of the vertices given forward and adjoint field data."""
-
-        args = self._make_vertex_args(e_mult_xyz, d_mult_xyz, sim_bounds, wvl_mat, eps_out, eps_in)
-        with Pool(num_proc) as pool:
-            vertices_vjp = pool.starmap(self.vertex_vjp, zip(*args))
-        return self.copy(update=dict(vertices=vertices_vjp))
+        """Stores the gradient of the vertices given forward and adjoint field data, splitting
+        the vertices in ``num_proc`` groups. The fields are shared with the worker processes
+        through memory-mapped files."""
+
+        vertex_groups = np.array_split(np.arange(len(self.vertices)), num_proc)
+        with SharedData() as shared:
+            args = [shared.share(e_mult_xyz), shared.share(d_mult_xyz)]
+            args += [sim_bounds, wvl_mat, eps_out, eps_in]
+            with Pool(num_proc) as pool:
+                vertices_vjp = pool.starmap(
+                    self.vertices_vjp, [(*args, vertex_group) for vertex_group in vertex_groups]
+                )
+        return self.copy(update=dict(vertices=np.concatenate(vertices_vjp).tolist()))
 
 
 JaxSingleGeometryType = Union[JaxBox, JaxPolySlab]
@@ -707,9 +874,9 @@ class JaxGeometryGroup(JaxGeometry, GeometryGroup, JaxObject):
     ) -> JaxSingleGeometryType:
         """Function to store a single vjp for a single geometry."""
         return geometry.store_vjp(
-            grad_data_fwd=grad_data_fwd,
-            grad_data_adj=grad_data_adj,
-            grad_data_eps=grad_data_eps,
+            grad_data_fwd=load_shared(grad_data_fwd),
+            grad_data_adj=load_shared(grad_data_adj),
+            grad_data_eps=load_shared(grad_data_eps),
             sim_bounds=sim_bounds,
             wvl_mat=wvl_mat,
             eps_out=eps_out,
@@ -729,22 +896,28 @@ class JaxGeometryGroup(JaxGeometry, GeometryGroup, JaxObject):
     ) -> JaxGeometryGroup:
         """Returns a `JaxGeometryGroup` where the `.geometries` store the gradient info."""
 
-        map_args = (
-            self.geometries,
-            [grad_data_fwd] * len(self.geometries),
-            [grad_data_adj] * len(self.geometries),
-            [grad_data_eps] * len(self.geometries),
-            [sim_bounds] * len(self.geometries),
-            [wvl_mat] * len(self.geometries),
-            [eps_out] * len(self.geometries),
-            [eps_in] * len(self.geometries),
-        )
+        def make_args(grad_data_fwd, grad_data_adj, grad_data_eps) -> tuple:
+            """Arguments to map over the geometries."""
+            return (
+                self.geometries,
+                [grad_data_fwd] * len(self.geometries),
+                [grad_data_adj] * len(self.geometries),
+                [grad_data_eps] * len(self.geometries),
+                [sim_bounds] * len(self.geometries),
+                [wvl_mat] * len(self.geometries),
+                [eps_out] * len(self.geometries),
+                [eps_in] * len(self.geometries),
+            )
 
         if num_proc == 1:
+            map_args = make_args(grad_data_fwd, grad_data_adj, grad_data_eps)
             geometries_vjp = tuple(map(self._store_vjp_geometry, *map_args))
         else:
-            with Pool(num_proc) as pool:
-                geometries_vjp = tuple(pool.starmap(self._store_vjp_geometry, zip(*map_args)))
+            # share the field data with the workers instead of pickling it for each geometry
+            with SharedData() as shared:
+                map_args = make_args(*shared.share((grad_data_fwd, grad_data_adj, grad_data_eps)))
+                with Pool(num_proc) as pool:
+                    geometries_vjp = tuple(pool.starmap(self._store_vjp_geometry, zip(*map_args)))
 
         return self.updated_copy(geometries=geometries_vjp)
 
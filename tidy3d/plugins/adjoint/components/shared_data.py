@@ -0,0 +1,121 @@
+"""Sharing the gradient field data with the worker processes computing the vjps in parallel."""
+from __future__ import annotations
+
+import os
+import tempfile
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+
+import numpy as np
+import xarray as xr
+
+from ....components.base import Tidy3dBaseModel
+
+# number of memory-mapped arrays kept open in each process
+MAX_OPEN_ARRAYS = 64
+
+
+@lru_cache(maxsize=MAX_OPEN_ARRAYS)
+def _open_values(path: str) -> np.memmap:
+    """Read-only memory map of the array values stored in a .npy file."""
+    return np.load(path, mmap_mode="r")
+
+
+class SharedDataArray:
+    """Lightweight handle to the values of a data array stored in a memory-mapped file. Pickling
+    the handle only pickles the file path and the coordinates, and the processes loading it share
+    the same pages of memory."""
+
+    __slots__ = ("path", "array_type", "dims", "coords")
+
+    def __init__(
+        self, path: str, array_type: type, dims: Tuple[str, ...], coords: Dict[str, np.ndarray]
+    ):
+        self.path = path
+        self.array_type = array_type
+        self.dims = dims
+        self.coords = coords
+
+    def __getstate__(self) -> tuple:
+        return self.path, self.array_type, self.dims, self.coords
+
+    def __setstate__(self, state: tuple) -> None:
+        self.path, self.array_type, self.dims, self.coords = state
+
+    def load(self) -> xr.DataArray:
+        """The data array, with values read from the memory-mapped file."""
+        return self.array_type(_open_values(self.path), coords=self.coords, dims=self.dims)
+
+
+class SharedData:
+    """Context manager storing the values of data arrays in memory-mapped files, removed on exit,
+    so that worker processes receive lightweight handles instead of copies of the data.
+
+    Example
+    -------
+    >>> with SharedData() as shared: # doctest: +SKIP
+    ...     fields_shared = shared.share(fields)
+    ...     results = pool.starmap(func, [(fields_shared, i) for i in range(100)])
+    """
+
+    def __init__(self):
+        self._tmp_dir = None
+        self._num_arrays = 0
+
+    def __enter__(self) -> SharedData:
+        self._tmp_dir = tempfile.TemporaryDirectory(prefix="tidy3d_adjoint_")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        _open_values.cache_clear()
+        self._tmp_dir.cleanup()
+        self._tmp_dir = None
+        return False
+
+    def share(self, value: Any) -> Any:
+        """Replace the data arrays in ``value`` by :class:`.SharedDataArray` handles. Handles
+        dictionaries, lists and tuples of data arrays, and models with data array fields, such as
+        :class:`.FieldData`. Other values are returned as is."""
+
+        if isinstance(value, xr.DataArray):
+            path = os.path.join(self._tmp_dir.name, f"{self._num_arrays}.npy")
+            self._num_arrays += 1
+            np.save(path, value.values)
+            coords = {dim: value.coords[dim].values for dim in value.dims}
+            return SharedDataArray(
+                path=path, array_type=type(value), dims=value.dims, coords=coords
+            )
+        if isinstance(value, dict):
+            return {key: self.share(val) for key, val in value.items()}
+        if isinstance(value, (list, tuple)):
+            return type(value)(self.share(val) for val in value)
+        if isinstance(value, Tidy3dBaseModel):
+            return _replace_data_arrays(value, self.share, xr.DataArray)
+        return value
+
+
+def load_shared(value: Any) -> Any:
+    """Replace the :class:`.SharedDataArray` handles in a value made by
+    :meth:`.SharedData.share` by the data arrays. Other values are returned as is."""
+
+    if isinstance(value, SharedDataArray):
+        return value.load()
+    if isinstance(value, dict):
+        return {key: load_shared(val) for key, val in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(load_shared(val) for val in value)
+    if isinstance(value, Tidy3dBaseModel):
+        return _replace_data_arrays(value, load_shared, SharedDataArray)
+    return value
+
+
+def _replace_data_arrays(model: Tidy3dBaseModel, func, array_type: type) -> Tidy3dBaseModel:
+    """Copy of a model with ``func`` applied to its fields of ``array_type``. The copy is not
+    validated again, as the data arrays are the same, just stored differently."""
+    fields = {name: getattr(model, name) for name in model.__fields__}
+    if not any(isinstance(val, array_type) for val in fields.values()):
+        return model
+    fields = {
+        name: func(val) if isinstance(val, array_type) else val for name, val in fields.items()
+    }
+    return type(model).construct(_fields_set=model.__fields_set__, **fields)
@@ -23,6 +23,7 @@ from ....exceptions import AdjointError
 from .base import JaxObject
 from .structure import JaxStructure
 from .geometry import JaxPolySlab, JaxGeometryGroup
+from .shared_data import SharedData, load_shared
 
 
 # bandwidth of adjoint source in units of freq0 if no sources and no `fwidth_adjoint` specified
@@ -593,6 +594,9 @@ class JaxSimulation(Simulation, JaxObject):
     ) -> JaxStructure:
         """Store the vjp for a single structure."""
 
+        # load the field data if shared with a worker process
+        fld_fwd, fld_adj, eps_data = load_shared((fld_fwd, fld_adj, eps_data))
+
         freq = float(eps_data.eps_xx.coords["f"])
         eps_out = self.medium.eps_model(frequency=freq)
         return structure.store_vjp(
@@ -684,11 +688,14 @@ class JaxSimulation(Simulation, JaxObject):
         vjps_par_internal = list(map(self._store_vjp_structure, *args_par_internal))
 
         # Get vjps for structures where we parallelize directly here
+        # the field data is shared with the workers through memory-mapped files
         args_par_external = make_args(inds_par_external, num_proc_internal=NUM_PROC_LOCAL)
-        with Pool(num_proc) as pool:
-            vjps_par_external = list(
-                pool.starmap(self._store_vjp_structure, zip(*args_par_external))
-            )
+        with SharedData() as shared:
+            args_par_external = [shared.share(arg) for arg in args_par_external]
+            with Pool(num_proc) as pool:
+                vjps_par_external = list(
+                    pool.starmap(self._store_vjp_structure, zip(*args_par_external))
+                )
 
         # Reshuffle the two lists back in the correct order
         vjps_all = list(vjps_par_internal) + list(vjps_par_external)
@@ -6,17 +6,31 @@ import scipy.sparse as sp
 from ...constants import EPSILON_0, ETA_0
 
 
+def make_forward_1d(dls, pmc):
+    """Forward difference along one dimension divided by the grid steps, assembled directly in
+    sparse format. The near end is PEC unless ``pmc``."""
+    inv_dls = 1 / np.asarray(dls)
+    diag = -inv_dls
+    if not pmc:
+        diag[0] = 0.0
+    return sp.diags([diag, inv_dls[:-1]], [0, 1], shape=(len(dls),) * 2, format="csr")
+
+
+def make_backward_1d(dls, pmc):
+    """Backward difference along one dimension divided by the grid steps, assembled directly in
+    sparse format. The near end is PMC if ``pmc``, otherwise PEC."""
+    inv_dls = 1 / np.asarray(dls)
+    diag = inv_dls.copy()
+    diag[0] = 2 * inv_dls[0] if pmc else 0.0
+    return sp.diags([diag, -inv_dls[1:]], [0, -1], shape=(len(dls),) * 2, format="csr")
+
+
 def make_dxf(dls, shape, pmc):
     """Forward derivative in x."""
     Nx, Ny = shape
     if Nx == 1:
         return sp.csr_matrix((Ny, Ny))
-    dxf = sp.csr_matrix(sp.diags([-1, 1], [0, 1], shape=(Nx, Nx)))
-    if not pmc:
-        dxf[0, 0] = 0.0
-    dxf = sp.diags(1 / dls).dot(dxf)
-    dxf = sp.kron(dxf, sp.eye(Ny))
-    return dxf
+    return sp.kron(make_forward_1d(dls, pmc), sp.eye(Ny), format="csr")
 
 
 def make_dxb(dls, shape, pmc):
@@ -24,14 +38,7 @@ def make_dxb(dls, shape, pmc):
     Nx, Ny = shape
     if Nx == 1:
         return sp.csr_matrix((Ny, Ny))
-    dxb = sp.csr_matrix(sp.diags([1, -1], [0, -1], shape=(Nx, Nx)))
-    if pmc:
-        dxb[0, 0] = 2.0
-    else:
-        dxb[0, 0] = 0.0
-    dxb = sp.diags(1 / dls).dot(dxb)
-    dxb = sp.kron(dxb, sp.eye(Ny))
-    return dxb
+    return sp.kron(make_backward_1d(dls, pmc), sp.eye(Ny), format="csr")
 
 
 def make_dyf(dls, shape, pmc):
@@ -39,12 +46,7 @@ def make_dyf(dls, shape, pmc):
     Nx, Ny = shape
     if Ny == 1:
         return sp.csr_matrix((Nx, Nx))
-    dyf = sp.csr_matrix(sp.diags([-1, 1], [0, 1], shape=(Ny, Ny)))
-    if not pmc:
-        dyf[0, 0] = 0.0
-    dyf = sp.diags(1 / dls).dot(dyf)
-    dyf = sp.kron(sp.eye(Nx), dyf)
-    return dyf
+    return sp.kron(sp.eye(Nx), make_forward_1d(dls, pmc), format="csr")
 
 
 def make_dyb(dls, shape, pmc):
@@ -52,14 +54,7 @@ def make_dyb(dls, shape, pmc):
     Nx, Ny = shape
     if Ny == 1:
         return sp.csr_matrix((Nx, Nx))
-    dyb = sp.csr_matrix(sp.diags([1, -1], [0, -1], shape=(Ny, Ny)))
-    if pmc:
-        dyb[0, 0] = 2.0
-    else:
-        dyb[0, 0] = 0.0
-    dyb = sp.diags(1 / dls).dot(dyb)
-    dyb = sp.kron(sp.eye(Nx), dyb)
-    return dyb
+    return sp.kron(sp.eye(Nx), make_backward_1d(dls, pmc), format="csr")
 
 
 def create_d_matrices(shape, dlf, dlb, dmin_pmc=(False, False)):
@@ -91,31 +86,12 @@ def create_s_matrices(omega, shape, npml, dlf, dlb, dmin_pml=(True, True)):
     s_vector_y_f = create_sfactor("f", omega, dlf[1], Ny, ny_pml, dmin_pml[1])
     s_vector_y_b = create_sfactor("b", omega, dlb[1], Ny, ny_pml, dmin_pml[1])
 
-    # Fill the 2d space with layers of appropriate s-factors
-    sx_f_2d = np.zeros(shape, dtype=np.complex128)
-    sx_b_2d = np.zeros(shape, dtype=np.complex128)
-    sy_f_2d = np.zeros(shape, dtype=np.complex128)
-    sy_b_2d = np.zeros(shape, dtype=np.complex128)
-
-    # Insert the cross sections into the S-grids (could be done more elegantly)
-    for i in range(Ny):
-        sx_f_2d[:, i] = 1 / s_vector_x_f
-        sx_b_2d[:, i] = 1 / s_vector_x_b
-    for i in range(Nx):
-        sy_f_2d[i, :] = 1 / s_vector_y_f
-        sy_b_2d[i, :] = 1 / s_vector_y_b
-
-    # Reshape the 2d s-factors into a 1D s-vecay
-    sx_f_vec = sx_f_2d.flatten()
-    sx_b_vec = sx_b_2d.flatten()
-    sy_f_vec = sy_f_2d.flatten()
-    sy_b_vec = sy_b_2d.flatten()
-
-    # Construct the 1D total s-vector into a diagonal matrix
-    sx_f = sp.spdiags(sx_f_vec, 0, N, N)
-    sx_b = sp.spdiags(sx_b_vec, 0, N, N)
-    sy_f = sp.spdiags(sy_f_vec, 0, N, N)
-    sy_b = sp.spdiags(sy_b_vec, 0, N, N)
+    # Fill the 2d space with layers of appropriate s-factors, flattened in row-major order, and
+    # construct the diagonal matrices
+    sx_f = sp.spdiags(np.repeat(1 / s_vector_x_f, Ny), 0, N, N)
+    sx_b = sp.spdiags(np.repeat(1 / s_vector_x_b, Ny), 0, N, N)
+    sy_f = sp.spdiags(np.tile(1 / s_vector_y_f, Nx), 0, N, N)
+    sy_b = sp.spdiags(np.tile(1 / s_vector_y_b, Nx), 0, N, N)
 
     return sx_f, sx_b, sy_f, sy_b
 
@@ -140,11 +116,12 @@ def create_sfactor_f(omega, dls, N, n_pml, dmin_pml):
     """S-factor profile applied after forward derivative matrix, i.e. applied to H-field
     locations."""
     sfactor_array = np.ones(N, dtype=np.complex128)
-    for i in range(N):
-        if i <= n_pml - 1 and dmin_pml:
-            sfactor_array[i] = s_value(dls[0], (n_pml - i - 0.5) / n_pml, omega)
-        elif i >= N - n_pml:
-            sfactor_array[i] = s_value(dls[-1], (i - (N - n_pml) + 0.5) / n_pml, omega)
+    inds = np.arange(N)
+    top = inds >= N - n_pml
+    sfactor_array[top] = s_value(dls[-1], (inds[top] - (N - n_pml) + 0.5) / n_pml, omega)
+    if dmin_pml:
+        bottom = inds <= n_pml - 1
+        sfactor_array[bottom] = s_value(dls[0], (n_pml - inds[bottom] - 0.5) / n_pml, omega)
     return sfactor_array
 
 
@@ -152,11 +129,12 @@ def create_sfactor_b(omega, dls, N, n_pml, dmin_pml):
     """S-factor profile applied after backward derivative matrix, i.e. applied to E-field
     locations."""
     sfactor_array = np.ones(N, dtype=np.complex128)
-    for i in range(N):
-        if i < n_pml and dmin_pml:
-            sfactor_array[i] = s_value(dls[0], (n_pml - i) / n_pml, omega)
-        elif i > N - n_pml:
-            sfactor_array[i] = s_value(dls[-1], (i - (N - n_pml)) / n_pml, omega)
+    inds = np.arange(N)
+    top = inds > N - n_pml
+    sfactor_array[top] = s_value(dls[-1], (inds[top] - (N - n_pml)) / n_pml, omega)
+    if dmin_pml:
+        bottom = inds < n_pml
+        sfactor_array[bottom] = s_value(dls[0], (n_pml - inds[bottom]) / n_pml, omega)
     return sfactor_array
 
 
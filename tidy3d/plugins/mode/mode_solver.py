@@ -4,6 +4,9 @@ invariance along a given propagation axis.
 
 from __future__ import annotations
 from typing import List, Tuple, Dict
+from contextlib import nullcontext
+from functools import partial
+from multiprocessing import Pool
 
 import numpy as np
 import pydantic.v1 as pydantic
@@ -13,6 +16,8 @@ from ...log import log
 from ...components.base import Tidy3dBaseModel, cached_property
 from ...components.geometry.base import Box
 from ...components.simulation import Simulation
+from ...components.medium import MediumType, Medium, CustomMedium, PECMedium
+from ...components.medium import AnisotropicMedium, FullyAnisotropicMedium
 from ...components.grid.grid import Grid
 from ...components.mode import ModeSpec
 from ...components.monitor import ModeSolverMonitor, ModeMonitor
@@ -25,7 +30,7 @@ from ...components.data.sim_data import SimulationData
 from ...components.data.monitor_data import ModeSolverData
 from ...exceptions import ValidationError
 from ...constants import C_0
-from .solver import compute_modes
+from .solver import compute_modes, EigsWarmStart
 
 
 FIELD = Tuple[ArrayComplex3D, ArrayComplex3D, ArrayComplex3D]
@@ -75,6 +80,44 @@ class ModeSolver(Tidy3dBaseModel):
         "primal grid nodes). Default is ``True``.",
     )
 
+    num_proc: pydantic.PositiveInt = pydantic.Field(
+        1,
+        title="Number of processes",
+        description="Number of processes over which the frequencies are distributed when "
+        "solving for the modes locally. The results do not depend on this value, up to the "
+        "eigensolver precision, and are always ordered as ``freqs``.",
+    )
+
+    track_neff: bool = pydantic.Field(
+        False,
+        title="Track effective index",
+        description="If ``True``, ``mode_spec.target_neff`` is ``None``, and the frequencies are "
+        "solved in sequence (``num_proc=1``), the largest effective index found at each frequency "
+        "is used as the target at the next one. This can speed up dense frequency sweeps, but "
+        "may change which strongly lossy or PML modes are found.",
+    )
+
+    iterative_solve: bool = pydantic.Field(
+        False,
+        title="Iterative Solve",
+        description="If ``True``, the mode solver inverts the assembled shifted operator with "
+        "GMRES preconditioned by an incomplete LU factorization, instead of a full sparse LU "
+        "factorization. The operator is still assembled, so this is not a matrix-free solve, but "
+        "the incomplete factorization has bounded fill-in, which reduces the memory of the "
+        "factorization for large mode planes, at the cost of a longer solve.",
+    )
+
+    mixed_precision: bool = pydantic.Field(
+        False,
+        title="Mixed precision",
+        description="If ``True`` and ``mode_spec.precision`` is ``'single'``, the modes are found "
+        "with the matrix for diagonalization and its factorization in single precision, and then "
+        "refined in double precision, using the single precision factorization as a "
+        "preconditioner. This gives the accuracy of the double precision solver, while storing the "
+        "factorization in single precision. Otherwise, single precision is used throughout, "
+        "including for the permittivity and the mode fields.",
+    )
+
     @pydantic.validator("plane", always=True)
     def is_plane(cls, val):
         """Raise validation error if not planar."""
@@ -283,7 +326,7 @@ class ModeSolver(Tidy3dBaseModel):
             # Colocate to new coordinates using the previously created data
             data_dict_colocated = {}
             for key, field in mode_solver_data.symmetry_expanded_copy.field_components.items():
-                data_dict_colocated[key] = field.interp(**colocate_coords)
+                data_dict_colocated[key] = field.interp(**colocate_coords).astype(field.dtype)
             # Update data
             mode_solver_monitor = self.to_mode_solver_monitor(name=MODE_MONITOR_NAME)
             grid_expanded = self.simulation.discretize_monitor(mode_solver_monitor)
@@ -291,8 +334,10 @@ class ModeSolver(Tidy3dBaseModel):
                 monitor=mode_solver_monitor, grid_expanded=grid_expanded, **data_dict_colocated
             )
 
-        # normalize modes
+        # normalize modes, keeping the precision of the fields
         scaling = np.sqrt(np.abs(mode_solver_data.flux))
+        if self._single_precision:
+            scaling = scaling.astype(np.float32)
         mode_solver_data = mode_solver_data.copy(
             update={
                 key: field / scaling for key, field in mode_solver_data.field_components.items()
@@ -390,47 +435,103 @@ class ModeSolver(Tidy3dBaseModel):
         eps_tensor = eps_tensor.reshape(flat_shape)
 
         # construct eps to feed to mode solver
+        if self._single_precision:
+            return eps_tensor.astype(np.complex64)
         return eps_tensor
 
+    @staticmethod
+    def _is_frequency_independent(medium: MediumType) -> bool:
+        """Whether the permittivity of ``medium`` is known to be the same at all frequencies.
+        Mediums which are not recognized are conservatively treated as dispersive."""
+        if isinstance(medium, PECMedium):
+            return True
+        if isinstance(medium, AnisotropicMedium):
+            components = (medium.xx, medium.yy, medium.zz)
+            return all(ModeSolver._is_frequency_independent(comp) for comp in components)
+        if isinstance(medium, CustomMedium) and medium.eps_dataset is not None:
+            return False
+        if isinstance(medium, (Medium, CustomMedium, FullyAnisotropicMedium)):
+            conductivity = medium.conductivity
+            return conductivity is None or np.all(np.array(conductivity) == 0)
+        return False
+
+    @cached_property
+    def _eps_frequency_independent(self) -> bool:
+        """Whether the permittivity in the mode plane is the same at all frequencies, in which
+        case it only needs to be computed once for all of ``freqs``."""
+        return all(self._is_frequency_independent(medium) for medium in self.simulation.mediums)
+
+    @property
+    def _solver_options(self) -> Dict[str, bool]:
+        """Options of the local mode solver passed to ``compute_modes``."""
+        return dict(iterative_solve=self.iterative_solve, mixed_precision=self.mixed_precision)
+
+    @property
+    def _single_precision(self) -> bool:
+        """Whether the permittivity and the mode fields are kept in single precision."""
+        return self.mode_spec.precision == "single" and not self.mixed_precision
+
     def _solve_all_freqs(
         self,
         coords: Tuple[ArrayFloat1D, ArrayFloat1D],
         symmetry: Tuple[Symmetry, Symmetry],
     ) -> Tuple[List[float], List[Dict[str, ArrayComplex4D]], List[EpsSpecType]]:
-        """Call the mode solver at all requested frequencies."""
+        """Call the mode solver at all requested frequencies. If ``num_proc > 1``, groups of
+        ``num_proc`` frequencies are solved in parallel by a single pool of processes, in which case
+        the permittivity is only computed for one group at a time to bound memory usage. Otherwise,
+        the frequencies are solved in sequence, with each solve warm started from the results at
+        the previous one."""
+
+        num_proc = min(self.num_proc, len(self.freqs))
+        warm_start = EigsWarmStart(track_neff=self.track_neff)
+        eps_shared = self._solver_eps(self.freqs[0]) if self._eps_frequency_independent else None
 
         fields = []
         n_complex = []
         eps_spec = []
-        for freq in self.freqs:
+        # a single pool of processes is used for all the groups of frequencies
+        with Pool(num_proc) if num_proc > 1 else nullcontext() as pool:
+            for ind_start in range(0, len(self.freqs), num_proc):
+                freqs_group = self.freqs[ind_start : ind_start + num_proc]
+                args = [
+                    (
+                        self._solver_eps(freq) if eps_shared is None else eps_shared,
+                        coords,
+                        freq,
+                        self.mode_spec,
+                        symmetry,
+                        self.direction,
+                    )
+                    for freq in freqs_group
+                ]
 
-            n_freq, fields_freq, eps_spec_freq = self._solve_single_freq(
-                freq=freq, coords=coords, symmetry=symmetry
-            )
-            fields.append(fields_freq)
-            n_complex.append(n_freq)
-            eps_spec.append(eps_spec_freq)
+                if pool is not None:
+                    solver_outputs = pool.starmap(
+                        partial(compute_modes, **self._solver_options), args
+                    )
+                else:
+                    solver_outputs = []
+                    for arg in args:
+                        solver_outputs.append(
+                            compute_modes(*arg, warm_start=warm_start, **self._solver_options)
+                        )
+                        log.debug(
+                            f"Mode solver at frequency {arg[2]:.4e} Hz: "
+                            f"{warm_start.num_iterations} eigensolver iterations, "
+                            f"factorization time {warm_start.factorization_time:.3e} s."
+                        )
+
+                for solver_fields, n_freq, eps_spec_freq in solver_outputs:
+                    fields.append(self._postprocess_solver_fields(solver_fields))
+                    n_complex.append(n_freq)
+                    eps_spec.append(eps_spec_freq)
 
         return n_complex, fields, eps_spec
 
-    def _solve_single_freq(
-        self,
-        freq: float,
-        coords: Tuple[ArrayFloat1D, ArrayFloat1D],
-        symmetry: Tuple[Symmetry, Symmetry],
-    ) -> Tuple[float, Dict[str, ArrayComplex4D], EpsSpecType]:
-        """Call the mode solver at a single frequency.
-
-        The fields are rotated from propagation coordinates back to global coordinates.
-        """
-        solver_fields, n_complex, eps_spec = compute_modes(
-            eps_cross=self._solver_eps(freq),
-            coords=coords,
-            freq=freq,
-            mode_spec=self.mode_spec,
-            symmetry=symmetry,
-            direction=self.direction,
-        )
+    def _postprocess_solver_fields(
+        self, solver_fields: ArrayComplex4D
+    ) -> Dict[str, ArrayComplex4D]:
+        """Rotate the solver fields of all modes back to global coordinates and set the gauge."""
 
         fields = {key: [] for key in ("Ex", "Ey", "Ez", "Hx", "Hy", "Hz")}
         for mode_index in range(self.mode_spec.num_modes):
@@ -445,7 +546,7 @@ class ModeSolver(Tidy3dBaseModel):
         for field_name, field in fields.items():
             fields[field_name] = np.stack(field, axis=-1)
 
-        return n_complex, fields, eps_spec
+        return fields
 
     def _rotate_field_coords(self, field: FIELD) -> FIELD:
         """Move the propagation axis=z to the proper order in the array."""
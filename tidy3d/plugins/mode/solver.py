@@ -1,5 +1,8 @@
 """Mode solver for propagating EM modes."""
-from typing import Tuple
+from typing import Callable, Tuple
+import functools
+import inspect
+import time
 
 import numpy as np
 import scipy.sparse as sp
@@ -8,8 +11,8 @@ import scipy.sparse.linalg as spl
 from ...components.types import Numpy, ModeSolverType, EpsSpecType
 from ...components.base import Tidy3dBaseModel
 from ...constants import ETA_0, C_0, fp_eps, pec_val
-from .derivatives import create_d_matrices as d_mats
-from .derivatives import create_s_matrices as s_mats
+from ...exceptions import Tidy3dError
+from .derivatives import make_forward_1d, make_backward_1d, create_sfactor
 from .transforms import radial_transform, angled_transform
 
 # Consider vec to be complex if norm(vec.imag)/norm(vec) > TOL_COMPLEX
@@ -22,6 +25,90 @@ TOL_TENSORIAL = 1e-6
 TARGET_SHIFT = 10 * fp_eps
 
 
+# Maximum number of grids whose one dimensional derivative operators are kept in the cache
+D_MATRICES_CACHE_SIZE = 4
+
+# Relative tolerance of the iterative solves of the shifted matrix with ``iterative_solve``, and
+# in the double precision refinement of the mixed precision solver
+TOL_GMRES = 1e-10
+# Maximum number of GMRES iterations between restarts, and of restarts
+GMRES_RESTART = 50
+GMRES_MAXITER = 100
+# Drop tolerance and maximum fill factor of the incomplete LU preconditioner of the iterative
+# solves, which bound its memory unlike the full LU factorization of the shifted matrix
+ILU_DROP_TOL = 1e-5
+ILU_FILL_FACTOR = 10
+# column ordering of the incomplete LU factorization; the default one leads to zero pivots for the
+# tensorial solver, and the natural one to large fill-in with the PML
+ILU_PERMC_SPEC = "MMD_AT_PLUS_A"
+# name of the relative tolerance argument of ``scipy.sparse.linalg.gmres``, renamed in scipy 1.12
+GMRES_TOL_KWARG = "rtol" if "rtol" in inspect.signature(spl.gmres).parameters else "tol"
+
+
+@functools.lru_cache(maxsize=D_MATRICES_CACHE_SIZE)
+def d_mats_1d_cached(
+    dl_f: Tuple[Tuple[float, ...], Tuple[float, ...]],
+    dl_b: Tuple[Tuple[float, ...], Tuple[float, ...]],
+    dmin_pmc: Tuple[bool, bool],
+) -> Tuple[sp.csr_matrix, ...]:
+    """Forward and backward difference operators along x, then along y, for a given grid. They do
+    not depend on frequency, so they are cached to be shared across the frequencies of a mode
+    solver sweep, and only scale with the number of grid points along each axis. The grid steps
+    are passed as tuples to be hashable. The returned matrices must not be modified in place."""
+    return (
+        make_forward_1d(dl_f[0], dmin_pmc[0]),
+        make_backward_1d(dl_b[0], dmin_pmc[0]),
+        make_forward_1d(dl_f[1], dmin_pmc[1]),
+        make_backward_1d(dl_b[1], dmin_pmc[1]),
+    )
+
+
+def pml_d_mats(
+    shape: Tuple[int, int],
+    dl_f: Tuple[Tuple[float, ...], Tuple[float, ...]],
+    dl_b: Tuple[Tuple[float, ...], Tuple[float, ...]],
+    dmin_pmc: Tuple[bool, bool],
+    omega: float,
+    num_pml: Tuple[int, int],
+    dmin_pml: Tuple[bool, bool],
+) -> Tuple[sp.csr_matrix, ...]:
+    """Derivative matrices ``(dxf, dxb, dyf, dyb)`` including the PML, normalized by the free space
+    wave number. The rows of the cached one dimensional operators are scaled by the PML s-factors,
+    which depend on frequency, before being expanded over the cross section."""
+    k0 = omega / C_0
+    der_mats = []
+    for ind, der_1d in enumerate(d_mats_1d_cached(dl_f, dl_b, dmin_pmc)):
+        axis = ind // 2
+        direction, dls = ("f", dl_f[axis]) if ind % 2 == 0 else ("b", dl_b[axis])
+        num, num_other = shape[axis], shape[1 - axis]
+        if num == 1:
+            der_mats.append(sp.csr_matrix((num_other, num_other)))
+            continue
+        s_vec = create_sfactor(direction, omega, np.array(dls), num, num_pml[axis], dmin_pml[axis])
+        der_1d = sp.diags(1 / s_vec / k0).dot(der_1d)
+        eye = sp.eye(num_other)
+        factors = (der_1d, eye) if axis == 0 else (eye, der_1d)
+        der_mats.append(sp.kron(*factors, format="csr"))
+    return tuple(der_mats)
+
+
+class EigsWarmStart:
+    """Data carried over between consecutive eigenvalue problems, e.g. in a frequency sweep.
+    The eigenvectors of the last solve are used as starting vector of the next one. If
+    ``track_neff``, the largest effective index of the last solve is also used as the target of
+    the next one, unless a target is set in the mode spec. The number of iterations and the
+    factorization time of the last solve are recorded. The factorization of the shifted matrix
+    itself is not kept, since the matrix changes with frequency.
+    """
+
+    def __init__(self, track_neff: bool = False):
+        self.track_neff = track_neff
+        self.vecs = None
+        self.neff = None
+        self.num_iterations = None
+        self.factorization_time = None
+
+
 class EigSolver(Tidy3dBaseModel):
     """Interface for computing eigenvalues given permittivity and mode spec.
     It's a collection of static methods.
@@ -36,6 +123,9 @@ class EigSolver(Tidy3dBaseModel):
         mode_spec,
         symmetry=(0, 0),
         direction="+",
+        warm_start: EigsWarmStart = None,
+        iterative_solve: bool = False,
+        mixed_precision: bool = False,
     ) -> Tuple[Numpy, Numpy, EpsSpecType]:
         """Solve for the modes of a waveguide cross section.
 
@@ -55,6 +145,22 @@ class EigSolver(Tidy3dBaseModel):
             ``ModeSpec`` object containing specifications of the mode solver.
         direction : Union["+", "-"]
             Direction of mode propagation.
+        warm_start : EigsWarmStart = None
+            If provided, the eigenvectors and effective index from the previous call with the same
+            object are used to start the eigensolver, and the object is updated with the results of
+            this call. Useful when solving at a sequence of closely spaced frequencies.
+        iterative_solve : bool = False
+            If ``True``, the inverse of the shifted matrix used by the eigensolver is applied by
+            solving with GMRES, preconditioned by an incomplete LU factorization, instead of a full
+            sparse LU factorization. The operator is still assembled as a sparse matrix, this is
+            not a matrix-free solve: only the memory of the factorization is reduced, at the cost
+            of a longer solve.
+        mixed_precision : bool = False
+            If ``True`` and ``mode_spec.precision`` is ``"single"``, the matrix for diagonalization
+            is assembled in double precision, the modes are found with the matrix and its
+            factorization in single precision, and are then refined in double precision. Otherwise,
+            the permittivity, operators and fields are all kept in the precision of
+            ``mode_spec.precision``.
 
         Returns
         -------
@@ -70,7 +176,15 @@ class EigSolver(Tidy3dBaseModel):
         angle_theta = mode_spec.angle_theta
         angle_phi = mode_spec.angle_phi
         omega = 2 * np.pi * freq
-        k0 = omega / C_0
+
+        # Data types of the permittivity and of the fields. The operators are always assembled in
+        # double precision, as rounding in single precision leaves spurious entries where terms
+        # cancel, and the matrix for diagonalization is converted to the solver precision. In mixed
+        # precision, only the factorization and the first eigensolve are in single precision.
+        mixed_precision = mixed_precision and mode_spec.precision == "single"
+        single = mode_spec.precision == "single" and not mixed_precision
+        complex_dtype = np.complex64 if single else np.complex128
+        real_dtype = np.float32 if single else np.float64
 
         if isinstance(eps_cross, Numpy):
             eps_xx, eps_xy, eps_xz, eps_yx, eps_yy, eps_yz, eps_zx, eps_zy, eps_zz = eps_cross
@@ -92,8 +206,8 @@ class EigSolver(Tidy3dBaseModel):
         be introduced by coordinate transformations. In the solver, we distinguish the case when
         these tensors are still diagonal, in which case the matrix for diagonalization has shape
         (2N, 2N), and the full tensorial case, in which case it has shape (4N, 4N)."""
-        eps_tensor = np.zeros((3, 3, N), dtype=np.complex128)
-        mu_tensor = np.zeros((3, 3, N), dtype=np.complex128)
+        eps_tensor = np.zeros((3, 3, N), dtype=complex_dtype)
+        mu_tensor = np.zeros((3, 3, N), dtype=complex_dtype)
         for row, eps_row in enumerate(
             [[eps_xx, eps_xy, eps_xz], [eps_yx, eps_yy, eps_yz], [eps_zx, eps_zy, eps_zz]]
         ):
@@ -107,11 +221,12 @@ class EigSolver(Tidy3dBaseModel):
 
         if bend_radius is not None:
             new_coords, jac_e, jac_h = radial_transform(new_coords, bend_radius, bend_axis)
+            jac_e, jac_h = jac_e.astype(real_dtype), jac_h.astype(real_dtype)
 
         if np.abs(angle_theta) > 0:
             new_coords, jac_e_tmp, jac_h_tmp = angled_transform(new_coords, angle_theta, angle_phi)
-            jac_e = np.einsum("ij...,jp...->ip...", jac_e_tmp, jac_e)
-            jac_h = np.einsum("ij...,jp...->ip...", jac_h_tmp, jac_h)
+            jac_e = np.einsum("ij...,jp...->ip...", jac_e_tmp.astype(real_dtype), jac_e)
+            jac_h = np.einsum("ij...,jp...->ip...", jac_h_tmp.astype(real_dtype), jac_h)
 
         """We also need to keep track of the transformation of the k-vector. This is
         the eigenvalue of the momentum operator assuming some sort of translational invariance and is
@@ -141,7 +256,7 @@ class EigSolver(Tidy3dBaseModel):
         always impose PEC boundary at the xmax and ymax interfaces, and on the xmin and ymin
         interfaces unless PMC symmetry is present. If so, the PMC boundary is imposed through the
         backward derivative matrices."""
-        dmin_pmc = [sym == 1 for sym in symmetry]
+        dmin_pmc = tuple(sym == 1 for sym in symmetry)
 
         # Primal grid steps for E-field derivatives
         dl_f = [new_cs[1:] - new_cs[:-1] for new_cs in new_coords]
@@ -149,18 +264,22 @@ class EigSolver(Tidy3dBaseModel):
         dl_tmp = [(dl[:-1] + dl[1:]) / 2 for dl in dl_f]
         dl_b = [np.hstack((d1[0], d2)) for d1, d2 in zip(dl_f, dl_tmp)]
 
-        # Derivative matrices with PEC boundaries by default and optional PMC at the near end
-        der_mats_tmp = d_mats((Nx, Ny), dl_f, dl_b, dmin_pmc)
-
-        # PML matrices; do not impose PML on the bottom when symmetry present
-        dmin_pml = np.array(symmetry) == 0
-        pml_mats = s_mats(omega, (Nx, Ny), mode_spec.num_pml, dl_f, dl_b, dmin_pml)
-
-        # Add the PML on top of the derivatives; normalize by k0 to match the EM-possible notation
-        der_mats = [Smat.dot(Dmat) / k0 for Smat, Dmat in zip(pml_mats, der_mats_tmp)]
+        # Derivative matrices with PEC boundaries by default and optional PMC at the near end,
+        # with the PML on top, normalized by k0 to match the EM-possible notation. The PML is not
+        # imposed on the bottom when symmetry is present. The one dimensional operators without PML
+        # do not depend on frequency and are cached, such that they are shared in frequency sweeps.
+        dl_f_key, dl_b_key = (tuple(tuple(dl.tolist()) for dl in dls) for dls in (dl_f, dl_b))
+        dmin_pml = tuple(sym == 0 for sym in symmetry)
+        der_mats = pml_d_mats(
+            (Nx, Ny), dl_f_key, dl_b_key, dmin_pmc, omega, tuple(mode_spec.num_pml), dmin_pml
+        )
 
         # Determine initial guess value for the solver in transformed coordinates
-        if mode_spec.target_neff is None:
+        if mode_spec.target_neff is None and warm_start is not None and warm_start.neff is not None:
+            # all guided modes lie below the previous largest effective index, so using it as the
+            # target selects the same guided modes while converging faster
+            target = warm_start.neff
+        elif mode_spec.target_neff is None:
             eps_physical = np.array(eps_cross)
             eps_physical = eps_physical[np.abs(eps_physical) < np.abs(pec_val)]
             n_max = np.sqrt(np.max(np.abs(eps_physical)))
@@ -184,11 +303,15 @@ class EigSolver(Tidy3dBaseModel):
             der_mats,
             num_modes,
             target_neff_p,
-            mode_spec.precision,
+            "double" if mixed_precision else mode_spec.precision,
             direction,
+            warm_start,
+            iterative_solve,
+            mixed_precision,
         )
 
         # Transform back to original axes, E = J^T E'
+        E, H = E.astype(complex_dtype, copy=False), H.astype(complex_dtype, copy=False)
         E = np.sum(jac_e[..., None] * E[:, None, ...], axis=0)
         E = E.reshape((3, Nx, Ny, 1, num_modes))
         H = np.sum(jac_h[..., None] * H[:, None, ...], axis=0)
@@ -198,6 +321,9 @@ class EigSolver(Tidy3dBaseModel):
 
         fields = np.stack((E, H), axis=0)
 
+        if warm_start is not None and warm_start.track_neff:
+            warm_start.neff = np.max(neff)
+
         return fields, neff + 1j * keff, eps_spec
 
     @classmethod
@@ -212,6 +338,9 @@ class EigSolver(Tidy3dBaseModel):
         neff_guess,
         mat_precision,
         direction,
+        warm_start=None,
+        iterative_solve=False,
+        mixed_precision=False,
     ):
         """Solve for the electromagnetic modes of a system defined by in-plane permittivity and
         permeability and assuming translational invariance in the normal direction.
@@ -236,6 +365,13 @@ class EigSolver(Tidy3dBaseModel):
             Single or double-point precision in eigensolver.
         direction : Union["+", "-"]
             Direction of mode propagation.
+        warm_start : EigsWarmStart = None
+            Data from the previous eigenvalue problem used to warm start the eigensolver.
+        iterative_solve : bool = False
+            Invert the shifted matrix iteratively instead of factorizing it.
+        mixed_precision : bool = False
+            Find the modes of the matrix, assembled in double precision, in single precision first,
+            and refine them in double precision.
 
         Returns
         -------
@@ -254,7 +390,7 @@ class EigSolver(Tidy3dBaseModel):
         # use a high-conductivity model for locations associated with a PEC
         def conductivity_model_for_pec(eps, threshold=0.9 * pec_val):
             """PEC entries associated with 'eps' are converted to a high-conductivity model."""
-            eps = eps.astype(complex)
+            eps = eps.astype(np.result_type(eps, np.complex64))
             eps[eps <= threshold] = 1 + 1j * np.abs(pec_val)
             return eps
 
@@ -278,6 +414,9 @@ class EigSolver(Tidy3dBaseModel):
             "neff_guess": neff_guess,
             "vec_init": vec_init,
             "mat_precision": mat_precision,
+            "warm_start": warm_start,
+            "iterative_solve": iterative_solve,
+            "mixed_precision": mixed_precision,
         }
 
         is_eps_complex = cls.isinstance_complex(eps_tensor)
@@ -341,7 +480,19 @@ class EigSolver(Tidy3dBaseModel):
         mat.eliminate_zeros()
 
     @classmethod
-    def solver_diagonal(cls, eps, mu, der_mats, num_modes, neff_guess, vec_init, mat_precision):
+    def solver_diagonal(
+        cls,
+        eps,
+        mu,
+        der_mats,
+        num_modes,
+        neff_guess,
+        vec_init,
+        mat_precision,
+        warm_start=None,
+        iterative_solve=False,
+        mixed_precision=False,
+    ):
         """EM eigenmode solver assuming ``eps`` and ``mu`` are diagonal everywhere."""
 
         # code associated with these options is included below in case it's useful in the future
@@ -439,6 +590,9 @@ class EigSolver(Tidy3dBaseModel):
             guess_value=eig_guess,
             mode_solver_type=mode_solver_type,
             M=precon,
+            warm_start=warm_start,
+            iterative_solve=iterative_solve,
+            mixed_precision=mixed_precision,
         )
 
         if enable_preconditioner:
@@ -477,7 +631,18 @@ class EigSolver(Tidy3dBaseModel):
 
     @classmethod
     def solver_tensorial(
-        cls, eps, mu, der_mats, num_modes, neff_guess, vec_init, mat_precision, direction
+        cls,
+        eps,
+        mu,
+        der_mats,
+        num_modes,
+        neff_guess,
+        vec_init,
+        mat_precision,
+        direction,
+        warm_start=None,
+        iterative_solve=False,
+        mixed_precision=False,
     ):
         """EM eigenmode solver assuming ``eps`` or ``mu`` have off-diagonal elements."""
 
@@ -575,6 +740,9 @@ class EigSolver(Tidy3dBaseModel):
             vec_init,
             guess_value=eig_guess,
             mode_solver_type=mode_solver_type,
+            warm_start=warm_start,
+            iterative_solve=iterative_solve,
+            mixed_precision=mixed_precision,
         )
         neff, keff = cls.eigs_to_effective_index(vals, mode_solver_type)
         # Sort by descending real part
@@ -606,7 +774,18 @@ class EigSolver(Tidy3dBaseModel):
         return E, H, neff, keff
 
     @classmethod
-    def solver_eigs(cls, mat, num_modes, vec_init, guess_value=1.0, M=None, **kwargs):
+    def solver_eigs(
+        cls,
+        mat,
+        num_modes,
+        vec_init,
+        guess_value=1.0,
+        M=None,
+        warm_start=None,
+        iterative_solve=False,
+        mixed_precision=False,
+        **kwargs,
+    ):
         """Find ``num_modes`` eigenmodes of ``mat`` cloest to ``guess_value``.
 
         Parameters
@@ -616,13 +795,138 @@ class EigSolver(Tidy3dBaseModel):
         num_modes : int
             Number of eigenmodes to compute.
         guess_value : float, optional
+        warm_start : EigsWarmStart = None
+            If provided, the previous eigenvectors are used as starting vector, and the object is
+            updated with the results and statistics of this solve.
+        iterative_solve : bool = False
+            If ``True``, the shifted matrix is assembled but inverted iteratively by a
+            ``LinearOperator`` instead of being factorized, see ``iterative_inverse``.
+        mixed_precision : bool = False
+            If ``True``, the eigenmodes are found with ``mat`` and ``M`` converted to single
+            precision, and then refined in double precision, see ``refine_eigs``.
         """
 
+        size = mat.shape[0]
+        sigma = guess_value
+
+        # Matrices used by the eigensolver and for the factorization of the shifted matrix
+        mat_solve, mat_m_solve = mat, M
+        if mixed_precision:
+            dtype = np.complex64 if np.iscomplexobj(mat.data) else np.float32
+            mat_solve = cls.type_conversion(mat, dtype)
+            cls.trim_small_values(mat_solve, tol=fp_eps)
+            mat_m_solve = None if M is None else cls.type_conversion(M, dtype)
+            sigma = cls.type_conversion(np.array([sigma]), dtype)[0]
+
+        if warm_start is not None and warm_start.vecs is not None:
+            if warm_start.vecs.shape[0] == size:
+                # a combination of the previous modes is close to the span of the new ones
+                vec_init = np.sum(warm_start.vecs, axis=1)
+        vec_init = cls.type_conversion(vec_init, mat_solve.dtype.type)
+
+        # Factorization of the shifted matrix used in shift-invert mode
+        start_time = time.perf_counter()
+        mat_m = sp.identity(size, dtype=mat_solve.dtype) if M is None else mat_m_solve
+        if iterative_solve:
+            solve = cls.iterative_inverse(mat_solve - sigma * mat_m)
+        else:
+            solve = spl.splu(sp.csc_matrix(mat_solve - sigma * mat_m)).solve
+        factorization_time = time.perf_counter() - start_time
+
+        num_iterations = 0
+
+        def opinv_matvec(vec):
+            """Apply the inverse of the shifted matrix, counting the eigensolver iterations."""
+            nonlocal num_iterations
+            num_iterations += 1
+            return solve(vec)
+
+        opinv = spl.LinearOperator(mat.shape, matvec=opinv_matvec, dtype=mat_solve.dtype)
+
         values, vectors = spl.eigs(
-            mat, k=num_modes, sigma=guess_value, tol=TOL_EIGS, v0=vec_init, M=M
+            mat_solve,
+            k=num_modes,
+            sigma=sigma,
+            tol=TOL_EIGS,
+            v0=vec_init,
+            M=mat_m_solve,
+            OPinv=opinv,
         )
+
+        if mixed_precision:
+            values, vectors = cls.refine_eigs(
+                mat, num_modes, sigma, vectors, lambda vec: solve(vec.astype(dtype)), M=M
+            )
+
+        if warm_start is not None:
+            warm_start.vecs = vectors
+            warm_start.num_iterations = num_iterations
+            warm_start.factorization_time = factorization_time
+
         return values, vectors
 
+    @classmethod
+    def refine_eigs(
+        cls,
+        mat: sp.spmatrix,
+        num_modes: int,
+        sigma: complex,
+        vectors: Numpy,
+        solve: Callable[[Numpy], Numpy],
+        M: sp.spmatrix = None,
+    ) -> Tuple[Numpy, Numpy]:
+        """Refine the ``num_modes`` eigenmodes of ``mat`` closest to ``sigma``, found in lower
+        precision. The eigensolver is run again in the precision of ``mat``, starting from a
+        combination of the approximate eigenvectors ``vectors``, with the shifted matrix inverted by
+        GMRES preconditioned by ``solve``, the approximate inverse of the shifted matrix in lower
+        precision. This converges in few iterations to the modes in the precision of ``mat``, while
+        only the lower precision factorization is stored."""
+
+        mat_m = sp.identity(mat.shape[0], dtype=mat.dtype) if M is None else M
+        precon = spl.LinearOperator(mat.shape, matvec=solve, dtype=mat.dtype)
+        shifted_inverse = cls.iterative_inverse(mat - sigma * mat_m, precon=precon)
+        opinv = spl.LinearOperator(mat.shape, matvec=shifted_inverse, dtype=mat.dtype)
+        vec_init = cls.type_conversion(np.sum(vectors, axis=1), mat.dtype.type)
+        return spl.eigs(mat, k=num_modes, sigma=sigma, tol=TOL_EIGS, v0=vec_init, M=M, OPinv=opinv)
+
+    @classmethod
+    def iterative_inverse(
+        cls, mat: sp.spmatrix, precon: spl.LinearOperator = None
+    ) -> Callable[[Numpy], Numpy]:
+        """Function applying the inverse of a sparse matrix with GMRES, preconditioned by
+        ``precon`` or, by default, by an incomplete LU factorization whose fill-in, and thus
+        memory, is bounded, unlike that of the full LU factorization. The solve is done in double
+        precision, in which GMRES reaches its tolerance, and the solutions are cast back to the
+        data type of the matrix."""
+
+        dtype = mat.dtype
+        mat = sp.csc_matrix(mat, dtype=np.promote_types(dtype, np.float64))
+        if precon is None:
+            ilu = spl.spilu(
+                mat, drop_tol=ILU_DROP_TOL, fill_factor=ILU_FILL_FACTOR, permc_spec=ILU_PERMC_SPEC
+            )
+            precon = spl.LinearOperator(mat.shape, matvec=ilu.solve, dtype=mat.dtype)
+
+        def solve(vec):
+            """Solution of the linear system with right hand side ``vec``."""
+            sol, info = spl.gmres(
+                mat,
+                vec.astype(mat.dtype),
+                M=precon,
+                restart=GMRES_RESTART,
+                maxiter=GMRES_MAXITER,
+                atol=0.0,
+                **{GMRES_TOL_KWARG: TOL_GMRES},
+            )
+            if info != 0:
+                raise Tidy3dError(
+                    "Iterative solve of the shifted matrix did not converge in the mode solver. "
+                    "Consider solving without 'iterative_solve' and 'mixed_precision'."
+                )
+            return sol.astype(dtype)
+
+        return solve
+
     @classmethod
     def isinstance_complex(cls, vec_or_mat, tol=TOL_COMPLEX):
         """Check if a numpy array or scipy csr_matrix has complex component by looking at
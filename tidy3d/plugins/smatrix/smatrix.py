@@ -358,19 +358,33 @@ class ComponentModeler(Tidy3dBaseModel):
         batch.to_file(self._batch_path)
         return batch_data
 
-    def _normalization_factor(self, port_source: Port, sim_data: SimulationData) -> complex:
-        """Compute the normalization amplitude based on the measured input mode amplitude."""
-
-        port_monitor_data = sim_data[port_source.name]
-        mode_index = sim_data.simulation.sources[0].mode_index
-
-        normalize_amps = port_monitor_data.amps.sel(
-            f=np.array(self.freqs),
-            direction=port_source.direction,
-            mode_index=mode_index,
-        )
+    def _task_amps(self, sim_data: SimulationData) -> np.ndarray:
+        """Mode amplitudes measured by all the port monitors of a task, read once per monitor into
+        an array with axes ``(port_out, direction, mode_index_out, f)``, where ``direction`` is
+        ``('+', '-')`` and the modes beyond the number of modes of a port are zero."""
+
+        port_names_out, _ = self.port_names
+        max_mode_index_out, _ = self.max_mode_index
+        freqs = np.array(self.freqs)
+        task_amps = np.zeros((len(port_names_out), 2, max_mode_index_out + 1, len(freqs)), complex)
+
+        for ind_out, port_name in enumerate(port_names_out):
+            amps = sim_data[port_name].amps
+            num_modes = self.get_port_by_name(port_name=port_name).mode_spec.num_modes
+            inds = dict(
+                direction=amps.indexes["direction"].get_indexer(["+", "-"]),
+                mode_index=amps.indexes["mode_index"].get_indexer(np.arange(num_modes)),
+                f=amps.indexes["f"].get_indexer(freqs),
+            )
+            if any(np.any(ind < 0) for ind in inds.values()):
+                raise Tidy3dKeyError(
+                    f"Mode amplitudes of port '{port_name}' are missing some of the frequencies "
+                    "or mode indices of the 'ComponentModeler'."
+                )
+            amps = amps.transpose(*inds.keys()).values
+            task_amps[ind_out, :, :num_modes] = amps[np.ix_(*inds.values())]
 
-        return normalize_amps.values
+        return task_amps
 
     @cached_property
     def max_mode_index(self) -> Tuple[int, int]:
@@ -409,73 +423,80 @@ class ComponentModeler(Tidy3dBaseModel):
         num_modes_out = max_mode_index_out + 1
         num_modes_in = max_mode_index_in + 1
         port_names_out, port_names_in = self.port_names
+        freqs = np.array(self.freqs)
+
+        # positions of the ports along the 'port_out' and 'port_in' axes of the matrix
+        port_inds_out = {port_name: ind for ind, port_name in enumerate(port_names_out)}
+        port_inds_in = {port_name: ind for ind, port_name in enumerate(port_names_in)}
 
         values = np.zeros(
-            (len(port_names_out), len(port_names_in), num_modes_out, num_modes_in, len(self.freqs)),
+            (len(port_names_out), len(port_names_in), num_modes_out, num_modes_in, len(freqs)),
             dtype=complex,
         )
-        coords = dict(
-            port_out=port_names_out,
-            port_in=port_names_in,
-            mode_index_out=range(num_modes_out),
-            mode_index_in=range(num_modes_in),
-            f=np.array(self.freqs),
-        )
-        s_matrix = SMatrixDataArray(values, coords=coords)
 
-        # loop through source ports
-        for col_index in self.matrix_indices_run_sim:
+        # index of the outgoing direction of each port along the 'direction' axis of the amplitudes
+        ports_out = [self.get_port_by_name(port_name=port_name) for port_name in port_names_out]
+        dir_inds_out = np.array([int(port.direction == "+") for port in ports_out])
 
-            port_name_in, mode_index_in = col_index
-            port_in = self.get_port_by_name(port_name=port_name_in)
+        # loop through source ports, reading the mode amplitudes of each task once
+        for port_name_in, mode_index_in in self.matrix_indices_run_sim:
 
+            port_in = self.get_port_by_name(port_name=port_name_in)
             sim_data = batch_data[self._task_name(port=port_in, mode_index=mode_index_in)]
+            task_amps = self._task_amps(sim_data)
 
-            for row_index in self.matrix_indices_monitor:
-
-                port_name_out, mode_index_out = row_index
-                port_out = self.get_port_by_name(port_name=port_name_out)
+            # normalize by the amplitude of the input mode, measured at the source port
+            dir_ind_in = int(port_in.direction == "-")
+            source_norm = task_amps[port_inds_out[port_name_in], dir_ind_in, mode_index_in]
 
-                # directly compute the element
-                mode_amps_data = sim_data[port_out.name].copy().amps
-                dir_out = "-" if port_out.direction == "+" else "+"
-                amp = mode_amps_data.sel(
-                    f=coords["f"], direction=dir_out, mode_index=mode_index_out
-                )
-                source_norm = self._normalization_factor(port_in, sim_data)
-                s_matrix_elements = np.array(amp.data) / np.array(source_norm)
-                s_matrix.loc[
-                    dict(
-                        port_in=port_name_in,
-                        mode_index_in=mode_index_in,
-                        port_out=port_name_out,
-                        mode_index_out=mode_index_out,
-                    )
-                ] = s_matrix_elements
+            amps_out = task_amps[np.arange(len(port_names_out)), dir_inds_out]
+            values[:, port_inds_in[port_name_in], :, mode_index_in] = amps_out / source_norm
 
         # element can be determined by user-defined mapping
-        for ((row_in, col_in), (row_out, col_out), mult_by) in self.element_mappings:
-
-            port_out_from, mode_index_out_from = row_in
-            port_in_from, mode_index_in_from = col_in
-            coords_from = dict(
-                port_in=port_in_from,
-                mode_index_in=mode_index_in_from,
-                port_out=port_out_from,
-                mode_index_out=mode_index_out_from,
-            )
-
-            port_out_to, mode_index_out_to = row_out
-            port_in_to, mode_index_in_to = col_out
-            coords_to = dict(
-                port_in=port_in_to,
-                mode_index_in=mode_index_in_to,
-                port_out=port_out_to,
-                mode_index_out=mode_index_out_to,
-            )
-            s_matrix.loc[coords_to] = mult_by * s_matrix.loc[coords_from].values
+        if len(self.element_mappings) > 0:
+            self._apply_element_mappings(values, port_inds_out, port_inds_in)
 
-        return s_matrix
+        coords = dict(
+            port_out=port_names_out,
+            port_in=port_names_in,
+            mode_index_out=range(num_modes_out),
+            mode_index_in=range(num_modes_in),
+            f=freqs,
+        )
+        return SMatrixDataArray(values, coords=coords)
+
+    def _apply_element_mappings(
+        self, values: np.ndarray, port_inds_out: Dict[str, int], port_inds_in: Dict[str, int]
+    ) -> None:
+        """Set the elements of the scattering matrix ``values``, with axes
+        ``(port_out, port_in, mode_index_out, mode_index_in, f)``, from ``element_mappings`` in
+        place. The mappings are applied in order, as index maps gathered into groups within which
+        no mapping reads an element set by a previous mapping of the same group."""
+
+        def element_index(element: Element) -> Tuple[int, int, int, int]:
+            """Index of an element along the first four axes of ``values``."""
+            (port_out, mode_index_out), (port_in, mode_index_in) = element
+            return port_inds_out[port_out], port_inds_in[port_in], mode_index_out, mode_index_in
+
+        def apply(group: List[Tuple[Tuple[int, ...], Tuple[int, ...], complex]]) -> None:
+            """Set all the elements of a group of mappings at once."""
+            inds_from, inds_to, mult_by = zip(*group)
+            inds_from = tuple(np.array(inds_from).T)
+            inds_to = tuple(np.array(inds_to).T)
+            values[inds_to] = np.array(mult_by)[:, None] * values[inds_from]
+
+        group = []
+        elements_set = set()
+        for element_from, element_to, mult_by in self.element_mappings:
+            ind_from = element_index(element_from)
+            ind_to = element_index(element_to)
+            if ind_from in elements_set:
+                apply(group)
+                group = []
+                elements_set = set()
+            group.append((ind_from, ind_to, mult_by))
+            elements_set.add(ind_to)
+        apply(group)
 
     def run(self, path_dir: str = DEFAULT_DATA_DIR) -> SMatrixDataArray:
         """Solves for the scattering matrix of the system."""
@@ -1,4 +1,165 @@
 """Local caches."""
+import os
+import hashlib
+import shutil
+from typing import List, Tuple
+
+from ..version import __version__
+from .cli.constants import TIDY3D_DIR
 
 FOLDER_CACHE = {}
 S3_STS_TOKENS = {}
+
+# directory of the on-disk cache of simulation results
+RESULT_CACHE_DIR = os.getenv("TIDY3D_CACHE_DIR", os.path.join(TIDY3D_DIR, "cache"))
+
+# maximum total size (bytes) of the cached results, least recently used results are evicted first
+RESULT_CACHE_MAX_SIZE = int(float(os.getenv("TIDY3D_CACHE_MAX_SIZE_GB", "10")) * 2**30)
+
+# extension of the cached result files
+RESULT_CACHE_EXT = ".hdf5"
+
+
+def result_cache_key(simulation, solver_version: str = None) -> str:
+    """Key of the results of ``simulation`` in the result cache. It is a hash of the simulation
+    json and of the solver version, so identical simulations map to the same entry.
+
+    Parameters
+    ----------
+    simulation : :class:`.Simulation`
+        Simulation whose results are cached.
+    solver_version : str = None
+        Solver version the simulation is run with, ``None`` for the default one.
+
+    Returns
+    -------
+    str
+        Hexadecimal hash of the simulation and the solver version.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(simulation._json_string.encode())
+    hasher.update(f"solver_version={solver_version};version={__version__}".encode())
+    return hasher.hexdigest()
+
+
+def _result_cache_path(key: str) -> str:
+    """Path to the cached results file with a given key."""
+    return os.path.join(RESULT_CACHE_DIR, key + RESULT_CACHE_EXT)
+
+
+def is_result_cached(key: str) -> bool:
+    """Whether the results with a given key are in the cache.
+
+    Parameters
+    ----------
+    key : str
+        Cache key, as returned by :meth:`result_cache_key`.
+
+    Returns
+    -------
+    bool
+        Whether the results are in the cache.
+    """
+    return os.path.exists(_result_cache_path(key))
+
+
+def fetch_cached_result(key: str, path: str) -> bool:
+    """Copy the cached results with a given key to ``path``, if present in the cache.
+
+    Parameters
+    ----------
+    key : str
+        Cache key, as returned by :meth:`result_cache_key`.
+    path : str
+        Path to copy the results file (.hdf5) to, including filename.
+
+    Returns
+    -------
+    bool
+        Whether the results were found in the cache.
+    """
+    cache_path = _result_cache_path(key)
+    try:
+        # mark as most recently used
+        os.utime(cache_path)
+        if os.path.abspath(path) != os.path.abspath(cache_path):
+            shutil.copyfile(cache_path, path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def store_result(key: str, path: str) -> None:
+    """Copy the results file at ``path`` into the cache and evict the least recently used results
+    if the cache exceeds its maximum size.
+
+    Parameters
+    ----------
+    key : str
+        Cache key, as returned by :meth:`result_cache_key`.
+    path : str
+        Path to the results file (.hdf5) to store.
+    """
+    os.makedirs(RESULT_CACHE_DIR, exist_ok=True)
+    cache_path = _result_cache_path(key)
+    # copy to a temporary file first so that a partially written entry is never visible
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    shutil.copyfile(path, tmp_path)
+    os.replace(tmp_path, cache_path)
+    prune_result_cache()
+
+
+def result_cache_entries() -> List[Tuple[str, int, float]]:
+    """Entries of the result cache, most recently used first.
+
+    Returns
+    -------
+    List[Tuple[str, int, float]]
+        Key, size in bytes, and last use time (seconds since the epoch) of each entry.
+    """
+    if not os.path.isdir(RESULT_CACHE_DIR):
+        return []
+
+    entries = []
+    for file_name in os.listdir(RESULT_CACHE_DIR):
+        if not file_name.endswith(RESULT_CACHE_EXT):
+            continue
+        try:
+            stat = os.stat(os.path.join(RESULT_CACHE_DIR, file_name))
+        except FileNotFoundError:
+            continue
+        entries.append((file_name[: -len(RESULT_CACHE_EXT)], stat.st_size, stat.st_mtime))
+    return sorted(entries, key=lambda entry: entry[2], reverse=True)
+
+
+def prune_result_cache(max_size: int = None) -> List[str]:
+    """Evict the least recently used results until the cache size is at most ``max_size``.
+
+    Parameters
+    ----------
+    max_size : int = None
+        Maximum total size in bytes of the cached results. If ``None``, uses
+        ``RESULT_CACHE_MAX_SIZE``. ``0`` clears the cache.
+
+    Returns
+    -------
+    List[str]
+        Keys of the evicted results.
+    """
+    if max_size is None:
+        max_size = RESULT_CACHE_MAX_SIZE
+
+    entries = result_cache_entries()
+    total_size = sum(size for _, size, _ in entries)
+
+    evicted = []
+    for key, size, _ in reversed(entries):
+        if total_size <= max_size:
+            break
+        try:
+            os.remove(_result_cache_path(key))
+        except FileNotFoundError:
+            pass
+        total_size -= size
+        evicted.append(key)
+    return evicted
@@ -4,6 +4,7 @@ Commandline interface for tidy3d.
 import json
 import os.path
 import ssl
+from datetime import datetime
 
 import click
 import requests
@@ -13,6 +14,7 @@ from tidy3d.web.cli.constants import TIDY3D_DIR, CONFIG_FILE, CREDENTIAL_FILE
 from tidy3d.web.cli.migrate import migrate
 from tidy3d.web.environment import Env
 from tidy3d.web.cli.converter import converter_arg
+from tidy3d.web import cache as result_cache
 
 if not os.path.exists(TIDY3D_DIR):
     os.mkdir(TIDY3D_DIR)
@@ -123,6 +125,47 @@ def convert(lsf_file, new_file):
     converter_arg(lsf_file, new_file)
 
 
+@click.group()
+def cache():
+    """Inspect and prune the local cache of simulation results."""
+
+
+@cache.command()
+def info():
+    """Click command to list the cached simulation results, most recently used first."""
+    entries = result_cache.result_cache_entries()
+    total_size = sum(size for _, size, _ in entries)
+    click.echo(f"Cache directory: {result_cache.RESULT_CACHE_DIR}")
+    click.echo(
+        f"{len(entries)} cached results, {total_size / 2**30:.3f} GB "
+        f"(max {result_cache.RESULT_CACHE_MAX_SIZE / 2**30:.3f} GB)."
+    )
+    for key, size, last_used in entries:
+        last_used_str = datetime.fromtimestamp(last_used).strftime("%Y-%m-%d %H:%M:%S")
+        click.echo(f"{key}  {size / 2**20:10.2f} MB  {last_used_str}")
+
+
+@cache.command()
+@click.option(
+    "--max-size",
+    type=float,
+    default=None,
+    help="Maximum cache size in GB, defaults to the configured maximum. Use 0 to clear the cache.",
+)
+def prune(max_size):
+    """Click command to evict the least recently used results down to a maximum cache size.
+
+    Parameters
+    ----------
+    max_size : float
+        Maximum cache size in GB.
+    """
+    max_size_bytes = None if max_size is None else int(max_size * 2**30)
+    evicted = result_cache.prune_result_cache(max_size=max_size_bytes)
+    click.echo(f"Removed {len(evicted)} cached results.")
+
+
 tidy3d_cli.add_command(configure)
 tidy3d_cli.add_command(migration)
 tidy3d_cli.add_command(convert)
+tidy3d_cli.add_command(cache)
@@ -2,14 +2,20 @@
 from __future__ import annotations
 
 import os
+import threading
 from abc import ABC
-from typing import Dict, Tuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from typing import Dict, Tuple, Callable, Any, Optional
 import time
 
 from rich.progress import Progress
 import pydantic.v1 as pd
 
 from . import webapi as web
+from .cache import result_cache_key, is_result_cached, fetch_cached_result, store_result
+from .s3utils import get_aggregate_progress, _S3Action
 from .task import TaskId, TaskInfo, RunInfo, TaskName
 from ..components.simulation import Simulation
 from ..components.base import Tidy3dBaseModel
@@ -17,11 +23,60 @@ from ..components.data.sim_data import SimulationData
 from ..log import log, get_logging_console
 
 from ..exceptions import DataError
+from ..constants import fp_eps
 
 
 DEFAULT_DATA_PATH = "simulation_data.hdf5"
 DEFAULT_DATA_DIR = "."
 
+# batches with at least this many tasks fetch the status of all tasks in a folder at once
+BATCH_STATUS_MIN_TASKS = 10
+
+# default number of threads transferring the files of the tasks in a batch concurrently
+DEFAULT_NUM_TRANSFER_WORKERS = 4
+
+
+def _transfer_concurrently(
+    transfer_fn: Callable[..., Any],
+    transfer_kwargs: Dict[TaskName, Dict],
+    num_workers: int,
+    description: str,
+    action: _S3Action,
+    verbose: bool,
+) -> Dict[TaskName, Any]:
+    """Call ``transfer_fn(**kwargs, progress_callback=callback)`` for the ``kwargs`` of each task
+    in ``transfer_kwargs`` using ``num_workers`` threads. If ``verbose``, a single progressbar shows
+    the number of transferred tasks, the total transferred size and the aggregate throughput.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Mapping of task name to the value returned by ``transfer_fn`` for that task.
+    """
+    num_tasks = len(transfer_kwargs)
+    progress = get_aggregate_progress(action) if verbose else None
+
+    with progress or nullcontext(), ThreadPoolExecutor(max_workers=num_workers) as pool:
+        if progress is not None:
+            pbar = progress.add_task(f"{description} 0/{num_tasks} tasks", total=None)
+
+        def progress_callback(bytes_in_chunk: float) -> None:
+            """Add the bytes transferred for any task to the progressbar."""
+            if progress is not None:
+                progress.update(pbar, advance=bytes_in_chunk)
+
+        futures = {
+            pool.submit(transfer_fn, **kwargs, progress_callback=progress_callback): task_name
+            for task_name, kwargs in transfer_kwargs.items()
+        }
+        results = {}
+        for num_done, future in enumerate(as_completed(futures), start=1):
+            results[futures[future]] = future.result()
+            if progress is not None:
+                progress.update(pbar, description=f"{description} {num_done}/{num_tasks} tasks")
+
+    return {task_name: results[task_name] for task_name in transfer_kwargs}
+
 
 class WebContainer(Tidy3dBaseModel, ABC):
     """Base class for :class:`Job` and :class:`Batch`, technically not used"""
@@ -72,7 +127,16 @@ class Job(WebContainer):
     task_id: TaskId = pd.Field(
         None,
         title="Task Id",
-        description="Task ID number, set when the task is uploaded, leave as None.",
+        description="Task ID number, set when the task is uploaded, leave as None. "
+        "If ``use_cache`` and the results of the simulation are cached, no task is uploaded.",
+    )
+
+    use_cache: bool = pd.Field(
+        False,
+        title="Use Cache",
+        description="Whether :meth:`Job.run` loads the results of an identical simulation from "
+        "the local result cache instead of uploading and running the task, and stores new "
+        "results in it.",
     )
 
     _upload_fields = (
@@ -99,18 +163,47 @@ class Job(WebContainer):
             Dictionary mapping task name to :class:`.SimulationData` for :class:`Job`.
         """
 
-        self.start()
-        self.monitor()
-        return self.load(path=path)
+        cache_key = (
+            result_cache_key(self.simulation, self.solver_version) if self.use_cache else None
+        )
+        if cache_key is not None and fetch_cached_result(cache_key, path):
+            if self.verbose:
+                console = get_logging_console()
+                console.log(
+                    f"Loading cached results of an identical simulation for '{self.task_name}'."
+                )
+            return SimulationData.from_file(path)
+
+        job = self._uploaded()
+        job.start()
+        job.monitor()
+        sim_data = job.load(path=path)
+        if cache_key is not None:
+            store_result(cache_key, path)
+        return sim_data
+
+    def _uploaded(self) -> Job:
+        """This :class:`Job`, or a copy of it with a newly uploaded task if it has none, because
+        its results were cached when it was created."""
+        if self.task_id is not None:
+            return self
+        upload_kwargs = {key: getattr(self, key) for key in self._upload_fields}
+        return self.updated_copy(task_id=web.upload(**upload_kwargs))
 
     @pd.root_validator()
     def _upload(cls, values) -> None:
-        """Upload simulation to server without running."""
+        """Upload simulation to server without running, unless its results are cached."""
 
         # task_id already present, don't re-upload
         if values.get("task_id") is not None:
             return values
 
+        # results to be loaded from the cache by run, no task needed
+        simulation = values.get("simulation")
+        if values.get("use_cache") and simulation is not None:
+            if is_result_cached(result_cache_key(simulation, values.get("solver_version"))):
+                return values
+
         # upload kwargs with all fields except task_id
         upload_kwargs = {key: values.get(key) for key in cls._upload_fields}
         task_id = web.upload(**upload_kwargs)
@@ -232,30 +325,66 @@ class BatchData(Tidy3dBaseModel):
         description="Mapping of task_name to path to corresponding data for each task in batch.",
     )
 
-    task_ids: Dict[TaskName, str] = pd.Field(
-        ..., title="Task IDs", description="Mapping of task_name to task_id for each task in batch."
+    task_ids: Dict[TaskName, Optional[str]] = pd.Field(
+        ...,
+        title="Task IDs",
+        description="Mapping of task_name to task_id for each task in batch. The task_id is "
+        "``None`` for tasks whose data was loaded from the local result cache.",
     )
 
     verbose: bool = pd.Field(
         True, title="Verbose", description="Whether to print info messages and progressbars."
     )
 
+    num_load_ahead: pd.NonNegativeInt = pd.Field(
+        0,
+        title="Number of Tasks Loaded Ahead",
+        description="Number of tasks whose data is downloaded and loaded in the background "
+        "ahead of the current one when iterating through the data. Each of them holds a full "
+        ":class:`.SimulationData` in memory, so by default the data is loaded one by one.",
+    )
+
     def load_sim_data(self, task_name: str) -> SimulationData:
+        """Load a :class:`.SimulationData` from file by task name."""
+        return self._load_sim_data(task_name, verbose=self.verbose)
+
+    def _load_sim_data(self, task_name: str, verbose: bool) -> SimulationData:
         """Load a :class:`.SimulationData` from file by task name."""
         task_data_path = self.task_paths[task_name]
         task_id = self.task_ids[task_name]
+        if task_id is None:
+            return SimulationData.from_file(task_data_path)
         web.get_info(task_id)
         return web.load(
             task_id=task_id,
             path=task_data_path,
             replace_existing=False,
-            verbose=self.verbose,
+            verbose=verbose,
         )
 
     def items(self) -> Tuple[TaskName, SimulationData]:
-        """Iterate through the :class:`.SimulationData` for each task_name."""
-        for task_name in self.task_paths.keys():
-            yield task_name, self.load_sim_data(task_name)
+        """Iterate through the :class:`.SimulationData` for each task_name. The data of the next
+        ``num_load_ahead`` tasks is downloaded (if needed) and loaded in the background."""
+        task_names = list(self.task_paths.keys())
+        if self.num_load_ahead == 0:
+            for task_name in task_names:
+                yield task_name, self.load_sim_data(task_name)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.num_load_ahead) as pool:
+            loads = deque()
+            for task_name in task_names[: self.num_load_ahead + 1]:
+                loads.append(pool.submit(self._load_sim_data, task_name, verbose=False))
+            for ind, task_name in enumerate(task_names):
+                if self.verbose:
+                    console = get_logging_console()
+                    console.log(f"loading SimulationData from {self.task_paths[task_name]}")
+                sim_data = loads.popleft().result()
+                next_ind = ind + self.num_load_ahead + 1
+                if next_ind < len(task_names):
+                    next_task_name = task_names[next_ind]
+                    loads.append(pool.submit(self._load_sim_data, next_task_name, verbose=False))
+                yield task_name, sim_data
 
     def __getitem__(self, task_name: TaskName) -> SimulationData:
         """Get the :class:`.SimulationData` for a given ``task_name``."""
@@ -328,6 +457,29 @@ class Batch(WebContainer):
         description="Collection of parent task ids for each job in batch, used internally only.",
     )
 
+    num_transfer_workers: pd.PositiveInt = pd.Field(
+        DEFAULT_NUM_TRANSFER_WORKERS,
+        title="Number of Transfer Workers",
+        description="Maximum number of tasks whose files are uploaded or downloaded concurrently.",
+    )
+
+    num_load_ahead: pd.NonNegativeInt = pd.Field(
+        0,
+        title="Number of Tasks Loaded Ahead",
+        description="Number of tasks whose data is downloaded and loaded in the background "
+        "ahead of the current one when iterating through :meth:`.BatchData.items`. Each of them "
+        "holds a full :class:`.SimulationData` in memory, so by default the data is loaded one by "
+        "one.",
+    )
+
+    use_cache: bool = pd.Field(
+        False,
+        title="Use Cache",
+        description="Whether the simulations identical to previously run ones are neither "
+        "uploaded nor run, and :meth:`Batch.run` loads their results from the local result cache "
+        "instead, and stores new results in it.",
+    )
+
     jobs: Dict[TaskName, Job] = pd.Field(
         None,
         title="Simulations",
@@ -363,19 +515,58 @@ class Batch(WebContainer):
         >>> for task_name, sim_data in batch_data.items():
         ...     # do something with data.
 
+        The results of each task are downloaded in the background as soon as it completes.
         ``bach_data`` does not store all of the :class:`.SimulationData` objects in memory,
         rather it iterates over the task names
         and loads the corresponding :class:`.SimulationData` from file one by one.
         If no file exists for that task, it downloads it.
+
+        If ``use_cache``, only the tasks whose results are not in the local result cache are run,
+        and their results are stored in the cache once downloaded.
         """
         self._check_path_dir(path_dir)
-        self.start()
-        self.monitor()
-        return self.load(path_dir=path_dir)
+
+        if not self.use_cache:
+            self.start()
+            self.monitor(path_dir=path_dir)
+            return self.load(path_dir=path_dir)
+
+        cache_keys = {}
+        jobs = {}
+        jobs_to_run = {}
+        for task_name, job in self.jobs.items():
+            cache_keys[task_name] = result_cache_key(job.simulation, self.solver_version)
+            job_path = self._job_path(job, path_dir=path_dir)
+            if not fetch_cached_result(cache_keys[task_name], job_path):
+                # the results may have been evicted from the cache since the job was created
+                job = job._uploaded()
+                jobs_to_run[task_name] = job
+            jobs[task_name] = job
+        batch = self if jobs == self.jobs else self.updated_copy(jobs=jobs)
+
+        if self.verbose and len(jobs_to_run) < len(self.jobs):
+            console = get_logging_console()
+            console.log(
+                f"Loading cached results for {len(self.jobs) - len(jobs_to_run)} of the "
+                f"{len(self.jobs)} tasks in the batch."
+            )
+
+        if jobs_to_run:
+            batch_to_run = self.updated_copy(jobs=jobs_to_run)
+            batch_to_run.start()
+            batch_to_run.monitor(path_dir=path_dir)
+            for task_name, job in jobs_to_run.items():
+                job_path = self._job_path(job, path_dir=path_dir)
+                if os.path.exists(job_path):
+                    store_result(cache_keys[task_name], job_path)
+
+        return batch.load(path_dir=path_dir)
 
     @pd.validator("jobs", always=True)
     def _upload(cls, val, values) -> None:
-        """Create a series of tasks in the :class:`.Batch` and upload them to server.
+        """Create a series of tasks in the :class:`.Batch` and upload them to server. If
+        ``use_cache``, the simulations whose results are cached are not uploaded, and their jobs
+        have no task.
 
         Note
         ----
@@ -389,7 +580,10 @@ class Batch(WebContainer):
         parent_tasks = values.get("parent_tasks")
 
         verbose = bool(values.get("verbose"))
-        jobs = {}
+        use_cache = bool(values.get("use_cache"))
+        solver_version = values.get("solver_version")
+        all_job_kwargs = {}
+        all_upload_kwargs = {}
         for task_name, simulation in values.get("simulations").items():
 
             upload_kwargs = {key: values.get(key) for key in JobType._upload_fields}
@@ -398,10 +592,54 @@ class Batch(WebContainer):
             upload_kwargs["verbose"] = verbose
             if parent_tasks and task_name in parent_tasks:
                 upload_kwargs["parent_tasks"] = parent_tasks[task_name]
-            job = JobType(**upload_kwargs)
-            jobs[task_name] = job
+            all_job_kwargs[task_name] = upload_kwargs
+            if not (use_cache and is_result_cached(result_cache_key(simulation, solver_version))):
+                all_upload_kwargs[task_name] = upload_kwargs
+
+        # upload concurrently, then create the jobs with the resulting task ids
+        task_ids = {}
+        if all_upload_kwargs:
+            task_ids = _transfer_concurrently(
+                transfer_fn=web.upload,
+                transfer_kwargs=all_upload_kwargs,
+                num_workers=values.get("num_transfer_workers"),
+                description="Uploaded",
+                action=_S3Action.UPLOADING,
+                verbose=verbose,
+            )
+        jobs = {}
+        for task_name, job_kwargs in all_job_kwargs.items():
+            if task_name in task_ids:
+                jobs[task_name] = JobType(**job_kwargs, task_id=task_ids[task_name])
+            else:
+                jobs[task_name] = JobType(
+                    **job_kwargs, use_cache=True, solver_version=solver_version
+                )
         return jobs
 
+    @property
+    def _uploaded_jobs(self) -> Dict[TaskName, Job]:
+        """Jobs with a task on the server, excluding those whose results were cached when the
+        :class:`.Batch` was created."""
+        return {task_name: job for task_name, job in self.jobs.items() if job.task_id is not None}
+
+    def _job_path(self, job: Job, path_dir: str = DEFAULT_DATA_DIR) -> str:
+        """Path to the data of a :class:`Job` of the :class:`.Batch`. Jobs without a task, whose
+        results are cached, have their data named after the cache key instead of the task id."""
+        if job.task_id is None:
+            cache_key = result_cache_key(job.simulation, self.solver_version)
+            return self._job_data_path(task_id=cache_key, path_dir=path_dir)
+        return self._job_data_path(task_id=job.task_id, path_dir=path_dir)
+
+    def _fetch_cached(self, job: Job, path: str) -> None:
+        """Copy the cached results of a :class:`Job` without a task to ``path``."""
+        cache_key = result_cache_key(job.simulation, self.solver_version)
+        if not fetch_cached_result(cache_key, path):
+            raise DataError(
+                f"Results of '{job.task_name}' are no longer in the result cache and the "
+                "simulation was not uploaded. Create the 'Batch' again to upload it."
+            )
+
     def get_info(self) -> Dict[TaskName, TaskInfo]:
         """Get information about each task in the :class:`Batch`.
 
@@ -411,7 +649,7 @@ class Batch(WebContainer):
             Mapping of task name to data about task associated with each task.
         """
         info_dict = {}
-        for task_name, job in self.jobs.items():
+        for task_name, job in self._uploaded_jobs.items():
             task_info = job.get_info()
             info_dict[task_name] = task_info
         return info_dict
@@ -423,7 +661,7 @@ class Batch(WebContainer):
         ----
         To monitor the running simulations, can call :meth:`Batch.monitor`.
         """
-        for _, job in self.jobs.items():
+        for _, job in self._uploaded_jobs.items():
             job.start()
 
     def get_run_info(self) -> Dict[TaskName, RunInfo]:
@@ -435,17 +673,50 @@ class Batch(WebContainer):
             Maps task names to run info for each task in the :class:`Batch`.
         """
         run_info_dict = {}
-        for task_name, job in self.jobs.items():
+        for task_name, job in self._uploaded_jobs.items():
             run_info = job.get_run_info()
             run_info_dict[task_name] = run_info
         return run_info_dict
 
-    def monitor(self) -> None:
+    def _get_statuses(self) -> Dict[TaskName, str]:
+        """Get the status of each task in the :class:`Batch`. For large batches, the statuses of
+        all tasks in a folder are fetched with a single request. Jobs whose results are cached
+        have no task and are reported as ``"success"``."""
+
+        uploaded_jobs = self._uploaded_jobs
+        cached_statuses = {
+            task_name: "success" for task_name in self.jobs if task_name not in uploaded_jobs
+        }
+
+        if len(uploaded_jobs) < BATCH_STATUS_MIN_TASKS:
+            statuses = {task_name: job.status for task_name, job in uploaded_jobs.items()}
+            return {**cached_statuses, **statuses}
+
+        statuses = {}
+        for folder_name in {job.folder_name for job in uploaded_jobs.values()}:
+            task_ids = [
+                job.task_id for job in uploaded_jobs.values() if job.folder_name == folder_name
+            ]
+            statuses.update(web.get_statuses(task_ids, folder_name=folder_name))
+        task_statuses = {
+            task_name: statuses[job.task_id] for task_name, job in uploaded_jobs.items()
+        }
+        return {**cached_statuses, **task_statuses}
+
+    def monitor(self, path_dir: str = None) -> None:
         """Monitor progress of each of the running tasks.
 
+        Parameters
+        ----------
+        path_dir : str = None
+            If provided, the results of each task are downloaded to this directory in the
+            background as soon as the task succeeds, while the other tasks are still monitored.
+
         Note
         ----
         To loop through the data of completed simulations, can call :meth:`Batch.items`.
+        The statuses are checked every ``web.REFRESH_TIME`` seconds at first, and the interval
+        grows up to ``web.MAX_REFRESH_TIME`` while no status changes.
         """
 
         def pbar_description(task_name: str, status: str) -> str:
@@ -470,6 +741,62 @@ class Batch(WebContainer):
         ]
         end_statuses = ("success", "error", "errored", "diverged", "diverge", "deleted", "draft")
 
+        download_queue = None
+        if path_dir is not None:
+            download_queue = ThreadPoolExecutor(max_workers=self.num_transfer_workers)
+        downloads = {}
+        downloaded_bytes = [0]
+        download_lock = threading.Lock()
+        download_start_time = time.time()
+
+        def download_callback(bytes_in_chunk: float) -> None:
+            """Count the bytes downloaded for any task."""
+            with download_lock:
+                downloaded_bytes[0] += bytes_in_chunk
+
+        def download_description() -> str:
+            """Description of the download progressbar with the aggregate throughput."""
+            size_mb = downloaded_bytes[0] / 1e6
+            rate = size_mb / max(time.time() - download_start_time, fp_eps)
+            return f"downloads: {size_mb:.1f} MB at {rate:.1f} MB/s"
+
+        def queue_downloads(statuses: Dict[TaskName, str]) -> None:
+            """Hand the tasks that succeeded since the last check to the download queue."""
+            if download_queue is None:
+                return
+            for task_name, status in statuses.items():
+                if status == "success" and task_name not in downloads:
+                    task_id = self.jobs[task_name].task_id
+                    if task_id is None:
+                        continue
+                    job_path = self._job_data_path(task_id=task_id, path_dir=path_dir)
+                    downloads[task_name] = download_queue.submit(
+                        web.download,
+                        task_id=task_id,
+                        path=job_path,
+                        verbose=False,
+                        progress_callback=download_callback,
+                    )
+
+        def status_updates() -> Dict[TaskName, str]:
+            """Yield the statuses of all tasks whenever checked, until all tasks are done."""
+            refresh_time = web.REFRESH_TIME
+            statuses = self._get_statuses()
+            queue_downloads(statuses)
+            yield statuses
+            while any(status not in end_statuses for status in statuses.values()):
+                time.sleep(refresh_time)
+                new_statuses = self._get_statuses()
+                if new_statuses == statuses:
+                    refresh_time = min(
+                        refresh_time * web.REFRESH_TIME_BACKOFF, web.MAX_REFRESH_TIME
+                    )
+                else:
+                    refresh_time = web.REFRESH_TIME
+                statuses = new_statuses
+                queue_downloads(statuses)
+                yield statuses
+
         if self.verbose:
             console = get_logging_console()
             console.log("Started working on Batch.")
@@ -483,18 +810,20 @@ class Batch(WebContainer):
                 )
 
             with Progress(console=console) as progress:
-                # create progressbars
                 pbar_tasks = {}
-                for task_name, job in self.jobs.items():
-                    status = job.status
-                    description = pbar_description(task_name, status)
-                    pbar = progress.add_task(description, total=len(run_statuses) - 1)
-                    pbar_tasks[task_name] = pbar
-
-                while any(job.status not in end_statuses for job in self.jobs.values()):
-                    for task_name, job in self.jobs.items():
-                        pbar = pbar_tasks[task_name]
-                        status = job.status
+                pbar_download = None
+                for statuses in status_updates():
+                    if downloads:
+                        if pbar_download is None:
+                            pbar_download = progress.add_task("")
+                        num_downloaded = sum(future.done() for future in downloads.values())
+                        progress.update(
+                            pbar_download,
+                            description=download_description(),
+                            completed=num_downloaded,
+                            total=len(downloads),
+                        )
+                    for task_name, status in statuses.items():
                         description = pbar_description(task_name, status)
 
                         # if a problem occured, update progressbar completion to 100%
@@ -503,27 +832,41 @@ class Batch(WebContainer):
                         else:
                             completed = run_statuses.index(status)
 
-                        progress.update(pbar, description=description, completed=completed)
-                    time.sleep(web.REFRESH_TIME)
+                        # create progressbars on first check
+                        if task_name not in pbar_tasks:
+                            pbar_tasks[task_name] = progress.add_task(
+                                description, total=len(run_statuses) - 1
+                            )
+                        progress.update(
+                            pbar_tasks[task_name], description=description, completed=completed
+                        )
 
                 # set all to 100% completed (if error or diverge, will be red)
-                for task_name, job in self.jobs.items():
-                    pbar = pbar_tasks[task_name]
-                    status = job.status
-                    description = pbar_description(task_name, status)
-
+                for task_name, status in statuses.items():
                     progress.update(
-                        pbar,
-                        description=description,
+                        pbar_tasks[task_name],
+                        description=pbar_description(task_name, status),
                         completed=len(run_statuses) - 1,
                         refresh=True,
                     )
 
+                # wait for the remaining downloads
+                for num_downloaded, _ in enumerate(as_completed(downloads.values()), start=1):
+                    progress.update(
+                        pbar_download, description=download_description(), completed=num_downloaded
+                    )
+
                 console.log("Batch complete.")
 
         else:
-            while any(job.status not in end_statuses for job in self.jobs.values()):
-                time.sleep(web.REFRESH_TIME)
+            for _ in status_updates():
+                pass
+
+        if download_queue is not None:
+            download_queue.shutdown(wait=True)
+            # raise any error that occured while downloading
+            for future in downloads.values():
+                future.result()
 
     @staticmethod
     def _job_data_path(task_id: TaskId, path_dir: str = DEFAULT_DATA_DIR):
@@ -579,14 +922,27 @@ class Batch(WebContainer):
 
         self.to_file(self._batch_path(path_dir=path_dir))
 
+        statuses = self._get_statuses()
+        download_kwargs = {}
         for task_name, job in self.jobs.items():
-            job_path = self._job_data_path(task_id=job.task_id, path_dir=path_dir)
-
-            if "error" in job.status:
+            if "error" in statuses[task_name]:
                 log.warning(f"Not downloading '{task_name}' as the task errored.")
                 continue
 
-            job.download(path=job_path)
+            job_path = self._job_path(job, path_dir=path_dir)
+            if job.task_id is None:
+                self._fetch_cached(job, job_path)
+                continue
+            download_kwargs[task_name] = dict(task_id=job.task_id, path=job_path, verbose=False)
+
+        _transfer_concurrently(
+            transfer_fn=web.download,
+            transfer_kwargs=download_kwargs,
+            num_workers=self.num_transfer_workers,
+            description="Downloaded",
+            action=_S3Action.DOWNLOADING,
+            verbose=self.verbose,
+        )
 
     def load(self, path_dir: str = DEFAULT_DATA_DIR) -> BatchData:
         """Download results and load them into :class:`.BatchData` object.
@@ -610,27 +966,35 @@ class Batch(WebContainer):
         if self.jobs is None:
             raise DataError("Can't load batch results, hasn't been uploaded.")
 
+        statuses = self._get_statuses()
         task_paths = {}
         task_ids = {}
         for task_name, job in self.jobs.items():
-            if "error" in job.status:
+            if "error" in statuses[task_name]:
                 log.warning(f"Not loading '{task_name}' as the task errored.")
                 continue
 
-            task_paths[task_name] = self._job_data_path(task_id=job.task_id, path_dir=path_dir)
-            task_ids[task_name] = self.jobs[task_name].task_id
+            task_paths[task_name] = self._job_path(job, path_dir=path_dir)
+            task_ids[task_name] = job.task_id
+            if job.task_id is None and not os.path.exists(task_paths[task_name]):
+                self._fetch_cached(job, task_paths[task_name])
 
-        return BatchData(task_paths=task_paths, task_ids=task_ids, verbose=self.verbose)
+        return BatchData(
+            task_paths=task_paths,
+            task_ids=task_ids,
+            verbose=self.verbose,
+            num_load_ahead=self.num_load_ahead,
+        )
 
     def delete(self) -> None:
         """Delete server-side data associated with each task in the batch."""
-        for _, job in self.jobs.items():
+        for _, job in self._uploaded_jobs.items():
             job.delete()
 
     def real_cost(self) -> float:
         """Get the sum of billed costs for each task associated with this batch."""
         real_cost_sum = 0.0
-        for _, job in self.jobs.items():
+        for _, job in self._uploaded_jobs.items():
             cost_job = job.real_cost()
             if cost_job is not None:
                 real_cost_sum += cost_job
@@ -654,4 +1018,4 @@ class Batch(WebContainer):
         float
             Estimated total cost of the tasks in FlexCredits.
         """
-        return sum(job.estimate_cost() for _, job in self.jobs.items())
+        return sum(job.estimate_cost() for _, job in self._uploaded_jobs.items())
@@ -162,6 +162,26 @@ def _get_progress(action: _S3Action):
     )
 
 
+def get_aggregate_progress(action: _S3Action):
+    """Get the progress of an action on several files, showing the total transferred size and the
+    aggregate throughput."""
+
+    col = (
+        TextColumn(f"[bold green]{_S3Action.DOWNLOADING.value}")
+        if action == _S3Action.DOWNLOADING
+        else TextColumn(f"[bold red]{_S3Action.UPLOADING.value}")
+    )
+    return Progress(
+        col,
+        TextColumn("[bold blue]{task.description}"),
+        "•",
+        DownloadColumn(),
+        "•",
+        TransferSpeedColumn(),
+        console=get_logging_console(),
+    )
+
+
 _s3_config = TransferConfig(
     multipart_threshold=1024 * 25,
     max_concurrency=50,
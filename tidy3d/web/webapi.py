@@ -3,7 +3,7 @@
 import os
 import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Callable
+from typing import List, Dict, Callable, Iterable
 from functools import wraps
 
 from requests import HTTPError, ReadTimeout
@@ -17,6 +17,7 @@ from rich.progress import Progress
 from .environment import Env
 from .simulation_task import SimulationTask, SIM_FILE_HDF5, Folder
 from .task import TaskId, TaskInfo, ChargeType
+from .cache import result_cache_key, fetch_cached_result, store_result
 from ..components.data.sim_data import SimulationData
 from ..components.simulation import Simulation
 from ..components.types import Literal
@@ -29,6 +30,19 @@ REFRESH_TIME = 0.3
 # time between checking run status
 RUN_REFRESH_TIME = 1.0
 
+# maximum time between checking the status of tasks in a batch, reached while no status changes
+MAX_REFRESH_TIME = 10.0
+
+# factor by which the time between checking batch status grows when no status changed
+REFRESH_TIME_BACKOFF = 1.5
+
+# maximum ratio of the number of tasks in a folder to the number of tasks whose statuses are
+# checked, above which the statuses are checked task by task instead of listing the whole folder
+MAX_FOLDER_LIST_RATIO = 4
+
+# number of tasks in each folder when it was last listed to check statuses, by folder id
+_FOLDER_NUM_TASKS = {}
+
 # file names when uploading to S3
 SIM_FILE_JSON = "simulation.json"
 
@@ -84,6 +98,7 @@ def run(
     progress_callback_download: Callable[[float], None] = None,
     solver_version: str = None,
     worker_group: str = None,
+    use_cache: bool = False,
 ) -> SimulationData:
     """Submits a :class:`.Simulation` to server, starts running, monitors progress, downloads,
     and loads results as a :class:`.SimulationData` object.
@@ -111,12 +126,23 @@ def run(
         target solver version.
     worker_group: str = None
         worker group
+    use_cache : bool = False
+        If ``True``, the results of an identical simulation run with the same solver version are
+        loaded from the local result cache if present, without running a task. Otherwise, the
+        results are stored in the cache after the run.
 
     Returns
     -------
     :class:`.SimulationData`
         Object containing solver results for the supplied :class:`.Simulation`.
     """
+    cache_key = result_cache_key(simulation, solver_version) if use_cache else None
+    if cache_key is not None and fetch_cached_result(cache_key, path):
+        if verbose:
+            console = get_logging_console()
+            console.log(f"Loading cached results of an identical simulation for '{task_name}'.")
+        return SimulationData.from_file(path)
+
     task_id = upload(
         simulation=simulation,
         task_name=task_name,
@@ -131,9 +157,12 @@ def run(
         worker_group=worker_group,
     )
     monitor(task_id, verbose=verbose)
-    return load(
+    sim_data = load(
         task_id=task_id, path=path, verbose=verbose, progress_callback=progress_callback_download
     )
+    if cache_key is not None:
+        store_result(cache_key, path)
+    return sim_data
 
 
 @wait_for_connection
@@ -289,6 +318,43 @@ def get_status(task_id) -> str:
     return status
 
 
+@wait_for_connection
+def get_statuses(task_ids: Iterable[TaskId], folder_name: str = "default") -> Dict[TaskId, str]:
+    """Get the status of several tasks in the same folder, using a single request for the whole
+    folder. If the folder had more than ``MAX_FOLDER_LIST_RATIO`` times as many tasks as requested
+    when last listed, the statuses are requested task by task instead, so that the cost does not
+    grow with the history of the folder. Unlike :meth:`get_status`, the statuses are returned as
+    reported by the server.
+
+    Parameters
+    ----------
+    task_ids : Iterable[str]
+        Unique identifiers of the tasks on server.
+    folder_name : str = "default"
+        Name of the folder containing the tasks.
+
+    Returns
+    -------
+    Dict[str, str]
+        Mapping of task id to status for each task.
+    """
+    task_ids = set(task_ids)
+    folder = Folder.get(folder_name)
+    statuses = {}
+    if folder:
+        num_folder_tasks = _FOLDER_NUM_TASKS.get(folder.folder_id, 0)
+        if num_folder_tasks <= MAX_FOLDER_LIST_RATIO * len(task_ids):
+            tasks = folder.list_tasks() or []
+            _FOLDER_NUM_TASKS[folder.folder_id] = len(tasks)
+            statuses = {task.task_id: task.status for task in tasks if task.task_id in task_ids}
+
+    # tasks not listed in the folder, for example if it was just created, or in a large folder
+    for task_id in task_ids - set(statuses):
+        statuses[task_id] = get_info(task_id).status
+
+    return statuses
+
+
 def monitor(task_id: TaskId, verbose: bool = True) -> None:
 
     """Print the real time task progress until completion.